@@ -0,0 +1,40 @@
+"""add report counts
+
+Revision ID: 0c6e2a9d4b17
+Revises: f5b19d7c3e46
+Create Date: 2026-10-19 16:47:15.380261
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c6e2a9d4b17'
+down_revision: Union[str, None] = 'f5b19d7c3e46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('report_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('comments', sa.Column('report_count', sa.Integer(), server_default='0', nullable=False))
+    # 기존 신고 수 채우기 (거부된 신고 제외)
+    for table, target in (('posts', 'post_id'), ('comments', 'comment_id')):
+        op.execute(
+            f"UPDATE {table} t "
+            f"JOIN ("
+            f"  SELECT {target}, COUNT(*) AS reports "
+            f"  FROM reports WHERE {target} IS NOT NULL AND status != 'rejected' GROUP BY {target}"
+            f") r ON t.id = r.{target} "
+            f"SET t.report_count = r.reports"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('comments', 'report_count')
+    op.drop_column('posts', 'report_count')
@@ -0,0 +1,35 @@
+"""add sanction counters
+
+Revision ID: 2f7a9c3e5b81
+Revises: 8e2d4b7c1f60
+Create Date: 2026-10-19 19:26:44.918305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f7a9c3e5b81'
+down_revision: Union[str, None] = '8e2d4b7c1f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 승인 신고로 채우지 않음 (자동 제재를 켰을 때 과거 신고로 소급 제재하지 않도록 빈 카운터에서 시작)
+    op.create_table('sanction_counters',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('upheld_count', sa.Integer(), nullable=False),
+    sa.Column('window_start', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sanction_counters')
@@ -0,0 +1,50 @@
+"""reweight moderation queue priority
+
+Revision ID: 4a8f3d6b2e17
+Revises: 9b4d2e7f1c36
+Create Date: 2026-10-19 22:06:38.514720
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a8f3d6b2e17'
+down_revision: Union[str, None] = '9b4d2e7f1c36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# backend.utils.moderation_queue의 신고자 가중치와 같은 값
+REPORTER_BASE_WEIGHT = 2
+REPORTER_MIN_WEIGHT = 1
+REPORTER_MAX_WEIGHT = 5
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 대기열 점수를 신고자 처리 이력 가중치의 합으로 다시 계산 (스키마 변경 없음)
+    for target in ('post_id', 'comment_id'):
+        op.execute(
+            f"UPDATE moderation_queue q "
+            f"JOIN ("
+            f"  SELECT r.{target} AS target_id, "
+            f"         SUM(LEAST(GREATEST({REPORTER_BASE_WEIGHT} + h.upheld - h.rejected, {REPORTER_MIN_WEIGHT}), "
+            f"                   {REPORTER_MAX_WEIGHT})) AS priority "
+            f"  FROM reports r "
+            f"  JOIN ("
+            f"    SELECT reporter_id, SUM(status = 'reviewed') AS upheld, SUM(status = 'rejected') AS rejected "
+            f"    FROM reports GROUP BY reporter_id"
+            f"  ) h ON h.reporter_id = r.reporter_id "
+            f"  WHERE r.{target} IS NOT NULL AND r.status = 'pending' "
+            f"  GROUP BY r.{target}"
+            f") p ON q.{target} = p.target_id "
+            f"SET q.priority = p.priority"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("UPDATE moderation_queue SET priority = pending_count + reporter_count")
@@ -0,0 +1,57 @@
+"""add moderation queue
+
+Revision ID: 4d8f1b6a2c95
+Revises: 0c6e2a9d4b17
+Create Date: 2026-10-19 17:31:06.529847
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d8f1b6a2c95'
+down_revision: Union[str, None] = '0c6e2a9d4b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('moderation_queue',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=True),
+    sa.Column('comment_id', sa.Integer(), nullable=True),
+    sa.Column('pending_count', sa.Integer(), nullable=False),
+    sa.Column('reporter_count', sa.Integer(), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('first_reported_at', sa.DateTime(), nullable=False),
+    sa.Column('last_reported_at', sa.DateTime(), nullable=False),
+    sa.CheckConstraint('(post_id IS NULL AND comment_id IS NOT NULL) OR (post_id IS NOT NULL AND comment_id IS NULL)', name='check_queue_target'),
+    sa.ForeignKeyConstraint(['comment_id'], ['comments.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('comment_id', name='unique_queue_comment'),
+    sa.UniqueConstraint('post_id', name='unique_queue_post')
+    )
+    op.create_index(op.f('ix_moderation_queue_id'), 'moderation_queue', ['id'], unique=False)
+    op.create_index('ix_moderation_queue_priority', 'moderation_queue', ['priority', 'last_reported_at', 'id'], unique=False)
+
+    # 기존 대기 중인 신고로 대기열 채우기
+    for target in ('post_id', 'comment_id'):
+        op.execute(
+            f"INSERT INTO moderation_queue "
+            f"({target}, pending_count, reporter_count, priority, first_reported_at, last_reported_at) "
+            f"SELECT {target}, COUNT(*), COUNT(DISTINCT reporter_id), COUNT(*) + COUNT(DISTINCT reporter_id), "
+            f"       MIN(created_at), MAX(created_at) "
+            f"FROM reports WHERE {target} IS NOT NULL AND status = 'pending' GROUP BY {target}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_moderation_queue_priority', table_name='moderation_queue')
+    op.drop_index(op.f('ix_moderation_queue_id'), table_name='moderation_queue')
+    op.drop_table('moderation_queue')
@@ -0,0 +1,35 @@
+"""add comment reply_count
+
+Revision ID: 5e9b3d1c0f27
+Revises: c7d2e81f4a93
+Create Date: 2026-10-19 11:41:53.730925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9b3d1c0f27'
+down_revision: Union[str, None] = 'c7d2e81f4a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('comments', sa.Column('reply_count', sa.Integer(), server_default='0', nullable=False))
+    # 기존 답글 수 채우기
+    op.execute(
+        "UPDATE comments c "
+        "JOIN (SELECT parent_id, COUNT(*) AS cnt FROM comments WHERE parent_id IS NOT NULL GROUP BY parent_id) r "
+        "ON c.id = r.parent_id "
+        "SET c.reply_count = r.cnt"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('comments', 'reply_count')
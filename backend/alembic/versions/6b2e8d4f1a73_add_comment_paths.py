@@ -0,0 +1,93 @@
+"""add comment paths
+
+Revision ID: 6b2e8d4f1a73
+Revises: 9a1f6c4e2d58
+Create Date: 2026-10-19 13:05:41.527310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b2e8d4f1a73'
+down_revision: Union[str, None] = '9a1f6c4e2d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 한 번에 갱신할 댓글 id 범위 (긴 잠금 방지)
+CHUNK_SIZE = 5000
+
+
+def _id_chunks(bind):
+    max_id = bind.execute(sa.text("SELECT MAX(id) FROM comments")).scalar() or 0
+    for start in range(1, max_id + 1, CHUNK_SIZE):
+        yield start, start + CHUNK_SIZE - 1
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('comments', sa.Column('path', sa.String(length=255), nullable=True))
+    op.add_column('comments', sa.Column('depth', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('comments', sa.Column('descendant_count', sa.Integer(), server_default='0', nullable=False))
+
+    bind = op.get_bind()
+
+    # 1) 최상위 댓글 경로
+    for start, end in _id_chunks(bind):
+        bind.execute(
+            sa.text(
+                "UPDATE comments SET path = LPAD(id, 10, '0'), depth = 0 "
+                "WHERE parent_id IS NULL AND id BETWEEN :start AND :end"
+            ),
+            {"start": start, "end": end}
+        )
+
+    # 2) 부모 경로가 채워진 답글을 한 단계씩 채움 (더 이상 갱신되지 않을 때까지)
+    while True:
+        updated = 0
+        for start, end in _id_chunks(bind):
+            result = bind.execute(
+                sa.text(
+                    "UPDATE comments c JOIN comments p ON c.parent_id = p.id "
+                    "SET c.path = CONCAT(p.path, '.', LPAD(c.id, 10, '0')), c.depth = p.depth + 1 "
+                    "WHERE c.path IS NULL AND p.path IS NOT NULL AND c.id BETWEEN :start AND :end"
+                ),
+                {"start": start, "end": end}
+            )
+            updated += result.rowcount
+        if not updated:
+            break
+
+    # 3) 하위 트리 크기: 각 댓글 경로의 조상마다 1씩 더함
+    counts = {}
+    for start, end in _id_chunks(bind):
+        rows = bind.execute(
+            sa.text("SELECT path FROM comments WHERE parent_id IS NOT NULL AND id BETWEEN :start AND :end"),
+            {"start": start, "end": end}
+        )
+        for (path,) in rows:
+            if not path:
+                continue
+            for segment in path.split(".")[:-1]:
+                ancestor_id = int(segment)
+                counts[ancestor_id] = counts.get(ancestor_id, 0) + 1
+
+    items = sorted(counts.items())
+    for index in range(0, len(items), CHUNK_SIZE):
+        bind.execute(
+            sa.text("UPDATE comments SET descendant_count = :count WHERE id = :id"),
+            [{"id": comment_id, "count": count} for comment_id, count in items[index:index + CHUNK_SIZE]]
+        )
+
+    op.create_index('ix_comments_post_path', 'comments', ['post_id', 'path'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_post_path', table_name='comments')
+    op.drop_column('comments', 'descendant_count')
+    op.drop_column('comments', 'depth')
+    op.drop_column('comments', 'path')
@@ -0,0 +1,40 @@
+"""add reporter stats
+
+Revision ID: 6c1e8a4f2d93
+Revises: 4a8f3d6b2e17
+Create Date: 2026-10-19 23:41:12.306257
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c1e8a4f2d93'
+down_revision: Union[str, None] = '4a8f3d6b2e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('reporter_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('upheld_count', sa.Integer(), nullable=False),
+    sa.Column('rejected_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    # 기존 신고 처리 이력으로 채움 (이후에는 신고 상태 변경 시 증분 갱신)
+    op.execute(
+        "INSERT INTO reporter_stats (user_id, upheld_count, rejected_count) "
+        "SELECT reporter_id, SUM(status = 'reviewed'), SUM(status = 'rejected') "
+        "FROM reports WHERE status IN ('reviewed', 'rejected') GROUP BY reporter_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('reporter_stats')
@@ -0,0 +1,29 @@
+"""add notification unread index
+
+Revision ID: 6c1e8f2a4d97
+Revises: 2f7a9c3e5b81
+Create Date: 2026-10-19 19:58:12.640271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c1e8f2a4d97'
+down_revision: Union[str, None] = '2f7a9c3e5b81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 사용자별 읽지 않은 알림 조회/갱신용 복합 인덱스
+    op.create_index('ix_notifications_user_read_created', 'notifications', ['user_id', 'is_read', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_user_read_created', table_name='notifications')
@@ -0,0 +1,79 @@
+"""add report unique keys
+
+Revision ID: 8e2d4b7c1f60
+Revises: b7e3c5a09d21
+Create Date: 2026-10-19 18:42:17.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2d4b7c1f60'
+down_revision: Union[str, None] = 'b7e3c5a09d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 한 번에 정리할 신고 id 범위 (긴 잠금 방지)
+CHUNK_SIZE = 5000
+
+
+def _id_chunks(bind):
+    max_id = bind.execute(sa.text("SELECT MAX(id) FROM reports")).scalar() or 0
+    for start in range(1, max_id + 1, CHUNK_SIZE):
+        yield start, start + CHUNK_SIZE - 1
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    # 1) 같은 신고자/대상의 중복 신고는 가장 먼저 접수된 행만 남김
+    for target in ('post_id', 'comment_id'):
+        for start, end in _id_chunks(bind):
+            bind.execute(
+                sa.text(
+                    f"DELETE r FROM reports r "
+                    f"JOIN reports k ON k.reporter_id = r.reporter_id AND k.{target} = r.{target} AND k.id < r.id "
+                    f"WHERE r.id BETWEEN :start AND :end"
+                ),
+                {"start": start, "end": end}
+            )
+
+    # 2) 정리된 행 기준으로 신고 수(거부되지 않은 신고) 다시 계산
+    for table, target in (('posts', 'post_id'), ('comments', 'comment_id')):
+        op.execute(
+            f"UPDATE {table} t "
+            f"LEFT JOIN ("
+            f"  SELECT {target}, COUNT(*) AS reports "
+            f"  FROM reports WHERE {target} IS NOT NULL AND status <> 'rejected' GROUP BY {target}"
+            f") r ON t.id = r.{target} "
+            f"SET t.report_count = COALESCE(r.reports, 0) "
+            f"WHERE t.report_count > 0"
+        )
+
+    # 3) 처리 대기열 다시 채우기
+    op.execute("DELETE FROM moderation_queue")
+    for target in ('post_id', 'comment_id'):
+        op.execute(
+            f"INSERT INTO moderation_queue "
+            f"({target}, pending_count, reporter_count, priority, first_reported_at, last_reported_at) "
+            f"SELECT {target}, COUNT(*), COUNT(DISTINCT reporter_id), COUNT(*) + COUNT(DISTINCT reporter_id), "
+            f"       MIN(created_at), MAX(created_at) "
+            f"FROM reports WHERE {target} IS NOT NULL AND status = 'pending' GROUP BY {target}"
+        )
+
+    # 4) 신고자/대상 유니크 키
+    op.create_unique_constraint('unique_post_report', 'reports', ['reporter_id', 'post_id'])
+    op.create_unique_constraint('unique_comment_report', 'reports', ['reporter_id', 'comment_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # (reporter_id 외래 키는 인덱스가 필요하므로 유니크 키를 지우기 전에 단일 인덱스를 만들어 둠)
+    op.create_index(op.f('ix_reports_reporter_id'), 'reports', ['reporter_id'], unique=False)
+    op.drop_constraint('unique_comment_report', 'reports', type_='unique')
+    op.drop_constraint('unique_post_report', 'reports', type_='unique')
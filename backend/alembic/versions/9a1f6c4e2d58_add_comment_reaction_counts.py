@@ -0,0 +1,41 @@
+"""add comment reaction counts
+
+Revision ID: 9a1f6c4e2d58
+Revises: 5e9b3d1c0f27
+Create Date: 2026-10-19 12:20:08.118437
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a1f6c4e2d58'
+down_revision: Union[str, None] = '5e9b3d1c0f27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('comments', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('comments', sa.Column('dislike_count', sa.Integer(), server_default='0', nullable=False))
+    # 기존 반응 수 채우기
+    op.execute(
+        "UPDATE comments c "
+        "JOIN ("
+        "  SELECT comment_id, "
+        "         SUM(type = 'like') AS likes, "
+        "         SUM(type = 'dislike') AS dislikes "
+        "  FROM reactions WHERE comment_id IS NOT NULL GROUP BY comment_id"
+        ") r ON c.id = r.comment_id "
+        "SET c.like_count = r.likes, c.dislike_count = r.dislikes"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('comments', 'dislike_count')
+    op.drop_column('comments', 'like_count')
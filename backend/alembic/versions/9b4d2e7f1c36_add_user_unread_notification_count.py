@@ -0,0 +1,37 @@
+"""add user unread notification count
+
+Revision ID: 9b4d2e7f1c36
+Revises: 6c1e8f2a4d97
+Create Date: 2026-10-19 20:34:51.207946
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4d2e7f1c36'
+down_revision: Union[str, None] = '6c1e8f2a4d97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('unread_notification_count', sa.Integer(), server_default='0', nullable=False))
+    # 기존 읽지 않은 알림 수 채우기
+    op.execute(
+        "UPDATE users u "
+        "JOIN ("
+        "  SELECT user_id, COUNT(*) AS unread "
+        "  FROM notifications WHERE is_read = 0 GROUP BY user_id"
+        ") n ON u.id = n.user_id "
+        "SET u.unread_notification_count = n.unread"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'unread_notification_count')
@@ -0,0 +1,33 @@
+"""add timeline indexes
+
+Revision ID: a41c9e2f7b10
+Revises: 3d483c5e84e4
+Create Date: 2026-10-19 10:12:41.208133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c9e2f7b10'
+down_revision: Union[str, None] = '3d483c5e84e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 사용자 타임라인의 keyset 스캔용 복합 인덱스
+    op.create_index('ix_posts_user_created', 'posts', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_comments_user_created', 'comments', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_reactions_user_type_created', 'reactions', ['user_id', 'type', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reactions_user_type_created', table_name='reactions')
+    op.drop_index('ix_comments_user_created', table_name='comments')
+    op.drop_index('ix_posts_user_created', table_name='posts')
@@ -0,0 +1,29 @@
+"""add comment report count index
+
+Revision ID: b7e3c5a09d21
+Revises: 4d8f1b6a2c95
+Create Date: 2026-10-19 17:58:44.102637
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3c5a09d21'
+down_revision: Union[str, None] = '4d8f1b6a2c95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 관리자 댓글 목록의 신고된 댓글 필터 (report_count > 0)
+    op.create_index('ix_comments_report_count', 'comments', ['report_count', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_report_count', table_name='comments')
@@ -0,0 +1,43 @@
+"""add post revisions
+
+Revision ID: c7d2e81f4a93
+Revises: a41c9e2f7b10
+Create Date: 2026-10-19 11:02:17.554210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e81f4a93'
+down_revision: Union[str, None] = 'a41c9e2f7b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('post_revisions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('revision', sa.Integer(), nullable=False),
+    sa.Column('is_snapshot', sa.Boolean(), nullable=False),
+    sa.Column('data', sa.LargeBinary(length=16777215).with_variant(mysql.MEDIUMBLOB(), 'mysql'), nullable=False),
+    sa.Column('editor_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['editor_id'], ['users.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('post_id', 'revision', name='unique_post_revision')
+    )
+    op.create_index(op.f('ix_post_revisions_id'), 'post_revisions', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_post_revisions_id'), table_name='post_revisions')
+    op.drop_table('post_revisions')
@@ -0,0 +1,41 @@
+"""add post reaction counts
+
+Revision ID: d3a7f0b5c812
+Revises: 6b2e8d4f1a73
+Create Date: 2026-10-19 14:02:37.904115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a7f0b5c812'
+down_revision: Union[str, None] = '6b2e8d4f1a73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('posts', sa.Column('dislike_count', sa.Integer(), server_default='0', nullable=False))
+    # 기존 반응 수 채우기
+    op.execute(
+        "UPDATE posts p "
+        "JOIN ("
+        "  SELECT post_id, "
+        "         SUM(type = 'like') AS likes, "
+        "         SUM(type = 'dislike') AS dislikes "
+        "  FROM reactions WHERE post_id IS NOT NULL GROUP BY post_id"
+        ") r ON p.id = r.post_id "
+        "SET p.like_count = r.likes, p.dislike_count = r.dislikes"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'dislike_count')
+    op.drop_column('posts', 'like_count')
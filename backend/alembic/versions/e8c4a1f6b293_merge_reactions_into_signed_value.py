@@ -0,0 +1,108 @@
+"""merge reactions into signed value
+
+Revision ID: e8c4a1f6b293
+Revises: d3a7f0b5c812
+Create Date: 2026-10-19 15:21:08.416372
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c4a1f6b293'
+down_revision: Union[str, None] = 'd3a7f0b5c812'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 한 번에 갱신할 반응 id 범위 (긴 잠금 방지)
+CHUNK_SIZE = 5000
+
+
+def _id_chunks(bind):
+    max_id = bind.execute(sa.text("SELECT MAX(id) FROM reactions")).scalar() or 0
+    for start in range(1, max_id + 1, CHUNK_SIZE):
+        yield start, start + CHUNK_SIZE - 1
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('reactions', sa.Column('value', sa.SmallInteger(), nullable=True))
+
+    bind = op.get_bind()
+
+    # 1) type -> value (좋아요 +1, 싫어요 -1)
+    for start, end in _id_chunks(bind):
+        bind.execute(
+            sa.text(
+                "UPDATE reactions SET value = IF(type = 'like', 1, -1) "
+                "WHERE id BETWEEN :start AND :end"
+            ),
+            {"start": start, "end": end}
+        )
+
+    # 2) 같은 사용자/대상에 좋아요와 싫어요가 모두 남아 있으면 가장 최근 행만 남김
+    for target in ('post_id', 'comment_id'):
+        for start, end in _id_chunks(bind):
+            bind.execute(
+                sa.text(
+                    f"DELETE r FROM reactions r "
+                    f"JOIN reactions k ON k.user_id = r.user_id AND k.{target} = r.{target} AND k.id > r.id "
+                    f"WHERE r.id BETWEEN :start AND :end"
+                ),
+                {"start": start, "end": end}
+            )
+
+    op.alter_column('reactions', 'value', existing_type=sa.SmallInteger(), nullable=False)
+
+    # 3) 유니크 키를 (user_id, 대상)으로 교체
+    # (user_id 외래 키는 교체하는 동안 ix_reactions_user_type_created 인덱스가 받쳐 줌)
+    op.drop_constraint('unique_post_reaction', 'reactions', type_='unique')
+    op.drop_constraint('unique_comment_reaction', 'reactions', type_='unique')
+    op.create_unique_constraint('unique_post_reaction', 'reactions', ['user_id', 'post_id'])
+    op.create_unique_constraint('unique_comment_reaction', 'reactions', ['user_id', 'comment_id'])
+
+    op.drop_index('ix_reactions_user_type_created', table_name='reactions')
+    op.create_index('ix_reactions_user_value_created', 'reactions', ['user_id', 'value', 'created_at'], unique=False)
+    op.drop_column('reactions', 'type')
+    op.create_check_constraint('check_reaction_value', 'reactions', 'value IN (1, -1)')
+
+    # 4) 정리된 행 기준으로 카운터 다시 계산
+    for table, target in (('posts', 'post_id'), ('comments', 'comment_id')):
+        op.execute(
+            f"UPDATE {table} t "
+            f"JOIN ("
+            f"  SELECT {target}, SUM(value = 1) AS likes, SUM(value = -1) AS dislikes "
+            f"  FROM reactions WHERE {target} IS NOT NULL GROUP BY {target}"
+            f") r ON t.id = r.{target} "
+            f"SET t.like_count = r.likes, t.dislike_count = r.dislikes"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('check_reaction_value', 'reactions', type_='check')
+    op.add_column('reactions', sa.Column('type', sa.Enum('like', 'dislike'), nullable=True))
+
+    bind = op.get_bind()
+    for start, end in _id_chunks(bind):
+        bind.execute(
+            sa.text(
+                "UPDATE reactions SET type = IF(value = 1, 'like', 'dislike') "
+                "WHERE id BETWEEN :start AND :end"
+            ),
+            {"start": start, "end": end}
+        )
+
+    op.alter_column('reactions', 'type', existing_type=sa.Enum('like', 'dislike'), nullable=False)
+
+    op.drop_constraint('unique_post_reaction', 'reactions', type_='unique')
+    op.drop_constraint('unique_comment_reaction', 'reactions', type_='unique')
+    op.create_unique_constraint('unique_post_reaction', 'reactions', ['user_id', 'post_id', 'type'])
+    op.create_unique_constraint('unique_comment_reaction', 'reactions', ['user_id', 'comment_id', 'type'])
+
+    op.drop_index('ix_reactions_user_value_created', table_name='reactions')
+    op.create_index('ix_reactions_user_type_created', 'reactions', ['user_id', 'type', 'created_at'], unique=False)
+    op.drop_column('reactions', 'value')
@@ -0,0 +1,31 @@
+"""add report list indexes
+
+Revision ID: f5b19d7c3e46
+Revises: e8c4a1f6b293
+Create Date: 2026-10-19 16:08:52.731904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5b19d7c3e46'
+down_revision: Union[str, None] = 'e8c4a1f6b293'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 신고 목록의 keyset 스캔용 복합 인덱스
+    op.create_index('ix_reports_status_created_id', 'reports', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_reports_created_id', 'reports', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reports_created_id', table_name='reports')
+    op.drop_index('ix_reports_status_created_id', table_name='reports')
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from backend.api.endpoints import users, auth, posts, comments, institutions, categories, reports, notifications, admin, notices
+from backend.api.endpoints import users, auth, posts, comments, reactions, institutions, categories, reports, notifications, admin, notices
 
 api_router = APIRouter()
 
@@ -9,6 +9,7 @@ api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(posts.router, prefix="/posts", tags=["posts"])
 api_router.include_router(comments.router, prefix="/comments", tags=["comments"])
+api_router.include_router(reactions.router, prefix="/reactions", tags=["reactions"])
 api_router.include_router(institutions.router, prefix="/institutions", tags=["institutions"])
 api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
 api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
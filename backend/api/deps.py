@@ -98,6 +98,11 @@ oauth2_scheme_optional = OAuth2PasswordBearerOptional(tokenUrl=f"{settings.API_V
 def get_optional_current_user(
     db: Session = Depends(get_db), token: Optional[str] = Depends(oauth2_scheme_optional)
 ) -> Optional[models.User]:
+    return get_user_from_token(db, token)
+
+
+# 토큰으로 사용자 조회 (유효하지 않으면 None) - 헤더를 보낼 수 없는 SSE 등에서 직접 사용
+def get_user_from_token(db: Session, token: Optional[str]) -> Optional[models.User]:
     if not token:
         return None
     try:
@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Body
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy import case, func, or_
 
 from backend import models, schemas
 from backend.api import deps
@@ -11,6 +11,12 @@ import json
 from fastapi.encoders import jsonable_encoder
 from backend import models, schemas
 from backend.api import deps
+from backend.core.site_settings import DEFAULT_SETTINGS, SETTING_PREFIXES, site_settings
+from backend.models.reaction import REACTION_VALUES
+from backend.utils.reconcile import find_reaction_drift, repair_reaction_counts
+from backend.utils.thread_cache import comment_thread_cache
+from backend.utils.counter_buffer import reaction_counter_buffer
+from backend.utils.reaction_bitmaps import reaction_bitmap_index
 router = APIRouter()
 """
 현재 사용중인 get_optional_current_user
@@ -18,41 +24,6 @@ router = APIRouter()
 
 추후 토큰문제를 해결하여 get_current_active_user로 변경해야함.
 """
-# 기본 설정값 정의
-DEFAULT_SETTINGS = {
-    "site": {
-        "siteName": "Mountain",
-        "siteDescription": "커뮤니티 플랫폼",
-        "primaryColor": "#4f46e5",
-        "secondaryColor": "#10b981",
-        "logoUrl": "/logo.png",
-        "faviconUrl": "/favicon.ico",
-        "footerText": "© 2023 Mountain. All rights reserved.",
-        "enableDarkMode": True,
-        "defaultTheme": "system"
-    },
-    "report": {
-        "autoHideThreshold": 3,
-        "defaultSanctionPeriod": 7,
-        "enableAutoSanction": False,
-        "notifyAdminOnReport": True,
-        "sanctionReasonRequired": True
-    },
-    "notification": {
-        "notifyUserOnSanction": True,
-        "notifyUserOnReportResult": True,
-        "notifyAdminOnHighPriorityReport": True,
-        "enableInAppNotifications": True,
-        "enableBrowserNotifications": False
-    }
-}
-
-# 설정 키 접두사 정의
-SETTING_PREFIXES = {
-    "site": "site.",
-    "report": "report.",
-    "notification": "notification."
-}
 
 @router.get("/stats", response_model=Dict[str, Any])
 def get_admin_stats(
@@ -226,15 +197,13 @@ def get_admin_user_detail(
         models.ActivityLog.action_type == "delete_comment"
     ).scalar()
     
-    # 좋아요, 싫어요 수
-    like_count = db.query(func.count(models.Reaction.id)).filter(
-        models.Reaction.user_id == user_id,
-        models.Reaction.type == "like"
-    ).scalar()
-    dislike_count = db.query(func.count(models.Reaction.id)).filter(
-        models.Reaction.user_id == user_id,
-        models.Reaction.type == "dislike"
-    ).scalar()
+    # 좋아요, 싫어요 수 (한 번의 스캔으로 함께 집계)
+    like_count, dislike_count = db.query(
+        func.coalesce(func.sum(case((models.Reaction.value == REACTION_VALUES["like"], 1), else_=0)), 0),
+        func.coalesce(func.sum(case((models.Reaction.value == REACTION_VALUES["dislike"], 1), else_=0)), 0),
+    ).filter(
+        models.Reaction.user_id == user_id
+    ).one()
     
     # 최근 활동 시간 (가장 최근 활동 로그)
     last_activity = db.query(models.ActivityLog).filter(
@@ -358,7 +327,7 @@ def get_user_reactions(
     
     # 반응 타입별 필터링
     if type and type in ["like", "dislike"]:
-        query = query.filter(models.Reaction.type == type)
+        query = query.filter(models.Reaction.value == REACTION_VALUES[type])
     
     # 총 개수 계산
     total = query.count()
@@ -579,8 +548,8 @@ def get_admin_comments(
     # if current_user.role not in ["admin", "moderator"]:
     #     raise HTTPException(status_code=403, detail="Not enough permissions")
     
-    # 기본 쿼리 생성
-    query = db.query(models.Comment).join(
+    # 기본 쿼리 생성 (작성자 이름과 게시글 제목을 함께 조회)
+    query = db.query(models.Comment, models.User.username, models.Post.title).join(
         models.User, models.Comment.user_id == models.User.id
     ).join(
         models.Post, models.Comment.post_id == models.Post.id
@@ -593,11 +562,8 @@ def get_admin_comments(
         elif status == "visible":
             query = query.filter(models.Comment.is_hidden == False)
         elif status == "reported":
-            # 신고된 댓글 필터링
-            reported_comment_ids = db.query(models.Report.comment_id).filter(
-                models.Report.comment_id != None
-            ).distinct()
-            query = query.filter(models.Comment.id.in_(reported_comment_ids))
+            # 신고된 댓글 필터링 (거부되지 않은 신고 수, report_count 인덱스)
+            query = query.filter(models.Comment.report_count > 0)
     
     # 검색어 필터링
     if search:
@@ -615,29 +581,31 @@ def get_admin_comments(
     
     # 페이지네이션
     offset = (page - 1) * limit
-    comments = query.order_by(models.Comment.created_at.desc()).offset(offset).limit(limit).all()
+    rows = query.order_by(models.Comment.created_at.desc()).offset(offset).limit(limit).all()
+    
+    # 페이지 댓글들의 신고 정보를 한 번의 IN 쿼리로 가져와 댓글별로 묶음
+    report_info = {comment.id: [] for comment, _, _ in rows}
+    if report_info:
+        reports = db.query(
+            models.Report.comment_id, models.Report.reason, models.Report.description
+        ).filter(
+            models.Report.comment_id.in_(list(report_info))
+        ).order_by(models.Report.id).all()
+        for comment_id, reason, description in reports:
+            report_info[comment_id].append({
+                "reason": reason,
+                "description": description
+            })
     
     # 결과 구성
     result_comments = []
-    for comment in comments:
-        # 신고 정보 가져오기
-        reports = db.query(models.Report).filter(models.Report.comment_id == comment.id).all()
-        report_info = []
-        for report in reports:
-            report_info.append({
-                "reason": report.reason,
-                "description": report.description
-            })
-        
-        # 게시글 제목 가져오기
-        post_title = comment.post.title if comment.post else "Unknown Post"
-        
+    for comment, author, post_title in rows:
         # 댓글 객체 생성
         comment_dict = {
             **schemas.Comment.model_validate(comment).model_dump(),
-            "author": comment.user.username,
-            "postTitle": post_title,
-            "reports": report_info
+            "author": author,
+            "postTitle": post_title or "Unknown Post",
+            "reports": report_info[comment.id]
         }
         result_comments.append(comment_dict)
     
@@ -647,6 +615,158 @@ def get_admin_comments(
         "totalItems": total_items
     }
 
+@router.get("/reconciliation/comment-reactions", response_model=Dict[str, Any])
+def check_comment_reaction_counts(
+    db: Session = Depends(deps.get_db),
+    limit: int = 100,
+    current_user: models.User = Depends(deps.get_optional_current_user),
+) -> Any:
+    """
+    댓글 좋아요/싫어요 카운터와 reactions 테이블의 불일치 검사 (조회만, 보정은 POST)
+    """
+    # if current_user.role != "admin":
+    #     raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    drift = find_reaction_drift(db, "comment", limit)
+    
+    return {
+        "drift": drift,
+        "driftCount": len(drift)
+    }
+
+@router.post("/reconciliation/comment-reactions", response_model=Dict[str, Any])
+def repair_comment_reaction_counts(
+    db: Session = Depends(deps.get_db),
+    limit: int = 100,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    댓글 좋아요/싫어요 카운터 불일치 검사 후 보정 (관리자만 가능)
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    drift = find_reaction_drift(db, "comment", limit)
+    
+    repaired = 0
+    if drift:
+        repaired = repair_reaction_counts(db, "comment", [row["comment_id"] for row in drift])
+        db.commit()
+        comment_thread_cache.clear()
+    
+    return {
+        "drift": drift,
+        "driftCount": len(drift),
+        "repaired": repaired
+    }
+
+@router.get("/reconciliation/post-reactions", response_model=Dict[str, Any])
+def check_post_reaction_counts(
+    db: Session = Depends(deps.get_db),
+    limit: int = 100,
+    current_user: models.User = Depends(deps.get_optional_current_user),
+) -> Any:
+    """
+    게시물 좋아요/싫어요 카운터와 reactions 테이블의 불일치 검사 (조회만, 보정은 POST)
+    """
+    # if current_user.role != "admin":
+    #     raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    # 버퍼에 남은 증감(현재 워커)은 반영하지 않고 함께 보여 줌 - 증감으로 설명되는 차이는 불일치에서 제외
+    drift = []
+    for row in find_reaction_drift(db, "post", limit):
+        pending_likes, pending_dislikes = reaction_counter_buffer.pending("post", row["post_id"])
+        if (row["like_count"] + pending_likes == row["actual_like_count"]
+                and row["dislike_count"] + pending_dislikes == row["actual_dislike_count"]):
+            continue
+        row["pending_like_count"] = pending_likes
+        row["pending_dislike_count"] = pending_dislikes
+        drift.append(row)
+    
+    return {
+        "drift": drift,
+        "driftCount": len(drift)
+    }
+
+@router.post("/reconciliation/post-reactions", response_model=Dict[str, Any])
+def repair_post_reaction_counts(
+    db: Session = Depends(deps.get_db),
+    limit: int = 100,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    게시물 좋아요/싫어요 카운터 불일치 검사 후 보정 (관리자만 가능)
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    # 버퍼에 남은 증감을 먼저 반영해야 정상 상태가 불일치로 보이지 않음
+    # (다른 워커의 버퍼는 반영 주기(REACTION_COUNTER_FLUSH_SECONDS)가 지나야 반영되므로 트래픽이 적을 때 보정할 것)
+    reaction_counter_buffer.flush()
+    
+    drift = find_reaction_drift(db, "post", limit)
+    
+    repaired = 0
+    if drift:
+        repaired = repair_reaction_counts(db, "post", [row["post_id"] for row in drift])
+        db.commit()
+    
+    return {
+        "drift": drift,
+        "driftCount": len(drift),
+        "repaired": repaired
+    }
+
+@router.get("/cache/comment-threads", response_model=Dict[str, Any])
+def get_comment_thread_cache_stats(
+    current_user: models.User = Depends(deps.get_optional_current_user),
+) -> Any:
+    """
+    댓글 스레드 캐시 적중률 등 지표 조회 (현재 워커 기준)
+    """
+    # if current_user.role != "admin":
+    #     raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    return comment_thread_cache.stats()
+
+@router.post("/cache/comment-threads/reset-stats", response_model=Dict[str, Any])
+def reset_comment_thread_cache_stats(
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    댓글 스레드 캐시 지표를 반환하고 초기화 (현재 워커 기준, 관리자만 가능)
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    stats = comment_thread_cache.stats()
+    comment_thread_cache.reset_stats()
+    return stats
+
+@router.get("/cache/reaction-counters", response_model=Dict[str, Any])
+def get_reaction_counter_buffer_stats(
+    current_user: models.User = Depends(deps.get_optional_current_user),
+) -> Any:
+    """
+    반응 카운터 쓰기 병합 버퍼 상태 (현재 워커 기준)
+    """
+    # if current_user.role != "admin":
+    #     raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    return reaction_counter_buffer.stats()
+
+@router.get("/cache/reaction-bitmaps", response_model=Dict[str, Any])
+def get_reaction_bitmap_index_stats(
+    current_user: models.User = Depends(deps.get_optional_current_user),
+) -> Any:
+    """
+    반응 비트맵 인덱스 크기/적중률 (현재 워커 기준)
+    """
+    # if current_user.role != "admin":
+    #     raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    return reaction_bitmap_index.stats()
+
 @router.get("/users")#, response_model=List[schemas.User]
 def get_admin_users(
     db: Session = Depends(deps.get_db),
@@ -861,6 +981,7 @@ def update_section_settings(
     db.add(activity_log)
     
     db.commit()
+    site_settings.invalidate()
     
     # 업데이트된 설정 반환
     return get_section_settings(section, db, current_user)
@@ -907,6 +1028,7 @@ def reset_section_settings(
     db.add(activity_log)
     
     db.commit()
+    site_settings.invalidate()
     
     # 초기화된 설정 반환
     return DEFAULT_SETTINGS[section]
@@ -935,6 +1057,7 @@ def update_setting(
     
     db.add(setting)
     db.commit()
+    site_settings.invalidate()
     db.refresh(setting)
     
     # 활동 로그 기록
@@ -9,6 +9,7 @@ from backend import models, schemas
 from backend.api import deps
 from backend.core import security
 from backend.core.config import settings
+from backend.utils.notifications import create_notification
 
 router = APIRouter()
 
@@ -137,13 +138,12 @@ def register_user(
     db.add(activity_log)
 
     # 환영 메시지 알림 생성
-    welcome_notification = models.Notification(
+    create_notification(
+        db,
         user_id=user.id,
         type="admin_message",
-        content="환영합니다! Mountain 커뮤니티에 가입해주셔서 감사합니다.",
-        is_read=False
+        content="환영합니다! Mountain 커뮤니티에 가입해주셔서 감사합니다."
     )
-    db.add(welcome_notification)
     db.commit()
     
     return user
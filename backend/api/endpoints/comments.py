@@ -1,25 +1,166 @@
 import json
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy import func, or_
 
 from backend import models, schemas
 from backend.api import deps
+from backend.utils.pagination import encode_cursor, decode_cursor, cursor_datetime, cursor_int, cursor_str, keyset_predicate
+from backend.utils.comment_events import (
+    publish_comment_created, publish_comment_updated, publish_comment_deleted,
+    publish_comment_visibility, publish_comment_reactions
+)
+from backend.utils.thread_cache import comment_thread_cache
+from backend.utils.reactions import set_reaction, delete_reaction, commit_reaction, read_viewer_reactions
+from backend.utils.reports import file_report
+from backend.utils.report_events import publish_report_created
 
 router = APIRouter()
 
+# 최상위 댓글마다 함께 내려주는 답글 미리보기 개수 기본값
+REPLY_PREVIEW_SIZE = 3
+
+# 구체화 경로 설정 (세그먼트 10자리 + 구분자 -> String(255)에 최대 23단계까지 저장 가능)
+COMMENT_PATH_WIDTH = 10
+COMMENT_PATH_SEPARATOR = "."
+MAX_COMMENT_DEPTH = 10  # 최상위 댓글의 depth는 0
+
+
+def _comment_path(parent_path: Optional[str], comment_id: int) -> str:
+    segment = str(comment_id).zfill(COMMENT_PATH_WIDTH)
+    return f"{parent_path}{COMMENT_PATH_SEPARATOR}{segment}" if parent_path else segment
+
+
+def _comment_ancestor_ids(path: str) -> List[int]:
+    """
+    경로에서 자신을 제외한 조상 댓글 id 목록
+    """
+    return [int(segment) for segment in path.split(COMMENT_PATH_SEPARATOR)[:-1]]
+
+def _viewer_comment_reactions(db: Session, comment_ids: List[int], user: Optional[models.User]) -> Set[Tuple[int, str]]:
+    """
+    현재 사용자가 여러 댓글에 남긴 반응 (user_id + comment_id IN 인덱스 조회 한 번)
+    """
+    if not user or not comment_ids:
+        return set()
+    reactions = read_viewer_reactions(db, "comment", comment_ids, user.id)
+    return {(comment_id, reaction_type) for comment_id, reaction_type in reactions.items() if reaction_type}
+
+
+def _load_comment_thread(
+    db: Session, post_id: int, skip: int, limit: int, include_hidden: bool, reply_limit: int
+) -> List[dict]:
+    """
+    게시물의 최상위 댓글 페이지와 각 댓글의 처음 reply_limit개 답글을 한 번에 읽어
+    사용자와 무관한 트리로 조립 (댓글+답글 1회, 작성자 1회, 반응 수 집계 1회)
+    """
+    # 최상위 댓글 페이지 (CTE로 사용 - MySQL은 IN 서브쿼리의 LIMIT을 지원하지 않음)
+    roots_query = db.query(models.Comment.id).filter(
+        models.Comment.post_id == post_id,
+        models.Comment.parent_id == None
+    )
+    if not include_hidden:
+        roots_query = roots_query.filter(models.Comment.is_hidden == False)
+    roots = roots_query.order_by(
+        models.Comment.created_at.desc(), models.Comment.id.desc()
+    ).offset(skip).limit(limit).cte("roots")
+    
+    # 최상위 댓글별 답글 순번 (작성순)
+    ranked_query = db.query(
+        models.Comment.id.label("id"),
+        func.row_number().over(
+            partition_by=models.Comment.parent_id,
+            order_by=(models.Comment.created_at, models.Comment.id)
+        ).label("position")
+    ).join(roots, models.Comment.parent_id == roots.c.id)
+    if not include_hidden:
+        ranked_query = ranked_query.filter(models.Comment.is_hidden == False)
+    ranked = ranked_query.subquery()
+    
+    # 최상위 댓글과 답글 미리보기를 하나의 쿼리로 조회
+    # 미리보기보다 한 개 더 읽어 (reply_limit + 1번째) 이어서 볼 답글이 있는지 판단 - 보이는 답글 기준
+    rows = db.query(models.Comment, ranked.c.position).outerjoin(
+        ranked, ranked.c.id == models.Comment.id
+    ).filter(
+        or_(
+            models.Comment.id.in_(db.query(roots.c.id)),
+            ranked.c.position <= reply_limit + 1
+        )
+    ).all()
+    if not rows:
+        return []
+    has_more_replies = {comment.parent_id for comment, position in rows if position == reply_limit + 1}
+    comments = [comment for comment, position in rows if position is None or position <= reply_limit]
+    
+    # 작성자 일괄 조회
+    user_ids = {comment.user_id for comment in comments}
+    users = {
+        user.id: schemas.User.model_validate(user)
+        for user in db.query(models.User).filter(models.User.id.in_(user_ids)).all()
+    }
+    
+    nodes = {}
+    for comment in comments:
+        nodes[comment.id] = {
+            **schemas.Comment.model_validate(comment).model_dump(),
+            "user": users[comment.user_id],
+            "replies": []
+        }
+    
+    # 메모리에서 트리 조립
+    thread = []
+    for node in nodes.values():
+        if node["parent_id"] is None:
+            thread.append(node)
+        elif node["parent_id"] in nodes:
+            nodes[node["parent_id"]]["replies"].append(node)
+    
+    # 최상위 댓글은 최신순, 답글은 작성순
+    thread.sort(key=lambda node: (node["created_at"], node["id"]), reverse=True)
+    for node in thread:
+        node["replies"].sort(key=lambda reply: (reply["created_at"], reply["id"]))
+        # 미리보기 이후의 답글은 read_comment_replies로 이어서 조회
+        if node["replies"] and node["id"] in has_more_replies:
+            last = node["replies"][-1]
+            node["next_reply_cursor"] = encode_cursor(last["created_at"], last["id"])
+    return thread
+
+
+def _build_comment_thread(thread: List[dict], reacted: Set[Tuple[int, str]]) -> List[schemas.CommentWithReplies]:
+    """
+    사용자와 무관한 트리에 현재 사용자의 반응 상태를 덧씌워 응답 객체 생성
+    """
+    result = []
+    for node in thread:
+        replies = [
+            schemas.CommentWithUser(
+                **reply,
+                liked_by_me=(reply["id"], "like") in reacted,
+                disliked_by_me=(reply["id"], "dislike") in reacted
+            )
+            for reply in node["replies"]
+        ]
+        result.append(schemas.CommentWithReplies(
+            **{**node, "replies": replies},
+            liked_by_me=(node["id"], "like") in reacted,
+            disliked_by_me=(node["id"], "dislike") in reacted
+        ))
+    return result
+
+
 @router.get("/{post_id}/comments", response_model=List[schemas.CommentWithReplies])
 def read_comments_by_post(
     post_id: int,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 50,
+    reply_limit: int = Query(REPLY_PREVIEW_SIZE, ge=0, le=50),
     current_user: Optional[models.User] = Depends(deps.get_optional_current_user),
 ) -> Any:
     """
-    게시물의 댓글 목록 조회
+    게시물의 댓글 목록 조회 (최상위 댓글마다 답글 수와 처음 reply_limit개 답글 포함)
     """
     # 게시물 존재 확인
     post = db.query(models.Post).filter(models.Post.id == post_id).first()
@@ -30,110 +171,22 @@ def read_comments_by_post(
     if post.is_hidden and (not current_user or (current_user.role != "admin" and current_user.role != "moderator")):
         raise HTTPException(status_code=403, detail="Post is hidden")
     
-    # 최상위 댓글만 가져옴 (parent_id가 NULL)
-    query = db.query(models.Comment).filter(
-        models.Comment.post_id == post_id,
-        models.Comment.parent_id == None
-    )
-    
-    # 관리자나 중재자가 아니면 숨겨진 댓글 제외
-    if not current_user or (current_user.role != "admin" and current_user.role != "moderator"):
-        query = query.filter(models.Comment.is_hidden == False)
+    # 관리자나 중재자만 숨겨진 댓글/답글 포함
+    include_hidden = current_user is not None and current_user.role in ["admin", "moderator"]
     
-    # 최신순 정렬
-    query = query.order_by(models.Comment.created_at.desc())
+    # 사용자와 무관한 트리는 캐시에서 (댓글/반응 변경 시 무효화)
+    cache_key = (skip, limit, include_hidden, reply_limit)
+    thread = comment_thread_cache.get(post_id, cache_key)
+    if thread is None:
+        generation = comment_thread_cache.generation(post_id)
+        thread = _load_comment_thread(db, post_id, skip, limit, include_hidden, reply_limit)
+        comment_thread_cache.set(post_id, cache_key, thread, generation)
     
-    # 페이지네이션
-    comments = query.offset(skip).limit(limit).all()
+    # 현재 사용자의 반응 상태 (로그인한 경우만, 1회 조회)
+    comment_ids = [node["id"] for node in thread] + [reply["id"] for node in thread for reply in node["replies"]]
+    reacted = _viewer_comment_reactions(db, comment_ids, current_user)
     
-    # 결과 구성
-    result = []
-    for comment in comments:
-        # 좋아요/싫어요 수 계산
-        like_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.comment_id == comment.id,
-            models.Reaction.type == "like"
-        ).scalar()
-        
-        dislike_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.comment_id == comment.id,
-            models.Reaction.type == "dislike"
-        ).scalar()
-        
-        # 현재 사용자의 반응 상태 확인 (로그인한 경우만)
-        liked_by_me = False
-        disliked_by_me = False
-        if current_user:
-            liked_by_me = db.query(models.Reaction).filter(
-                models.Reaction.comment_id == comment.id,
-                models.Reaction.user_id == current_user.id,
-                models.Reaction.type == "like"
-            ).first() is not None
-            
-            disliked_by_me = db.query(models.Reaction).filter(
-                models.Reaction.comment_id == comment.id,
-                models.Reaction.user_id == current_user.id,
-                models.Reaction.type == "dislike"
-            ).first() is not None
-        
-        # 답글 가져오기
-        replies = []
-        for reply in comment.replies:
-            # 숨겨진 답글 필터링
-            if reply.is_hidden and (not current_user or (current_user.role != "admin" and current_user.role != "moderator")):
-                continue
-            
-            # 답글의 좋아요/싫어요 수 계산
-            reply_like_count = db.query(func.count(models.Reaction.id)).filter(
-                models.Reaction.comment_id == reply.id,
-                models.Reaction.type == "like"
-            ).scalar()
-            
-            reply_dislike_count = db.query(func.count(models.Reaction.id)).filter(
-                models.Reaction.comment_id == reply.id,
-                models.Reaction.type == "dislike"
-            ).scalar()
-            
-            # 현재 사용자의 답글 반응 상태 확인 (로그인한 경우만)
-            reply_liked_by_me = False
-            reply_disliked_by_me = False
-            if current_user:
-                reply_liked_by_me = db.query(models.Reaction).filter(
-                    models.Reaction.comment_id == reply.id,
-                    models.Reaction.user_id == current_user.id,
-                    models.Reaction.type == "like"
-                ).first() is not None
-                
-                reply_disliked_by_me = db.query(models.Reaction).filter(
-                    models.Reaction.comment_id == reply.id,
-                    models.Reaction.user_id == current_user.id,
-                    models.Reaction.type == "dislike"
-                ).first() is not None
-            
-            # 답글 객체 생성
-            reply_dict = {
-                **schemas.Comment.model_validate(reply).model_dump(),
-                "user": schemas.User.model_validate(reply.user),
-                "like_count": reply_like_count,
-                "dislike_count": reply_dislike_count,
-                "liked_by_me": reply_liked_by_me,
-                "disliked_by_me": reply_disliked_by_me
-            }
-            replies.append(schemas.CommentWithUser(**reply_dict))
-        
-        # 댓글 객체 생성
-        comment_dict = {
-            **schemas.Comment.model_validate(comment).model_dump(),
-            "user": schemas.User.model_validate(comment.user),
-            "like_count": like_count,
-            "dislike_count": dislike_count,
-            "liked_by_me": liked_by_me,
-            "disliked_by_me": disliked_by_me,
-            "replies": replies
-        }
-        result.append(schemas.CommentWithReplies(**comment_dict))
-
-    return result
+    return _build_comment_thread(thread, reacted)
 
 
 @router.post("/", response_model=schemas.Comment)
@@ -168,13 +221,34 @@ def create_comment(
         # 부모 댓글과 같은 게시물에만 답글을 달 수 있음
         if parent_comment.post_id != comment_in.post_id:
             raise HTTPException(status_code=400, detail="Parent comment belongs to different post")
+        
+        # 최대 답글 깊이 제한
+        if parent_comment.depth + 1 > MAX_COMMENT_DEPTH:
+            raise HTTPException(status_code=400, detail=f"Replies cannot be nested deeper than {MAX_COMMENT_DEPTH} levels")
     
     # 댓글 생성 - dict() 대신 model_dump() 사용
     comment = models.Comment(
         **comment_in.model_dump(),
-        user_id=current_user.id
+        user_id=current_user.id,
+        depth=parent_comment.depth + 1 if comment_in.parent_id else 0
     )
     db.add(comment)
+    db.flush()
+    
+    # 구체화 경로는 id가 필요하므로 INSERT 후 설정 (같은 트랜잭션)
+    comment.path = _comment_path(parent_comment.path if comment_in.parent_id else None, comment.id)
+    
+    if comment_in.parent_id:
+        # 부모 댓글의 답글 수 증가
+        db.query(models.Comment).filter(models.Comment.id == comment_in.parent_id).update(
+            {models.Comment.reply_count: models.Comment.reply_count + 1},
+            synchronize_session=False
+        )
+        # 모든 조상 댓글의 하위 트리 크기 증가
+        db.query(models.Comment).filter(models.Comment.id.in_(_comment_ancestor_ids(comment.path))).update(
+            {models.Comment.descendant_count: models.Comment.descendant_count + 1},
+            synchronize_session=False
+        )
     db.commit()
     db.refresh(comment)
     
@@ -188,6 +262,8 @@ def create_comment(
     db.add(activity_log)
     db.commit()
     
+    publish_comment_created(comment)
+    
     return comment
 
 
@@ -219,6 +295,7 @@ def update_comment(
         comment.content = comment_in.content
     
     # 숨김 상태 변경 (관리자/중재자만)
+    was_hidden = comment.is_hidden
     if comment_in.is_hidden is not None and current_user.role in ["admin", "moderator"]:
         comment.is_hidden = comment_in.is_hidden
     
@@ -226,6 +303,11 @@ def update_comment(
     db.commit()
     db.refresh(comment)
     
+    if comment_in.content is not None and comment.user_id == current_user.id:
+        publish_comment_updated(comment)
+    if comment.is_hidden != was_hidden:
+        publish_comment_visibility(comment)
+    
     # 활동 로그 기록
     activity_log = models.ActivityLog(
         user_id=current_user.id,
@@ -266,13 +348,64 @@ def delete_comment(
     )
     db.add(activity_log)
     
-    # 댓글 삭제
+    if comment.parent_id:
+        # 부모 댓글의 답글 수 감소
+        db.query(models.Comment).filter(models.Comment.id == comment.parent_id).update(
+            {models.Comment.reply_count: models.Comment.reply_count - 1},
+            synchronize_session=False
+        )
+        # 조상 댓글의 하위 트리 크기 감소 (자신 + 함께 삭제되는 하위 댓글)
+        if comment.path:
+            db.query(models.Comment).filter(models.Comment.id.in_(_comment_ancestor_ids(comment.path))).update(
+                {models.Comment.descendant_count: models.Comment.descendant_count - (1 + comment.descendant_count)},
+                synchronize_session=False
+            )
+    
+    # 댓글 삭제 (하위 댓글은 ON DELETE CASCADE로 함께 삭제)
     db.delete(comment)
     db.commit()
     
+    publish_comment_deleted(comment.post_id, comment.id, comment.parent_id)
+    
     return comment
 
 
+def _toggle_comment_reaction(
+    db: Session, comment: models.Comment, user: models.User, reaction_type: str
+) -> models.Reaction:
+    """
+    댓글 반응 토글: 같은 반응이 있으면 취소, 없으면 반대 반응을 지우고 추가
+    (행 변경과 카운터 반영은 utils.reactions의 유니크 키 기반 쓰기로 처리해 동시 요청에도 안전)
+    """
+    existing = db.query(models.Reaction).filter(
+        models.Reaction.user_id == user.id,
+        models.Reaction.comment_id == comment.id
+    ).first()
+    
+    if existing and existing.type == reaction_type:
+        # 이미 같은 반응이 있으면 취소 (삭제된 행은 커밋 후 다시 읽을 수 없으므로 먼저 응답 객체로 변환)
+        result = schemas.Reaction.model_validate(existing)
+        removed = delete_reaction(db, user.id, "comment", comment.id, reaction_type)
+        if reaction_type == "like":
+            commit_reaction(db, "comment", comment.id, likes=-removed, user_id=user.id)
+        else:
+            commit_reaction(db, "comment", comment.id, dislikes=-removed, user_id=user.id)
+        publish_comment_reactions(comment)
+        return result
+    
+    likes, dislikes = set_reaction(db, user.id, "comment", comment.id, reaction_type)
+    commit_reaction(db, "comment", comment.id, likes=likes, dislikes=dislikes, user_id=user.id)
+    
+    reaction = db.query(models.Reaction).filter(
+        models.Reaction.user_id == user.id,
+        models.Reaction.comment_id == comment.id
+    ).first()
+    
+    publish_comment_reactions(comment)
+    
+    return reaction
+
+
 @router.post("/{comment_id}/like", response_model=schemas.Reaction)
 def like_comment(
     *,
@@ -291,41 +424,7 @@ def like_comment(
     if comment.is_hidden:
         raise HTTPException(status_code=403, detail="Cannot like hidden comment")
     
-    # 이미 좋아요한 경우 확인
-    existing_like = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.comment_id == comment_id,
-        models.Reaction.type == "like"
-    ).first()
-    
-    if existing_like:
-        # 이미 좋아요한 경우 좋아요 취소
-        db.delete(existing_like)
-        db.commit()
-        return existing_like
-    
-    # 싫어요가 있는 경우 삭제
-    existing_dislike = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.comment_id == comment_id,
-        models.Reaction.type == "dislike"
-    ).first()
-    
-    if existing_dislike:
-        db.delete(existing_dislike)
-        db.commit()
-    
-    # 좋아요 생성
-    reaction = models.Reaction(
-        user_id=current_user.id,
-        comment_id=comment_id,
-        type="like"
-    )
-    db.add(reaction)
-    db.commit()
-    db.refresh(reaction)
-    
-    return reaction
+    return _toggle_comment_reaction(db, comment, current_user, "like")
 
 
 @router.post("/{comment_id}/dislike", response_model=schemas.Reaction)
@@ -346,41 +445,7 @@ def dislike_comment(
     if comment.is_hidden:
         raise HTTPException(status_code=403, detail="Cannot dislike hidden comment")
     
-    # 이미 싫어요한 경우 확인
-    existing_dislike = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.comment_id == comment_id,
-        models.Reaction.type == "dislike"
-    ).first()
-    
-    if existing_dislike:
-        # 이미 싫어요한 경우 싫어요 취소
-        db.delete(existing_dislike)
-        db.commit()
-        return existing_dislike
-    
-    # 좋아요가 있는 경우 삭제
-    existing_like = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.comment_id == comment_id,
-        models.Reaction.type == "like"
-    ).first()
-    
-    if existing_like:
-        db.delete(existing_like)
-        db.commit()
-    
-    # 싫어요 생성
-    reaction = models.Reaction(
-        user_id=current_user.id,
-        comment_id=comment_id,
-        type="dislike"
-    )
-    db.add(reaction)
-    db.commit()
-    db.refresh(reaction)
-    
-    return reaction
+    return _toggle_comment_reaction(db, comment, current_user, "dislike")
 
 
 @router.post("/{comment_id}/report", response_model=schemas.Report)
@@ -398,57 +463,28 @@ def report_comment(
     if not comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    # 이미 신고한 경우 확인
-    existing_report = db.query(models.Report).filter(
-        models.Report.reporter_id == current_user.id,
-        models.Report.comment_id == comment_id
-    ).first()
-    
-    if existing_report:
-        raise HTTPException(status_code=400, detail="You have already reported this comment")
-    
-    # 신고 생성
-    report = models.Report(
-        reporter_id=current_user.id,
-        comment_id=comment_id,
-        reason=report_in.reason,
-        description=report_in.description,
-        status="pending"
+    # 신고 생성 + 신고 수 증가 (임계값 도달 시 같은 UPDATE에서 자동 숨김, 이미 신고했으면 None)
+    report, hidden = file_report(
+        db, current_user.id, comment, reason=report_in.reason, description=report_in.description
     )
-    db.add(report)
-    db.commit()
-    db.refresh(report)
-    
-    # 신고 횟수 확인
-    report_count = db.query(func.count(models.Report.id)).filter(
-        models.Report.comment_id == comment_id,
-        models.Report.status != "rejected"
-    ).scalar()
-    
-    # 신고 임계값 설정 가져오기
-    report_threshold = 3  # 기본값
-    threshold_setting = db.query(models.Setting).filter(models.Setting.key_name == "report_threshold").first()
-    if threshold_setting:
-        report_threshold = int(threshold_setting.value)
-    
-    # 신고 횟수가 임계값을 넘으면 자동으로 숨김 처리
-    if report_count >= report_threshold:
-        comment.is_hidden = True
-        db.add(comment)
-        db.commit()
+    if report is None:
+        raise HTTPException(status_code=400, detail="You have already reported this comment")
+    if hidden:
+        publish_comment_visibility(comment)
+    publish_report_created(db, report, comment, high_priority=hidden)
     
     return report
 
-@router.get("/{comment_id}/replies", response_model=List[schemas.CommentWithUser])
+@router.get("/{comment_id}/replies", response_model=schemas.CommentPage)
 def read_comment_replies(
     comment_id: int,
     db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 50,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
     current_user: Optional[models.User] = Depends(deps.get_optional_current_user),
 ) -> Any:
     """
-    특정 댓글의 답글 목록 조회
+    특정 댓글의 답글 목록 조회 (작성순, 커서 기반 페이지네이션)
     """
     # 댓글 존재 확인
     comment = db.query(models.Comment).filter(models.Comment.id == comment_id).first()
@@ -460,7 +496,7 @@ def read_comment_replies(
         raise HTTPException(status_code=403, detail="Comment is hidden")
     
     # 답글 가져오기 (parent_id가 comment_id인 댓글)
-    query = db.query(models.Comment).filter(
+    query = db.query(models.Comment).options(joinedload(models.Comment.user)).filter(
         models.Comment.parent_id == comment_id
     )
     
@@ -468,95 +504,165 @@ def read_comment_replies(
     if not current_user or (current_user.role != "admin" and current_user.role != "moderator"):
         query = query.filter(models.Comment.is_hidden == False)
     
-    # 최신순 정렬
-    query = query.order_by(models.Comment.created_at.desc())
+    # 커서 이후의 답글 (created_at, id 오름차순)
+    position = decode_cursor(cursor, 2)
+    if position:
+        query = query.filter(keyset_predicate(
+            [models.Comment.created_at, models.Comment.id],
+            [cursor_datetime(position[0]), cursor_int(position[1])],
+            descending=False
+        ))
     
-    # 페이지네이션
-    replies = query.offset(skip).limit(limit).all()
+    replies = query.order_by(models.Comment.created_at.asc(), models.Comment.id.asc()).limit(limit + 1).all()
+    has_more = len(replies) > limit
+    replies = replies[:limit]
+    
+    # 현재 사용자의 반응 상태 일괄 조회
+    reacted = _viewer_comment_reactions(db, [reply.id for reply in replies], current_user)
     
     # 결과 구성
-    result = []
+    items = []
     for reply in replies:
-        # 좋아요/싫어요 수 계산
-        like_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.comment_id == reply.id,
-            models.Reaction.type == "like"
-        ).scalar()
-        
-        dislike_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.comment_id == reply.id,
-            models.Reaction.type == "dislike"
-        ).scalar()
-        
-        # 답글 객체 생성
         reply_dict = {
             **schemas.Comment.model_validate(reply).model_dump(),
             "user": schemas.User.model_validate(reply.user),
-            "like_count": like_count,
-            "dislike_count": dislike_count
+            "liked_by_me": (reply.id, "like") in reacted,
+            "disliked_by_me": (reply.id, "dislike") in reacted
         }
-        result.append(schemas.CommentWithUser(**reply_dict))
+        items.append(schemas.CommentWithUser(**reply_dict))
     
-    return result
+    next_cursor = encode_cursor(replies[-1].created_at, replies[-1].id) if has_more else None
+    return {"items": items, "next_cursor": next_cursor}
 
-@router.get("/user/{user_id}", response_model=List[schemas.CommentWithUser])
+@router.get("/{comment_id}/subtree", response_model=schemas.CommentPage)
+def read_comment_subtree(
+    comment_id: int,
+    db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    max_depth: Optional[int] = Query(None, ge=0, le=MAX_COMMENT_DEPTH),
+    current_user: Optional[models.User] = Depends(deps.get_optional_current_user),
+) -> Any:
+    """
+    댓글과 그 하위 트리 전체를 표시 순서(구체화 경로 순)로 조회
+    (post_id, path) 인덱스 범위 스캔 한 번, cursor는 마지막 댓글의 경로
+    """
+    comment = db.query(models.Comment).filter(models.Comment.id == comment_id).first()
+    if not comment or not comment.path:
+        raise HTTPException(status_code=404, detail="Comment not found")
+    
+    is_moderator = current_user is not None and current_user.role in ["admin", "moderator"]
+    if comment.is_hidden and not is_moderator:
+        raise HTTPException(status_code=403, detail="Comment is hidden")
+    
+    # 하위 트리 = 같은 게시물에서 path가 "자신의 경로"로 시작하는 댓글
+    query = db.query(models.Comment).options(joinedload(models.Comment.user)).filter(
+        models.Comment.post_id == comment.post_id,
+        models.Comment.path >= comment.path,
+        models.Comment.path < comment.path + COMMENT_PATH_SEPARATOR + "~"
+    )
+    if max_depth is not None:
+        query = query.filter(models.Comment.depth <= comment.depth + max_depth)
+    
+    # 관리자/중재자가 아니면 숨겨진 댓글과 그 하위 댓글 제외 - 자신 또는 하위 트리 안의 조상 중
+    # 숨겨진 댓글이 있으면 제외 (LIMIT 전에 SQL에서 거르므로 페이지 경계와 무관)
+    if not is_moderator:
+        hidden = aliased(models.Comment)
+        query = query.filter(~db.query(hidden.id).filter(
+            hidden.post_id == comment.post_id,
+            hidden.is_hidden == True,
+            hidden.path >= comment.path,
+            hidden.path <= models.Comment.path,
+            or_(
+                hidden.path == models.Comment.path,
+                models.Comment.path.like(hidden.path + COMMENT_PATH_SEPARATOR + "%")
+            )
+        ).exists())
+    
+    position = decode_cursor(cursor, 1)
+    if position:
+        query = query.filter(models.Comment.path > cursor_str(position[0]))
+    
+    rows = query.order_by(models.Comment.path).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    
+    reacted = _viewer_comment_reactions(db, [row.id for row in rows], current_user)
+    
+    items = []
+    for row in rows:
+        comment_dict = {
+            **schemas.Comment.model_validate(row).model_dump(),
+            "user": schemas.User.model_validate(row.user),
+            "liked_by_me": (row.id, "like") in reacted,
+            "disliked_by_me": (row.id, "dislike") in reacted
+        }
+        items.append(schemas.CommentWithUser(**comment_dict))
+    
+    next_cursor = encode_cursor(rows[-1].path) if has_more else None
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.get("/user/{user_id}", response_model=schemas.CommentPage)
 def read_comments_by_user(
     user_id: int,
     db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
     skip: int = 0,
-    limit: int = 20,
+    limit: int = Query(20, ge=1, le=100),
     current_user: Optional[models.User] = Depends(deps.get_optional_current_user),
 ) -> Any:
     """
-    사용자가 작성한 댓글 목록 조회
+    사용자가 작성한 댓글 목록 조회 (최신순, cursor가 있으면 keyset 페이지네이션)
     """
     # 사용자 존재 확인
     user = db.query(models.User).filter(models.User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # 사용자의 댓글 조회
-    query = db.query(models.Comment).filter(models.Comment.user_id == user_id)
+    # 사용자의 댓글과 게시물 제목을 하나의 쿼리로 조회 (작성자는 위에서 조회한 사용자)
+    query = db.query(models.Comment, models.Post.title).outerjoin(
+        models.Post, models.Comment.post_id == models.Post.id
+    ).filter(models.Comment.user_id == user_id)
     
     # 관리자나 중재자가 아니고, 자신의 댓글이 아니면 숨겨진 댓글 제외
     if not current_user or (current_user.id != user_id and current_user.role not in ["admin", "moderator"]):
         query = query.filter(models.Comment.is_hidden == False)
     
-    # 최신순 정렬
-    query = query.order_by(models.Comment.created_at.desc())
+    # 커서 이전의 댓글 (created_at, id 내림차순)
+    position = decode_cursor(cursor, 2)
+    if position:
+        query = query.filter(keyset_predicate(
+            [models.Comment.created_at, models.Comment.id],
+            [cursor_datetime(position[0]), cursor_int(position[1])]
+        ))
     
-    # 페이지네이션
-    comments = query.offset(skip).limit(limit).all()
+    query = query.order_by(models.Comment.created_at.desc(), models.Comment.id.desc())
     
-    # 결과 구성
-    result = []
-    for comment in comments:
-        # 좋아요/싫어요 수 계산
-        like_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.comment_id == comment.id,
-            models.Reaction.type == "like"
-        ).scalar()
-        
-        dislike_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.comment_id == comment.id,
-            models.Reaction.type == "dislike"
-        ).scalar()
-        
-        # 게시물 제목 가져오기
-        post = db.query(models.Post).filter(models.Post.id == comment.post_id).first()
-        post_title = post.title if post else f"게시물 #{comment.post_id}"
-        
-        # 댓글 객체 생성
+    # 커서가 없으면 기존 offset 방식도 지원
+    if not position and skip:
+        query = query.offset(skip)
+    
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    
+    # 결과 구성 (좋아요/싫어요 수는 비정규화 컬럼)
+    author = schemas.User.model_validate(user)
+    items = []
+    for comment, post_title in rows:
         comment_dict = {
             **schemas.Comment.model_validate(comment).model_dump(),
-            "user": schemas.User.model_validate(comment.user),
-            "like_count": like_count,
-            "dislike_count": dislike_count,
-            "post_title": post_title  # 게시물 제목 추가
+            "user": author,
+            "post_title": post_title or f"게시물 #{comment.post_id}"  # 게시물 제목 추가
         }
-        result.append(schemas.CommentWithUser(**comment_dict))
+        items.append(schemas.CommentWithUser(**comment_dict))
     
-    return result
+    next_cursor = None
+    if has_more:
+        last_comment = rows[-1][0]
+        next_cursor = encode_cursor(last_comment.created_at, last_comment.id)
+    
+    return {"items": items, "next_cursor": next_cursor}
 
 @router.put("/{comment_id}/hide", response_model=schemas.Comment)
 def hide_comment(
@@ -596,6 +702,8 @@ def hide_comment(
     db.add(activity_log)
     db.commit()
     
+    publish_comment_visibility(comment)
+    
     return comment
 
 @router.put("/{comment_id}/unhide", response_model=schemas.Comment)
@@ -636,4 +744,6 @@ def unhide_comment(
     db.add(activity_log)
     db.commit()
     
+    publish_comment_visibility(comment)
+    
     return comment
\ No newline at end of file
@@ -1,10 +1,18 @@
-from typing import Any, List
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend import models, schemas
 from backend.api import deps
+from backend.core.config import settings
+from backend.core.pubsub import hub, sse_stream, SubscriberLimitExceeded
+from backend.database import SessionLocal
+from backend.utils.notifications import (
+    notification_topic, mark_notification_read, mark_all_notifications_read, remove_notification
+)
 
 router = APIRouter()
 
@@ -28,6 +36,103 @@ def read_notifications(
     return notifications
 
 
+def _notification_stream_user(token: Optional[str]) -> int:
+    """
+    구독 전 사용자 확인 - 사용자 id 반환
+    (스트림/롱 폴링이 열려 있는 동안 DB 연결을 잡지 않도록 직접 세션을 열고 닫음)
+    """
+    db = SessionLocal()
+    try:
+        current_user = deps.get_user_from_token(db, token)
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        if current_user.status != "active":
+            raise HTTPException(status_code=400, detail="Inactive user")
+        return current_user.id
+    finally:
+        db.close()
+
+
+def _unread_count(user_id: int) -> int:
+    db = SessionLocal()
+    try:
+        return db.query(models.User.unread_notification_count).filter(models.User.id == user_id).scalar() or 0
+    finally:
+        db.close()
+
+
+@router.get("/stream")
+async def stream_notifications(
+    token: Optional[str] = Query(None),  # EventSource는 헤더를 보낼 수 없으므로 쿼리로도 허용
+    header_token: Optional[str] = Depends(deps.oauth2_scheme_optional),
+) -> Any:
+    """
+    현재 사용자의 알림 실시간 스트림 (Server-Sent Events)
+    연결 직후 unread_count 이벤트로 읽지 않은 알림 수를 보내고, 이후 새 알림(notification),
+    읽음 처리(notifications_read), 삭제(notification_deleted)를 전달
+    resync 이벤트를 받으면 알림 목록과 읽지 않은 알림 수를 한 번 다시 조회
+    """
+    user_id = await run_in_threadpool(_notification_stream_user, header_token or token)
+    
+    try:
+        subscription = hub.subscribe(notification_topic(user_id))
+    except SubscriberLimitExceeded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    
+    # 구독한 뒤에 읽어야 그 사이에 생긴 알림이 수에 반영됨 (먼저 도착한 이벤트보다 뒤에 전달되어 최신 값이 됨)
+    try:
+        unread_count = await run_in_threadpool(_unread_count, user_id)
+    except Exception:
+        subscription.close()
+        raise
+    subscription.push({"event": "unread_count", "data": {"count": unread_count}})
+    
+    return StreamingResponse(
+        sse_stream(subscription, heartbeat=settings.SSE_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # 프록시 버퍼링 비활성화
+        },
+    )
+
+
+@router.get("/poll", response_model=dict)
+async def poll_notifications(
+    count: Optional[int] = None,  # 클라이언트가 알고 있는 읽지 않은 알림 수
+    timeout: int = Query(settings.NOTIFICATION_LONG_POLL_SECONDS, ge=1, le=60),
+    token: Optional[str] = Query(None),
+    header_token: Optional[str] = Depends(deps.oauth2_scheme_optional),
+) -> Any:
+    """
+    알림 롱 폴링 (SSE를 쓸 수 없는 클라이언트용)
+    읽지 않은 알림 수가 count와 다르면 바로, 아니면 이벤트가 오거나 timeout초가 지날 때까지 기다렸다가 응답
+    응답: {"count": 읽지 않은 알림 수, "events": [{"event": ..., "data": ...}]} - 다음 요청에 count를 그대로 전달
+    """
+    user_id = await run_in_threadpool(_notification_stream_user, header_token or token)
+    try:
+        subscription = hub.subscribe(notification_topic(user_id))
+    except SubscriberLimitExceeded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    
+    events = []
+    try:
+        # 먼저 구독한 뒤 현재 수를 읽어야 그 사이에 생긴 알림을 놓치지 않음
+        unread_count = await run_in_threadpool(_unread_count, user_id)
+        if count is not None and count != unread_count:
+            return {"count": unread_count, "events": events}
+        message = await subscription.get(timeout=timeout)
+        while message is not None:
+            events.append({"event": message["event"], "data": message["data"]})
+            message = None if subscription.queue.empty() else subscription.queue.get_nowait()
+    finally:
+        subscription.close()
+    
+    if events:
+        unread_count = await run_in_threadpool(_unread_count, user_id)
+    return {"count": unread_count, "events": events}
+
+
 @router.put("/{notification_id}/read", response_model=schemas.Notification)
 def mark_notification_as_read(
     *,
@@ -46,41 +151,27 @@ def mark_notification_as_read(
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
     
-    notification.is_read = True
-    db.add(notification)
+    # 읽지 않은 알림이었다면 읽지 않은 알림 수 감소
+    mark_notification_read(db, notification)
     db.commit()
     db.refresh(notification)
     
     return notification
 
 
-@router.put("/read-all", response_model=List[schemas.Notification])
+@router.put("/read-all", response_model=dict)
 def mark_all_notifications_as_read(
     db: Session = Depends(deps.get_db),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     모든 알림을 읽음 상태로 표시
+    (user_id, is_read, created_at) 인덱스를 타는 UPDATE 한 번, 읽음 처리된 알림 수만 반환
     """
-    notifications = db.query(models.Notification).filter(
-        models.Notification.user_id == current_user.id,
-        models.Notification.is_read == False
-    ).all()
-    
-    for notification in notifications:
-        notification.is_read = True
-        db.add(notification)
-    
+    updated = mark_all_notifications_read(db, current_user.id)
     db.commit()
     
-    # 업데이트된 알림 목록 반환
-    updated_notifications = db.query(models.Notification).filter(
-        models.Notification.user_id == current_user.id
-    ).order_by(
-        models.Notification.created_at.desc()
-    ).all()
-    
-    return updated_notifications
+    return {"updated": updated}
 
 
 @router.delete("/{notification_id}", response_model=schemas.Notification)
@@ -101,7 +192,7 @@ def delete_notification(
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
     
-    db.delete(notification)
+    remove_notification(db, notification)
     db.commit()
     
     return notification
@@ -113,10 +204,6 @@ def get_unread_count(
 ) -> Any:
     """
     읽지 않은 알림 개수 조회
+    인증 시 읽은 사용자 행의 비정규화 카운터를 그대로 반환 (알림 테이블 조회 없음)
     """
-    count = db.query(models.Notification).filter(
-        models.Notification.user_id == current_user.id,
-        models.Notification.is_read == False
-    ).count()
-    
-    return {"count": count}
\ No newline at end of file
+    return {"count": current_user.unread_notification_count}
\ No newline at end of file
@@ -4,11 +4,22 @@ import os
 
 from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_, and_
 
 from backend import models, schemas
 from backend.api import deps
+from backend.core.config import settings
+from backend.core.pubsub import hub, sse_stream, SubscriberLimitExceeded
+from backend.database import SessionLocal
+from backend.utils.comment_events import comment_topic, publish_post_hidden, POST_HIDDEN_EVENT
+from backend.models.reaction import REACTION_VALUES
+from backend.utils.reactions import set_reaction, delete_reaction, commit_reaction, read_viewer_reactions
+from backend.utils.counter_buffer import reaction_counter_buffer
+from backend.utils.pagination import encode_cursor, decode_cursor, cursor_int
+from backend.utils.revisions import record_post_revision, load_post_revision
 
 router = APIRouter()
 
@@ -133,17 +144,6 @@ def read_posts(
             models.Comment.is_hidden == False
         ).scalar()
         
-        # 좋아요/싫어요 수 계산
-        like_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.post_id == post.id,
-            models.Reaction.type == "like"
-        ).scalar()
-        
-        dislike_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.post_id == post.id,
-            models.Reaction.type == "dislike"
-        ).scalar()
-        
         # PostWithDetails 객체 생성
         post_dict = {
             **schemas.Post.model_validate(post).model_dump(),
@@ -152,8 +152,8 @@ def read_posts(
             "category": schemas.Category.model_validate(post.category) if post.category else None,
             "images": [schemas.PostImage.model_validate(image) for image in post.images],
             "comment_count": comment_count,
-            "like_count": like_count,
-            "dislike_count": dislike_count
+            "like_count": post.like_count,
+            "dislike_count": post.dislike_count
         }
         result.append(schemas.PostWithDetails(**post_dict))
     
@@ -175,6 +175,11 @@ def create_post(
         user_id=current_user.id
     )
     db.add(post)
+    db.flush()
+    
+    # 최초 리비전 (전체 스냅샷)을 게시물과 같은 트랜잭션에서 기록
+    record_post_revision(db, post, current_user.id)
+    
     db.commit()
     db.refresh(post)
     
@@ -230,21 +235,8 @@ def search_posts(
     elif sort == "views":
         query = query.order_by(models.Post.view_count.desc())
     elif sort == "likes":
-        # 좋아요 수로 정렬 (서브쿼리 사용)
-        like_count = db.query(
-            models.Post.id,
-            func.count(models.Reaction.id).label("like_count")
-        ).outerjoin(
-            models.Reaction, 
-            and_(
-                models.Reaction.post_id == models.Post.id,
-                models.Reaction.type == "like"
-            )
-        ).group_by(models.Post.id).subquery()
-        
-        query = query.outerjoin(
-            like_count, models.Post.id == like_count.c.id
-        ).order_by(like_count.c.like_count.desc(), models.Post.created_at.desc())
+        # 좋아요 수로 정렬 (비정규화 카운터)
+        query = query.order_by(models.Post.like_count.desc(), models.Post.created_at.desc())
     elif sort == "comments":
         # 댓글 수로 정렬 (서브쿼리 사용)
         comment_count = db.query(
@@ -275,17 +267,6 @@ def search_posts(
             models.Comment.is_hidden == False
         ).scalar()
         
-        # 좋아요/싫어요 수 계산
-        like_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.post_id == post.id,
-            models.Reaction.type == "like"
-        ).scalar()
-        
-        dislike_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.post_id == post.id,
-            models.Reaction.type == "dislike"
-        ).scalar()
-        
         # PostWithDetails 객체 생성
         post_dict = {
             **schemas.Post.model_validate(post).model_dump(),
@@ -294,8 +275,8 @@ def search_posts(
             "category": schemas.Category.model_validate(post.category) if post.category else None,
             "images": [schemas.PostImage.model_validate(image) for image in post.images],
             "comment_count": comment_count,
-            "like_count": like_count,
-            "dislike_count": dislike_count
+            "like_count": post.like_count,
+            "dislike_count": post.dislike_count
         }
         result.append(schemas.PostWithDetails(**post_dict))
     
@@ -374,32 +355,17 @@ def read_post(
         models.Comment.is_hidden == False
     ).scalar()
     
-    # 좋아요/싫어요 수 계산
-    like_count = db.query(func.count(models.Reaction.id)).filter(
-        models.Reaction.post_id == post.id,
-        models.Reaction.type == "like"
-    ).scalar()
-    
-    dislike_count = db.query(func.count(models.Reaction.id)).filter(
-        models.Reaction.post_id == post.id,
-        models.Reaction.type == "dislike"
-    ).scalar()
-    
     # 현재 사용자의 반응 상태 확인 (로그인한 경우만)
     liked_by_me = False
     disliked_by_me = False
     if current_user:
-        liked_by_me = db.query(models.Reaction).filter(
-            models.Reaction.post_id == post.id,
-            models.Reaction.user_id == current_user.id,
-            models.Reaction.type == "like"
-        ).first() is not None
-        
-        disliked_by_me = db.query(models.Reaction).filter(
-            models.Reaction.post_id == post.id,
-            models.Reaction.user_id == current_user.id,
-            models.Reaction.type == "dislike"
-        ).first() is not None
+        # 사용자/게시물당 반응은 한 행 - 유니크 키 조회 한 번으로 좋아요/싫어요 여부를 함께 확인
+        my_reaction = read_viewer_reactions(db, "post", [post.id], current_user.id)[post.id]
+        liked_by_me = my_reaction == "like"
+        disliked_by_me = my_reaction == "dislike"
+    
+    # 아직 반영되지 않은 반응 수 증감 (쓰기 병합 버퍼)
+    pending_likes, pending_dislikes = reaction_counter_buffer.pending("post", post.id)
     
     # PostWithDetails 객체 생성
     post_dict = {
@@ -409,14 +375,73 @@ def read_post(
         "category": schemas.Category.model_validate(post.category) if post.category else None,
         "images": [schemas.PostImage.model_validate(image) for image in post.images],
         "comment_count": comment_count,
-        "like_count": like_count,
-        "dislike_count": dislike_count,
+        "like_count": post.like_count + pending_likes,
+        "dislike_count": post.dislike_count + pending_dislikes,
         "liked_by_me": liked_by_me,
         "disliked_by_me": disliked_by_me
     }
     
     return schemas.PostWithDetails(**post_dict)
 
+def _check_comment_stream_access(post_id: int, token: Optional[str]) -> bool:
+    """
+    스트림 구독 전 게시물 확인 (스트림이 열려 있는 동안 DB 연결을 잡지 않도록 직접 세션을 열고 닫음)
+    반환: 관리자/중재자 여부 (게시물이 숨겨진 뒤에도 스트림을 유지할지)
+    """
+    db = SessionLocal()
+    try:
+        post = db.query(models.Post).filter(models.Post.id == post_id).first()
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+        
+        current_user = deps.get_user_from_token(db, token)
+        is_moderator = current_user is not None and current_user.role in ["admin", "moderator"]
+        
+        # 숨겨진 게시물은 관리자나 중재자만 구독 가능
+        if post.is_hidden and not is_moderator:
+            raise HTTPException(status_code=403, detail="Post is hidden")
+        return is_moderator
+    finally:
+        db.close()
+
+
+@router.get("/{post_id}/comments/stream")
+async def stream_post_comments(
+    post_id: int,
+    token: Optional[str] = Query(None),  # EventSource는 헤더를 보낼 수 없으므로 쿼리로도 허용
+    header_token: Optional[str] = Depends(deps.oauth2_scheme_optional),
+) -> Any:
+    """
+    게시물 댓글 실시간 스트림 (Server-Sent Events)
+    댓글 작성/수정/삭제, 숨김 상태, 좋아요/싫어요 수 변경을 전달
+    resync 이벤트를 받으면 댓글 목록을 한 번 다시 조회
+    게시물이 숨겨지면 관리자/중재자가 아닌 구독자의 스트림은 post_hidden 이벤트 뒤에 닫힘
+    """
+    try:
+        subscription = hub.subscribe(comment_topic(post_id))
+    except SubscriberLimitExceeded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    
+    # 구독한 뒤에 확인해야 확인과 구독 사이에 게시물이 숨겨져도 post_hidden 이벤트를 놓치지 않음
+    try:
+        is_moderator = await run_in_threadpool(_check_comment_stream_access, post_id, header_token or token)
+    except HTTPException:
+        subscription.close()
+        raise
+    
+    return StreamingResponse(
+        sse_stream(
+            subscription,
+            heartbeat=settings.SSE_HEARTBEAT_SECONDS,
+            close_on=() if is_moderator else (POST_HIDDEN_EVENT,)
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # 프록시 버퍼링 비활성화
+        },
+    )
+
 @router.post("/{post_id}/like", response_model=dict)
 def like_post(
     *,
@@ -425,48 +450,21 @@ def like_post(
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    게시물에 좋아요 추가
+    게시물에 좋아요 추가 (싫어요가 있으면 함께 취소)
     """
     # 게시물 존재 확인
     post = db.query(models.Post).filter(models.Post.id == post_id).first()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    # 이미 같은 타입의 반응이 있는지 확인
-    existing_reaction = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "like"
-    ).first()
+    # 반대 반응 삭제 + 좋아요 추가 (유니크 키 기반, 동시 요청에도 안전)
+    likes, dislikes = set_reaction(db, current_user.id, "post", post_id, "like")
     
-    # 이미 좋아요가 있으면 409 Conflict 반환
-    if existing_reaction:
+    # 이미 좋아요가 있으면 409 Conflict 반환 (트랜잭션은 커밋하지 않음)
+    if likes == 0:
         raise HTTPException(status_code=409, detail="You already liked this post")
     
-    # 반대 반응(싫어요)이 있으면 삭제
-    opposite_reaction = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "dislike"
-    ).first()
-    
-    if opposite_reaction:
-        db.delete(opposite_reaction)
-    
-    # 새 좋아요 반응 생성
-    reaction = models.Reaction(
-        user_id=current_user.id,
-        post_id=post_id,
-        type="like"
-    )
-    db.add(reaction)
-    db.commit()
-    
-    # 좋아요 수 계산
-    like_count = db.query(func.count(models.Reaction.id)).filter(
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "like"
-    ).scalar()
+    like_count, _ = commit_reaction(db, "post", post_id, likes=likes, dislikes=dislikes, user_id=current_user.id)
     
     return {"like_count": like_count}
 
@@ -486,26 +484,12 @@ def unlike_post(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    # 좋아요 반응 찾기
-    reaction = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "like"
-    ).first()
-    
-    # 좋아요가 없으면 404 반환
-    if not reaction:
+    # 좋아요 삭제 - 없으면 404 반환
+    removed = delete_reaction(db, current_user.id, "post", post_id, "like")
+    if not removed:
         raise HTTPException(status_code=404, detail="You haven't liked this post")
     
-    # 좋아요 삭제
-    db.delete(reaction)
-    db.commit()
-    
-    # 좋아요 수 계산
-    like_count = db.query(func.count(models.Reaction.id)).filter(
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "like"
-    ).scalar()
+    like_count, _ = commit_reaction(db, "post", post_id, likes=-removed, user_id=current_user.id)
     
     return {"like_count": like_count}
 
@@ -518,48 +502,21 @@ def dislike_post(
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    게시물에 싫어요 추가
+    게시물에 싫어요 추가 (좋아요가 있으면 함께 취소)
     """
     # 게시물 존재 확인
     post = db.query(models.Post).filter(models.Post.id == post_id).first()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    # 이미 같은 타입의 반응이 있는지 확인
-    existing_reaction = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "dislike"
-    ).first()
+    # 반대 반응 삭제 + 싫어요 추가 (유니크 키 기반, 동시 요청에도 안전)
+    likes, dislikes = set_reaction(db, current_user.id, "post", post_id, "dislike")
     
-    # 이미 싫어요가 있으면 409 Conflict 반환
-    if existing_reaction:
+    # 이미 싫어요가 있으면 409 Conflict 반환 (트랜잭션은 커밋하지 않음)
+    if dislikes == 0:
         raise HTTPException(status_code=409, detail="You already disliked this post")
     
-    # 반대 반응(좋아요)이 있으면 삭제
-    opposite_reaction = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "like"
-    ).first()
-    
-    if opposite_reaction:
-        db.delete(opposite_reaction)
-    
-    # 새 싫어요 반응 생성
-    reaction = models.Reaction(
-        user_id=current_user.id,
-        post_id=post_id,
-        type="dislike"
-    )
-    db.add(reaction)
-    db.commit()
-    
-    # 싫어요 수 계산
-    dislike_count = db.query(func.count(models.Reaction.id)).filter(
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "dislike"
-    ).scalar()
+    _, dislike_count = commit_reaction(db, "post", post_id, likes=likes, dislikes=dislikes, user_id=current_user.id)
     
     return {"dislike_count": dislike_count}
 
@@ -579,26 +536,12 @@ def undislike_post(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    # 싫어요 반응 찾기
-    reaction = db.query(models.Reaction).filter(
-        models.Reaction.user_id == current_user.id,
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "dislike"
-    ).first()
-    
-    # 싫어요가 없으면 404 반환
-    if not reaction:
+    # 싫어요 삭제 - 없으면 404 반환
+    removed = delete_reaction(db, current_user.id, "post", post_id, "dislike")
+    if not removed:
         raise HTTPException(status_code=404, detail="You haven't disliked this post")
     
-    # 싫어요 삭제
-    db.delete(reaction)
-    db.commit()
-    
-    # 싫어요 수 계산
-    dislike_count = db.query(func.count(models.Reaction.id)).filter(
-        models.Reaction.post_id == post_id,
-        models.Reaction.type == "dislike"
-    ).scalar()
+    _, dislike_count = commit_reaction(db, "post", post_id, dislikes=-removed, user_id=current_user.id)
     
     return {"dislike_count": dislike_count}
 
@@ -648,8 +591,8 @@ def update_post(
     """
     게시물 수정
     """
-    # 게시물 존재 확인
-    post = db.query(models.Post).filter(models.Post.id == post_id).first()
+    # 게시물 존재 확인 (수정 이력이 어긋나지 않도록 같은 게시물의 동시 수정은 행 잠금으로 직렬화)
+    post = db.query(models.Post).filter(models.Post.id == post_id).with_for_update().first()
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
@@ -659,14 +602,22 @@ def update_post(
     
     # 업데이트할 데이터 준비
     update_data = post_in.model_dump(exclude_unset=True)
+    previous = (post.title, post.content)
+    was_hidden = post.is_hidden
     
     # 게시물 업데이트
     for field, value in update_data.items():
         setattr(post, field, value)
     
+    # 제목/본문이 바뀐 경우 수정 이력 기록 (같은 트랜잭션)
+    record_post_revision(db, post, current_user.id, previous=previous)
+    
     db.commit()
     db.refresh(post)
     
+    if post.is_hidden and not was_hidden:
+        publish_post_hidden(post.id)
+    
     # 활동 로그 기록
     activity_log = models.ActivityLog(
         user_id=current_user.id,
@@ -679,6 +630,83 @@ def update_post(
     
     return post
 
+@router.get("/{post_id}/revisions", response_model=schemas.PostRevisionPage)
+def read_post_revisions(
+    *,
+    db: Session = Depends(deps.get_db),
+    post_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    게시물 수정 이력 목록 조회 (작성자 또는 관리자/중재자만 가능)
+    최신 리비전부터 메타데이터만 반환 (본문은 GET /posts/{post_id}/revisions/{revision}으로 조회)
+    cursor: 이전 응답의 next_cursor
+    """
+    post = db.query(models.Post).filter(models.Post.id == post_id).first()
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    
+    if post.user_id != current_user.id and current_user.role not in ["admin", "moderator"]:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    query = db.query(
+        models.PostRevision.revision,
+        models.PostRevision.is_snapshot,
+        models.PostRevision.editor_id,
+        models.PostRevision.created_at
+    ).filter(models.PostRevision.post_id == post_id)
+    
+    position = decode_cursor(cursor, 1)
+    if position:
+        query = query.filter(models.PostRevision.revision < cursor_int(position[0]))
+    
+    rows = query.order_by(models.PostRevision.revision.desc()).limit(limit + 1).all()
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].revision)
+    
+    return {
+        "items": [schemas.PostRevisionSummary.model_validate(row) for row in rows],
+        "next_cursor": next_cursor
+    }
+
+
+@router.get("/{post_id}/revisions/{revision}", response_model=schemas.PostRevision)
+def read_post_revision(
+    *,
+    db: Session = Depends(deps.get_db),
+    post_id: int,
+    revision: int,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    게시물의 특정 리비전 조회 (작성자 또는 관리자/중재자만 가능)
+    """
+    post = db.query(models.Post).filter(models.Post.id == post_id).first()
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    
+    if post.user_id != current_user.id and current_user.role not in ["admin", "moderator"]:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    loaded = load_post_revision(db, post_id, revision)
+    if not loaded:
+        raise HTTPException(status_code=404, detail="Revision not found")
+    
+    post_revision, title, content = loaded
+    return schemas.PostRevision(
+        revision=post_revision.revision,
+        is_snapshot=post_revision.is_snapshot,
+        editor_id=post_revision.editor_id,
+        title=title,
+        content=content,
+        created_at=post_revision.created_at
+    )
+
 @router.get("/liked-by/{user_id}", response_model=List[schemas.PostWithDetails])
 def read_liked_posts_by_user(
     *,
@@ -699,7 +727,7 @@ def read_liked_posts_by_user(
     # 사용자가 좋아요한 게시물 ID 목록 조회
     liked_post_ids = db.query(models.Reaction.post_id).filter(
         models.Reaction.user_id == user_id,
-        models.Reaction.type == "like",
+        models.Reaction.value == REACTION_VALUES["like"],
         models.Reaction.post_id.isnot(None)  # post_id가 NULL이 아닌 경우만
     ).all()
     
@@ -732,17 +760,6 @@ def read_liked_posts_by_user(
             models.Comment.is_hidden == False
         ).scalar()
         
-        # 좋아요/싫어요 수 계산
-        like_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.post_id == post.id,
-            models.Reaction.type == "like"
-        ).scalar()
-        
-        dislike_count = db.query(func.count(models.Reaction.id)).filter(
-            models.Reaction.post_id == post.id,
-            models.Reaction.type == "dislike"
-        ).scalar()
-        
         # PostWithDetails 객체 생성
         post_dict = {
             **schemas.Post.model_validate(post).model_dump(),
@@ -751,8 +768,8 @@ def read_liked_posts_by_user(
             "category": schemas.Category.model_validate(post.category) if post.category else None,
             "images": [schemas.PostImage.model_validate(image) for image in post.images],
             "comment_count": comment_count,
-            "like_count": like_count,
-            "dislike_count": dislike_count
+            "like_count": post.like_count,
+            "dislike_count": post.dislike_count
         }
         result.append(schemas.PostWithDetails(**post_dict))
     
@@ -0,0 +1,88 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+from backend.api import deps
+from backend.utils.comment_events import publish_comment_reactions
+from backend.utils.reactions import REACTION_TYPES, set_reaction, commit_reaction, read_viewer_reactions
+
+router = APIRouter()
+
+# 한 번에 조회할 수 있는 대상 종류별 최대 id 수
+MAX_REACTION_LOOKUP = 500
+
+
+@router.put("/", response_model=schemas.ReactionState)
+def put_reaction(
+    *,
+    db: Session = Depends(deps.get_db),
+    reaction_in: schemas.ReactionSet,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    게시물/댓글에 대한 내 반응을 like, dislike 또는 None(취소)으로 설정
+    같은 요청을 여러 번 보내도 결과가 같으며(멱등), 대상의 최신 반응 수를 함께 반환
+    """
+    if (reaction_in.post_id is None) == (reaction_in.comment_id is None):
+        raise HTTPException(status_code=400, detail="Exactly one of post_id or comment_id must be provided")
+
+    if reaction_in.type is not None and reaction_in.type not in REACTION_TYPES:
+        raise HTTPException(status_code=400, detail="Reaction type must be 'like', 'dislike' or null")
+
+    # 대상 확인
+    if reaction_in.post_id is not None:
+        target_type, target_id = "post", reaction_in.post_id
+        target = db.query(models.Post).filter(models.Post.id == target_id).first()
+        if not target:
+            raise HTTPException(status_code=404, detail="Post not found")
+    else:
+        target_type, target_id = "comment", reaction_in.comment_id
+        target = db.query(models.Comment).filter(models.Comment.id == target_id).first()
+        if not target:
+            raise HTTPException(status_code=404, detail="Comment not found")
+
+    # 숨겨진 대상에는 새 반응을 남길 수 없음 (취소는 허용)
+    if target.is_hidden and reaction_in.type is not None:
+        raise HTTPException(status_code=403, detail=f"Cannot react to hidden {target_type}")
+
+    likes, dislikes = set_reaction(db, current_user.id, target_type, target_id, reaction_in.type)
+    like_count, dislike_count = commit_reaction(
+        db, target_type, target_id, likes=likes, dislikes=dislikes, user_id=current_user.id
+    )
+
+    if target_type == "comment" and (likes or dislikes):
+        publish_comment_reactions(target)
+
+    return {
+        "post_id": reaction_in.post_id,
+        "comment_id": reaction_in.comment_id,
+        "type": reaction_in.type,
+        "like_count": like_count,
+        "dislike_count": dislike_count
+    }
+
+
+@router.post("/mine", response_model=schemas.ReactionLookupResult)
+def read_my_reactions(
+    *,
+    db: Session = Depends(deps.get_db),
+    lookup_in: schemas.ReactionLookup,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    여러 게시물/댓글에 대한 내 반응을 한 번에 조회
+    대상 종류별로 (user_id, 대상 id) 유니크 인덱스를 타는 IN 쿼리 한 번씩
+    """
+    if len(lookup_in.post_ids) > MAX_REACTION_LOOKUP or len(lookup_in.comment_ids) > MAX_REACTION_LOOKUP:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_REACTION_LOOKUP} post_ids and {MAX_REACTION_LOOKUP} comment_ids are allowed")
+
+    result = {}
+    for key, target_type, ids in (
+        ("posts", "post", lookup_in.post_ids),
+        ("comments", "comment", lookup_in.comment_ids),
+    ):
+        result[key] = read_viewer_reactions(db, target_type, ids, current_user.id)
+
+    return result
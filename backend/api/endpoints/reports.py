@@ -1,26 +1,47 @@
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
 from backend import models, schemas
 from backend.api import deps
+from backend.core.config import settings
+from backend.core.pubsub import hub, sse_stream, SubscriberLimitExceeded
+from backend.database import SessionLocal
+from backend.utils.comment_events import publish_comment_visibility, publish_post_hidden
+from backend.utils.report_events import MODERATION_TOPIC, publish_report_created, publish_reports_reviewed
+from backend.utils.reports import file_report, change_report_status, adjust_report_counts
+from backend.utils.moderation_queue import refresh_queue, record_reporter_outcomes
+from backend.utils.sanctions import record_upheld_reports
+from backend.utils.notifications import create_notification, create_notifications
+from backend.utils.pagination import encode_cursor, decode_cursor, cursor_datetime, cursor_int, keyset_predicate
 
 router = APIRouter()
 
+# 일괄 처리 동작별 신고 상태
+BULK_REPORT_STATUSES = {"approve": "reviewed", "reject": "rejected"}
+
+# 한 번에 처리할 수 있는 최대 신고 수
+MAX_BULK_REPORTS = 500
+
 
 @router.get("/")#response_model=List[schemas.Report]
 def read_reports(
     db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
     skip: int = 0,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=100),
     status: Optional[str] = None,
     type: Optional[str] = None,  # 추가: 게시물/댓글 필터링
+    with_total: bool = False,
     current_user: models.User = Depends(deps.get_optional_current_user),
 ) -> Any:
     """
     신고 목록 조회 (관리자/중재자만 가능)
+    최신순, cursor가 있으면 (status, created_at, id) 인덱스를 타는 keyset 페이지네이션
+    total은 offset 방식(cursor 없음)에서 with_total=true로 요청할 때만 계산 (그 외에는 null)
     """
     # if current_user.role not in ["admin", "moderator"]:
     #     raise HTTPException(status_code=403, detail="Not enough permissions")
@@ -37,40 +58,186 @@ def read_reports(
     elif type == "comment":
         query = query.filter(models.Report.comment_id.isnot(None))
     
-    # 최신순 정렬
-    query = query.order_by(models.Report.created_at.desc())
+    # 전체 개수는 COUNT 전체 스캔이므로 offset 방식에서 요청한 경우에만 계산 (커서 방식은 next_cursor로 이어서 조회)
+    position = decode_cursor(cursor, 2)
+    total = query.count() if with_total and not position else None
+    
+    # 커서 이전의 신고 (created_at, id 내림차순)
+    if position:
+        query = query.filter(keyset_predicate(
+            [models.Report.created_at, models.Report.id],
+            [cursor_datetime(position[0]), cursor_int(position[1])]
+        ))
     
-    # 페이지네이션
-    total = query.count()
-    reports = query.offset(skip).limit(limit).all()
+    # 최신순 정렬
+    query = query.order_by(models.Report.created_at.desc(), models.Report.id.desc())
+    
+    # 커서가 없으면 기존 offset 방식도 지원
+    if not position and skip:
+        query = query.offset(skip)
+    
+    reports = query.limit(limit + 1).all()
+    has_more = len(reports) > limit
+    reports = reports[:limit]
+    
+    # 관련 게시물/댓글과 신고자/처리자 이름을 대상별 IN 쿼리 한 번씩으로 조회
+    post_ids = {report.post_id for report in reports if report.post_id}
+    comment_ids = {report.comment_id for report in reports if report.comment_id}
+    user_ids = {report.reporter_id for report in reports} | {report.reviewed_by for report in reports if report.reviewed_by}
+    
+    posts = {
+        post.id: post
+        for post in db.query(models.Post).filter(models.Post.id.in_(post_ids)).all()
+    } if post_ids else {}
+    comments = {
+        comment.id: comment
+        for comment in db.query(models.Comment).filter(models.Comment.id.in_(comment_ids)).all()
+    } if comment_ids else {}
+    usernames = dict(
+        db.query(models.User.id, models.User.username).filter(models.User.id.in_(user_ids)).all()
+    ) if user_ids else {}
     
-    # 관련 게시물 및 댓글 정보 포함
     result = []
     for report in reports:
-        report_dict = schemas.Report.from_orm(report).dict()
+        report_dict = schemas.Report.model_validate(report).model_dump()
+        report_dict["reporter_username"] = usernames.get(report.reporter_id)
+        report_dict["reviewer_username"] = usernames.get(report.reviewed_by)
         
         # 게시물 정보 추가
-        if report.post_id:
-            post = db.query(models.Post).filter(models.Post.id == report.post_id).first()
-            if post:
-                report_dict["post"] = schemas.Post.from_orm(post).dict()
+        post = posts.get(report.post_id)
+        if post:
+            report_dict["post"] = schemas.Post.model_validate(post).model_dump()
         
         # 댓글 정보 추가
-        if report.comment_id:
-            comment = db.query(models.Comment).filter(models.Comment.id == report.comment_id).first()
-            if comment:
-                report_dict["comment"] = schemas.Comment.from_orm(comment).dict()
+        comment = comments.get(report.comment_id)
+        if comment:
+            report_dict["comment"] = schemas.Comment.model_validate(comment).model_dump()
         
         result.append(report_dict)
     
+    next_cursor = encode_cursor(reports[-1].created_at, reports[-1].id) if has_more else None
+    
     return {
         "items": result,
         "total": total,
         "page": skip // limit + 1,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor
     }
 
 
+def _check_moderator_stream_access(token: Optional[str]) -> None:
+    """
+    스트림 구독 전 권한 확인 (스트림이 열려 있는 동안 DB 연결을 잡지 않도록 직접 세션을 열고 닫음)
+    """
+    db = SessionLocal()
+    try:
+        current_user = deps.get_user_from_token(db, token)
+        if not current_user:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+        if current_user.status != "active":
+            raise HTTPException(status_code=400, detail="Inactive user")
+        if current_user.role not in ["admin", "moderator"]:
+            raise HTTPException(status_code=403, detail="Not enough permissions")
+    finally:
+        db.close()
+
+
+@router.get("/stream")
+async def stream_reports(
+    token: Optional[str] = Query(None),  # EventSource는 헤더를 보낼 수 없으므로 쿼리로도 허용
+    header_token: Optional[str] = Depends(deps.oauth2_scheme_optional),
+) -> Any:
+    """
+    중재자용 신고 실시간 스트림 (Server-Sent Events, 관리자/중재자만 가능)
+    새 신고(report_created, 자동 숨김 임계값 도달 시 high_priority)와 신고 상태 변경(reports_reviewed)을 전달
+    resync 이벤트를 받으면 신고 목록/처리 대기열을 한 번 다시 조회
+    """
+    await run_in_threadpool(_check_moderator_stream_access, header_token or token)
+    
+    try:
+        subscription = hub.subscribe(MODERATION_TOPIC)
+    except SubscriberLimitExceeded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    
+    return StreamingResponse(
+        sse_stream(subscription, heartbeat=settings.SSE_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # 프록시 버퍼링 비활성화
+        },
+    )
+
+
+@router.get("/queue", response_model=schemas.ModerationQueuePage)
+def read_moderation_queue(
+    db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    type: Optional[str] = None,  # "post" 또는 "comment"
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    신고 처리 대기열 (관리자/중재자만 가능)
+    대기 중인 신고가 있는 게시물/댓글마다 한 항목, 신고자 처리 이력으로 가중한 점수(priority) -> 최근 신고 순
+    """
+    if current_user.role not in ["admin", "moderator"]:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    Entry = models.ModerationQueueEntry
+    query = db.query(Entry)
+    
+    if type == "post":
+        query = query.filter(Entry.post_id.isnot(None))
+    elif type == "comment":
+        query = query.filter(Entry.comment_id.isnot(None))
+    
+    # 커서 이후 항목 (priority, last_reported_at, id 내림차순)
+    position = decode_cursor(cursor, 3)
+    if position:
+        query = query.filter(keyset_predicate(
+            [Entry.priority, Entry.last_reported_at, Entry.id],
+            [cursor_int(position[0]), cursor_datetime(position[1]), cursor_int(position[2])]
+        ))
+    
+    entries = query.order_by(
+        Entry.priority.desc(), Entry.last_reported_at.desc(), Entry.id.desc()
+    ).limit(limit + 1).all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    
+    # 대상 게시물/댓글을 종류별 IN 쿼리 한 번씩으로 조회
+    post_ids = {entry.post_id for entry in entries if entry.post_id}
+    comment_ids = {entry.comment_id for entry in entries if entry.comment_id}
+    posts = {
+        post.id: post
+        for post in db.query(models.Post).filter(models.Post.id.in_(post_ids)).all()
+    } if post_ids else {}
+    comments = {
+        comment.id: comment
+        for comment in db.query(models.Comment).filter(models.Comment.id.in_(comment_ids)).all()
+    } if comment_ids else {}
+    
+    items = []
+    for entry in entries:
+        item = schemas.ModerationQueueItem.model_validate(entry).model_dump()
+        post = posts.get(entry.post_id)
+        if post:
+            item["post"] = schemas.Post.model_validate(post).model_dump()
+        comment = comments.get(entry.comment_id)
+        if comment:
+            item["comment"] = schemas.Comment.model_validate(comment).model_dump()
+        items.append(item)
+    
+    next_cursor = None
+    if has_more:
+        last = entries[-1]
+        next_cursor = encode_cursor(last.priority, last.last_reported_at, last.id)
+    
+    return {"items": items, "next_cursor": next_cursor}
+
+
 @router.get("/{report_id}", response_model=schemas.Report)
 def read_report(
     report_id: int,
@@ -108,13 +275,12 @@ def update_report(
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
-    # 신고 상태 업데이트
-    report.status = report_in.status
-    report.reviewed_by = current_user.id
-    
-    db.add(report)
+    # 신고 상태 업데이트 (거부 여부가 바뀌면 대상의 신고 수 조정)
+    changed = change_report_status(db, report, report_in.status, current_user.id)
     db.commit()
     db.refresh(report)
+    if changed:
+        publish_reports_reviewed([report.id], report.status)
     
     # 활동 로그 기록
     activity_log = models.ActivityLog(
@@ -126,14 +292,14 @@ def update_report(
     db.add(activity_log)
     db.commit()
     
-    # 신고자에게 알림 생성
-    notification = models.Notification(
+    # 신고자에게 알림 생성 (읽지 않은 알림 수 증가)
+    create_notification(
+        db,
         user_id=report.reporter_id,
         type="report_status",
         content=f"Your report has been {report.status}.",
         related_id=report.id
     )
-    db.add(notification)
     db.commit()
     
     return report
@@ -162,58 +328,19 @@ def create_report(
     else:
         raise HTTPException(status_code=400, detail="Either post_id or comment_id must be provided")
     
-    # 신고 객체 생성
-    report = models.Report(
-        reporter_id=current_user.id,
-        post_id=report_in.post_id,
-        comment_id=report_in.comment_id,
-        reason=report_in.reason,
-        description=report_in.description,
-        status="pending"
+    # 신고 생성 + 신고 수 증가 (임계값 도달 시 같은 UPDATE에서 자동 숨김, 이미 신고했으면 None)
+    report, hidden = file_report(
+        db, current_user.id, post if report_in.post_id else comment,
+        reason=report_in.reason, description=report_in.description
     )
-    
-    db.add(report)
-    db.commit()
-    db.refresh(report)
-    
-    # 자동 숨김 처리 로직
-    # 1. 설정값 조회
-    auto_hide_threshold_setting = db.query(models.Setting).filter(
-        models.Setting.key_name == "report.autoHideThreshold"
-    ).first()
-    
-    if auto_hide_threshold_setting:
-        try:
-            auto_hide_threshold = int(auto_hide_threshold_setting.value)
-            
-            # 2. 해당 게시물/댓글의 총 신고 수 확인
-            if report_in.post_id:
-                # 게시물에 대한 신고 수 계산
-                total_reports = db.query(func.count(models.Report.id)).filter(
-                    models.Report.post_id == report_in.post_id
-                ).scalar()
-                
-                # 임계값 도달 시 게시물 숨김 처리
-                if total_reports >= auto_hide_threshold:
-                    post.is_hidden = True
-                    db.add(post)
-                    db.commit()
-                    
-            elif report_in.comment_id:
-                # 댓글에 대한 신고 수 계산
-                total_reports = db.query(func.count(models.Report.id)).filter(
-                    models.Report.comment_id == report_in.comment_id
-                ).scalar()
-                
-                # 임계값 도달 시 댓글 숨김 처리
-                if total_reports >= auto_hide_threshold:
-                    comment.is_hidden = True
-                    db.add(comment)
-                    db.commit()
-                    
-        except ValueError:
-            # 설정값이 숫자가 아닌 경우 무시
-            pass
+    if report is None:
+        target_type = "post" if report_in.post_id else "comment"
+        raise HTTPException(status_code=400, detail=f"You have already reported this {target_type}")
+    if hidden and report_in.comment_id:
+        publish_comment_visibility(comment)
+    elif hidden:
+        publish_post_hidden(post.id)
+    publish_report_created(db, report, post if report_in.post_id else comment, high_priority=hidden)
     
     # 활동 로그 기록
     activity_log = models.ActivityLog(
@@ -227,6 +354,133 @@ def create_report(
     
     return report
 
+@router.post("/bulk", response_model=schemas.ReportBulkResult)
+def bulk_moderate_reports(
+    *,
+    db: Session = Depends(deps.get_db),
+    bulk_in: schemas.ReportBulkAction,
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    여러 신고를 한 번에 승인/거부 (관리자/중재자만 가능)
+    상태 변경, 콘텐츠 숨김/해제, 활동 로그, 신고자 알림을 집합 단위 UPDATE/INSERT로 한 트랜잭션에서 처리
+    """
+    if current_user.role not in ["admin", "moderator"]:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    
+    if bulk_in.action not in BULK_REPORT_STATUSES:
+        raise HTTPException(status_code=400, detail="Action must be 'approve' or 'reject'")
+    if len(bulk_in.report_ids) > MAX_BULK_REPORTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_REPORTS} report_ids are allowed")
+    
+    status = BULK_REPORT_STATUSES[bulk_in.action]
+    approve = bulk_in.action == "approve"
+    report_ids = list(dict.fromkeys(bulk_in.report_ids))
+    
+    # 대상 신고를 잠그고 읽음 (동시에 같은 신고를 처리해도 신고 수가 한 번만 바뀌도록)
+    reports = db.query(models.Report).filter(
+        models.Report.id.in_(report_ids)
+    ).with_for_update().all() if report_ids else []
+    found = {report.id: report for report in reports}
+    changed = [report for report in reports if report.status != status]
+    changed_ids = {report.id for report in changed}
+    
+    hidden_post_ids = []
+    visibility_comment_ids = []
+    if changed:
+        
+        # 신고 수 조정 (거부 <-> 그 외로 바뀌는 신고만)
+        if approve:
+            adjust_report_counts(db, [report for report in changed if report.status == "rejected"], 1)
+        else:
+            adjust_report_counts(db, [report for report in changed if report.status != "rejected"], -1)
+        
+        # 신고 상태 업데이트
+        db.query(models.Report).filter(models.Report.id.in_(changed_ids)).update(
+            {models.Report.status: status, models.Report.reviewed_by: current_user.id},
+            synchronize_session=False
+        )
+        
+        # 처리 대기열에서 빠지는 대상 갱신 (report.status는 아직 이전 상태)
+        refresh_queue(db, [report for report in changed if report.status == "pending"])
+        
+        # 신고자 처리 이력 카운터 (대기열 가중치용, report.status는 아직 이전 상태)
+        record_reporter_outcomes(db, [(report.reporter_id, report.status) for report in changed], status)
+        
+        # 작성자 자동 제재 카운터 (승인 <-> 그 외로 바뀌는 신고만)
+        if approve:
+            record_upheld_reports(db, changed, 1)
+        else:
+            record_upheld_reports(db, [report for report in changed if report.status == "reviewed"], -1)
+        
+        # 신고된 콘텐츠 숨김(승인) / 숨김 해제(거부)
+        post_ids = {report.post_id for report in changed if report.post_id}
+        comment_ids = {report.comment_id for report in changed if report.comment_id}
+        if post_ids:
+            # 실시간 이벤트를 보낼 게시물 (새로 숨겨지는 게시물만)
+            if approve:
+                hidden_post_ids = [post_id for (post_id,) in db.query(models.Post.id).filter(
+                    models.Post.id.in_(post_ids),
+                    models.Post.is_hidden == False
+                ).all()]
+            db.query(models.Post).filter(
+                models.Post.id.in_(post_ids),
+                models.Post.is_hidden == (not approve)
+            ).update({models.Post.is_hidden: approve}, synchronize_session=False)
+        if comment_ids:
+            # 실시간 이벤트를 보낼 댓글 (실제로 상태가 바뀌는 댓글만)
+            visibility_comment_ids = [comment_id for (comment_id,) in db.query(models.Comment.id).filter(
+                models.Comment.id.in_(comment_ids),
+                models.Comment.is_hidden == (not approve)
+            ).all()]
+            if visibility_comment_ids:
+                db.query(models.Comment).filter(
+                    models.Comment.id.in_(visibility_comment_ids)
+                ).update({models.Comment.is_hidden: approve}, synchronize_session=False)
+        
+        # 활동 로그와 신고자 알림 (각각 다중 행 INSERT 한 번)
+        verb = "approved" if approve else "rejected"
+        db.execute(models.ActivityLog.__table__.insert(), [
+            {
+                "user_id": current_user.id,
+                "action_type": f"{bulk_in.action}_report",
+                "description": f"User {current_user.username} {verb} report {report.id}",
+                "ip_address": "127.0.0.1"  # 실제 구현에서는 요청의 IP 주소를 가져와야 함
+            }
+            for report in changed
+        ])
+        create_notifications(db, [
+            {
+                "user_id": report.reporter_id,
+                "type": "report_status",
+                "content": f"Your report has been {verb}.",
+                "related_id": report.id
+            }
+            for report in changed
+        ])
+    
+    db.commit()
+    
+    publish_reports_reviewed(sorted(changed_ids), status)
+    for post_id in hidden_post_ids:
+        publish_post_hidden(post_id)
+    if visibility_comment_ids:
+        for comment in db.query(models.Comment).filter(models.Comment.id.in_(visibility_comment_ids)).all():
+            publish_comment_visibility(comment)
+    
+    items = []
+    for report_id in report_ids:
+        if report_id not in found:
+            items.append({"id": report_id, "result": "not_found", "status": None})
+        else:
+            items.append({
+                "id": report_id,
+                "result": "updated" if report_id in changed_ids else "unchanged",
+                "status": status
+            })
+    
+    return {"items": items, "updated": len(changed_ids)}
+
 @router.put("/{report_id}/approve", response_model=schemas.Report)
 def approve_report(
     *,
@@ -245,26 +499,36 @@ def approve_report(
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
-    # 신고 상태 업데이트
-    report.status = "reviewed"
-    report.reviewed_by = current_user.id
+    # 신고 상태 업데이트 (거부했던 신고면 대상의 신고 수 복원)
+    changed = change_report_status(db, report, "reviewed", current_user.id)
     
     # 신고된 콘텐츠 숨김 처리
+    hidden_comment = None
+    hidden_post_id = None
     if report.post_id:
         post = db.query(models.Post).filter(models.Post.id == report.post_id).first()
-        if post:
+        if post and not post.is_hidden:
             post.is_hidden = True
             db.add(post)
+            hidden_post_id = post.id
     elif report.comment_id:
         comment = db.query(models.Comment).filter(models.Comment.id == report.comment_id).first()
-        if comment:
+        if comment and not comment.is_hidden:
             comment.is_hidden = True
             db.add(comment)
+            hidden_comment = comment
     
     db.add(report)
     db.commit()
     db.refresh(report)
     
+    if changed:
+        publish_reports_reviewed([report.id], report.status)
+    if hidden_post_id:
+        publish_post_hidden(hidden_post_id)
+    if hidden_comment:
+        publish_comment_visibility(hidden_comment)
+    
     # 활동 로그 기록
     activity_log = models.ActivityLog(
         user_id=current_user.id,
@@ -275,14 +539,14 @@ def approve_report(
     db.add(activity_log)
     db.commit()
     
-    # 신고자에게 알림 생성
-    notification = models.Notification(
+    # 신고자에게 알림 생성 (읽지 않은 알림 수 증가)
+    create_notification(
+        db,
         user_id=report.reporter_id,
         type="report_status",
         content=f"Your report has been approved.",
         related_id=report.id
     )
-    db.add(notification)
     db.commit()
     
     return report
@@ -305,11 +569,11 @@ def reject_report(
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
-    # 신고 상태 업데이트
-    report.status = "rejected"
-    report.reviewed_by = current_user.id
+    # 신고 상태 업데이트 (대상의 신고 수 감소)
+    changed = change_report_status(db, report, "rejected", current_user.id)
     
     # 신고 거부 시 숨김 해제 처리
+    unhidden_comment = None
     if report.post_id:
         post = db.query(models.Post).filter(models.Post.id == report.post_id).first()
         if post and post.is_hidden:
@@ -320,11 +584,17 @@ def reject_report(
         if comment and comment.is_hidden:
             comment.is_hidden = False
             db.add(comment)
+            unhidden_comment = comment
     
     db.add(report)
     db.commit()
     db.refresh(report)
     
+    if changed:
+        publish_reports_reviewed([report.id], report.status)
+    if unhidden_comment:
+        publish_comment_visibility(unhidden_comment)
+    
     # 활동 로그 기록
     activity_log = models.ActivityLog(
         user_id=current_user.id,
@@ -335,14 +605,14 @@ def reject_report(
     db.add(activity_log)
     db.commit()
     
-    # 신고자에게 알림 생성
-    notification = models.Notification(
+    # 신고자에게 알림 생성 (읽지 않은 알림 수 증가)
+    create_notification(
+        db,
         user_id=report.reporter_id,
         type="report_status",
         content=f"Your report has been rejected.",
         related_id=report.id
     )
-    db.add(notification)
     db.commit()
     
     return report
\ No newline at end of file
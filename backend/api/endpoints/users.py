@@ -1,13 +1,16 @@
 from typing import Any, List, Optional
+import heapq
 
 from typing import Any, Dict
 from sqlalchemy import func
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from backend import models, schemas
 from backend.api import deps
 from backend.core import security
+from backend.models.reaction import REACTION_VALUES
+from backend.utils.pagination import encode_cursor, decode_cursor, cursor_datetime, cursor_int, keyset_predicate
 
 router = APIRouter()
 
@@ -119,11 +122,181 @@ def get_user_stats(
     comment_count = db.query(func.count(models.Comment.id)).filter(models.Comment.user_id == user_id).scalar()
     like_count = db.query(func.count(models.Reaction.id)).filter(
         models.Reaction.user_id == user_id,
-        models.Reaction.type == "like"
+        models.Reaction.value == REACTION_VALUES["like"]
     ).scalar()
     
     return {
         "post_count": post_count,
         "comment_count": comment_count,
         "like_count": like_count
-    }
\ No newline at end of file
+    }
+
+
+# 타임라인 소스별 순위 (같은 시각의 항목을 정렬하기 위한 보조 키)
+TIMELINE_SOURCE_RANKS = {"post": 0, "comment": 1, "like": 2}
+
+
+def _scan_timeline_source(query, created_col, id_col, source, position, limit):
+    """
+    하나의 소스를 (created_at, rank, id) 내림차순 keyset으로 스캔
+    반환: [(created_at, rank, id, source, target_id), ...]
+    """
+    rank = TIMELINE_SOURCE_RANKS[source]
+    if position:
+        cursor_at, cursor_rank, cursor_id = position
+        if rank < cursor_rank:
+            # 같은 시각이면 커서보다 뒤에 오는 소스
+            query = query.filter(created_col <= cursor_at)
+        elif rank == cursor_rank:
+            query = query.filter(keyset_predicate([created_col, id_col], [cursor_at, cursor_id]))
+        else:
+            # 같은 시각이면 커서보다 앞에 오는 소스 (이미 반환됨)
+            query = query.filter(created_col < cursor_at)
+    rows = query.order_by(created_col.desc(), id_col.desc()).limit(limit).all()
+    return [(created_at, rank, row_id, source, target_id) for row_id, created_at, target_id in rows]
+
+
+def _hydrate_timeline_posts(db: Session, post_ids: List[int]) -> Dict[int, schemas.PostWithDetails]:
+    """
+    타임라인에 등장하는 게시물을 IN 쿼리와 댓글 수 그룹 집계로 한 번에 조회
+    """
+    if not post_ids:
+        return {}
+    
+    posts = db.query(models.Post).options(
+        joinedload(models.Post.user),
+        joinedload(models.Post.institution),
+        joinedload(models.Post.category),
+        selectinload(models.Post.images),
+    ).filter(models.Post.id.in_(post_ids)).all()
+    
+    # 댓글 수 (게시물별 그룹 집계)
+    comment_counts = dict(db.query(
+        models.Comment.post_id,
+        func.count(models.Comment.id)
+    ).filter(
+        models.Comment.post_id.in_(post_ids),
+        models.Comment.is_hidden == False
+    ).group_by(models.Comment.post_id).all())
+    
+    result = {}
+    for post in posts:
+        post_dict = {
+            **schemas.Post.model_validate(post).model_dump(),
+            "user": schemas.User.model_validate(post.user),
+            "institution": schemas.Institution.model_validate(post.institution) if post.institution else None,
+            "category": schemas.Category.model_validate(post.category) if post.category else None,
+            "images": [schemas.PostImage.model_validate(image) for image in post.images],
+            "comment_count": comment_counts.get(post.id, 0),
+            "like_count": post.like_count,
+            "dislike_count": post.dislike_count
+        }
+        result[post.id] = schemas.PostWithDetails(**post_dict)
+    return result
+
+
+def _hydrate_timeline_comments(db: Session, comment_ids: List[int]) -> Dict[int, schemas.CommentWithUser]:
+    """
+    타임라인에 등장하는 댓글을 작성자·게시물 제목과 함께 한 번에 조회
+    """
+    if not comment_ids:
+        return {}
+    
+    rows = db.query(models.Comment, models.Post.title).join(
+        models.Post, models.Comment.post_id == models.Post.id
+    ).options(
+        joinedload(models.Comment.user)
+    ).filter(models.Comment.id.in_(comment_ids)).all()
+    
+    result = {}
+    for comment, post_title in rows:
+        comment_dict = {
+            **schemas.Comment.model_validate(comment).model_dump(),
+            "user": schemas.User.model_validate(comment.user),
+            "post_title": post_title
+        }
+        result[comment.id] = schemas.CommentWithUser(**comment_dict)
+    return result
+
+
+@router.get("/{user_id}/timeline", response_model=schemas.TimelinePage)
+def read_user_timeline(
+    user_id: int,
+    db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: Optional[models.User] = Depends(deps.get_optional_current_user),
+) -> Any:
+    """
+    사용자 타임라인 조회 (작성한 게시물, 댓글, 좋아요한 게시물을 시간순으로 병합)
+    """
+    user = db.query(models.User).filter(models.User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # 커서: (created_at, 소스 순위, id)
+    position = None
+    values = decode_cursor(cursor, 3)
+    if values:
+        position = (cursor_datetime(values[0]), cursor_int(values[1]), cursor_int(values[2]))
+    
+    is_moderator = current_user is not None and current_user.role in ["admin", "moderator"]
+    
+    # 1. 작성한 게시물 (posts.user_id, created_at 인덱스)
+    post_query = db.query(models.Post.id, models.Post.created_at, models.Post.id).filter(
+        models.Post.user_id == user_id
+    )
+    if not is_moderator:
+        post_query = post_query.filter(models.Post.is_hidden == False)
+    
+    # 2. 작성한 댓글 (comments.user_id, created_at 인덱스) - 본인 또는 관리자만 숨김 댓글 조회
+    comment_query = db.query(models.Comment.id, models.Comment.created_at, models.Comment.id).filter(
+        models.Comment.user_id == user_id
+    )
+    if not is_moderator and (not current_user or current_user.id != user_id):
+        comment_query = comment_query.filter(models.Comment.is_hidden == False)
+    
+    # 3. 좋아요한 게시물 (reactions.user_id, value, created_at 인덱스)
+    like_query = db.query(models.Reaction.id, models.Reaction.created_at, models.Reaction.post_id).join(
+        models.Post, models.Reaction.post_id == models.Post.id
+    ).filter(
+        models.Reaction.user_id == user_id,
+        models.Reaction.value == REACTION_VALUES["like"]
+    )
+    if not is_moderator:
+        like_query = like_query.filter(models.Post.is_hidden == False)
+    
+    # 각 소스에서 최대 limit + 1개만 읽은 뒤 k-way 병합
+    streams = [
+        _scan_timeline_source(post_query, models.Post.created_at, models.Post.id, "post", position, limit + 1),
+        _scan_timeline_source(comment_query, models.Comment.created_at, models.Comment.id, "comment", position, limit + 1),
+        _scan_timeline_source(like_query, models.Reaction.created_at, models.Reaction.id, "like", position, limit + 1),
+    ]
+    merged = list(heapq.merge(*streams, key=lambda entry: entry[:3], reverse=True))
+    page = merged[:limit]
+    
+    # 페이지에 포함된 대상만 일괄 조회
+    posts = _hydrate_timeline_posts(
+        db, list({target_id for _, _, _, source, target_id in page if source in ("post", "like")})
+    )
+    comments = _hydrate_timeline_comments(
+        db, [target_id for _, _, _, source, target_id in page if source == "comment"]
+    )
+    
+    items = []
+    for created_at, _, _, source, target_id in page:
+        if source == "comment":
+            comment = comments.get(target_id)
+            if comment:
+                items.append(schemas.TimelineItem(type=source, created_at=created_at, comment=comment))
+        else:
+            post = posts.get(target_id)
+            if post:
+                items.append(schemas.TimelineItem(type=source, created_at=created_at, post=post))
+    
+    next_cursor = None
+    if len(merged) > limit:
+        last_created_at, last_rank, last_id = page[-1][:3]
+        next_cursor = encode_cursor(last_created_at, last_rank, last_id)
+    
+    return {"items": items, "next_cursor": next_cursor}
@@ -40,6 +40,31 @@ class Settings(BaseSettings):
             return v
         return f"mysql+pymysql://{values.get('MYSQL_USER')}:{values.get('MYSQL_PASSWORD')}@{values.get('MYSQL_SERVER')}/{values.get('MYSQL_DB')}"
 
+    # 실시간 스트림(SSE) 설정 - 워커 프로세스 단위
+    SSE_MAX_SUBSCRIBERS: int = int(os.getenv("SSE_MAX_SUBSCRIBERS", "2000"))
+    SSE_MAX_SUBSCRIBERS_PER_TOPIC: int = int(os.getenv("SSE_MAX_SUBSCRIBERS_PER_TOPIC", "500"))
+    SSE_QUEUE_SIZE: int = int(os.getenv("SSE_QUEUE_SIZE", "100"))
+    SSE_HEARTBEAT_SECONDS: int = int(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+    NOTIFICATION_LONG_POLL_SECONDS: int = int(os.getenv("NOTIFICATION_LONG_POLL_SECONDS", "25"))
+
+    # 댓글 스레드 캐시 설정 - 워커 프로세스 단위
+    COMMENT_THREAD_CACHE_SIZE: int = int(os.getenv("COMMENT_THREAD_CACHE_SIZE", "500"))
+    COMMENT_THREAD_CACHE_TTL_SECONDS: int = int(os.getenv("COMMENT_THREAD_CACHE_TTL_SECONDS", "30"))
+
+    # 반응 카운터 쓰기 병합 설정 - 워커 프로세스 단위
+    REACTION_COUNTER_BUFFERING: bool = os.getenv("REACTION_COUNTER_BUFFERING", "true").lower() == "true"
+    REACTION_COUNTER_SHARDS: int = int(os.getenv("REACTION_COUNTER_SHARDS", "16"))
+    REACTION_COUNTER_FLUSH_SECONDS: float = float(os.getenv("REACTION_COUNTER_FLUSH_SECONDS", "1.0"))
+
+    # 반응 비트맵 인덱스 설정 (liked_by_me 조회용 선택적 캐시) - 워커 프로세스 단위
+    # 다른 워커의 쓰기는 TTL 동안 반영되지 않으므로 기본값은 꺼짐 (사용자 한정 인덱스 조회)
+    REACTION_BITMAP_ENABLED: bool = os.getenv("REACTION_BITMAP_ENABLED", "false").lower() == "true"
+    REACTION_BITMAP_MAX_TARGETS: int = int(os.getenv("REACTION_BITMAP_MAX_TARGETS", "20000"))
+    REACTION_BITMAP_TTL_SECONDS: int = int(os.getenv("REACTION_BITMAP_TTL_SECONDS", "300"))
+
+    # 관리자 설정(settings 테이블) 캐시 - 워커 프로세스 단위
+    SITE_SETTINGS_CACHE_TTL_SECONDS: int = int(os.getenv("SITE_SETTINGS_CACHE_TTL_SECONDS", "30"))
+
     class Config:
         case_sensitive = True
         env_file = ".env"
@@ -0,0 +1,176 @@
+# 프로세스 내 pub/sub 허브
+"""
+워커 프로세스 하나 안에서 동작하는 토픽 기반 pub/sub 허브 (SSE 스트림용)
+
+- 구독자마다 크기가 제한된 asyncio.Queue를 사용하고, 큐가 가득 차면(느린 소비자)
+  쌓인 이벤트를 버리고 RESYNC 이벤트 하나만 남겨 클라이언트가 전체를 다시 읽도록 한다.
+- 워커당 전체 구독자 수와 토픽당 구독자 수를 제한한다.
+- 동기 엔드포인트는 스레드풀에서 실행되므로 publish()는 어느 스레드에서 호출해도
+  이벤트 루프로 안전하게 전달된다.
+
+여러 워커/서버로 확장할 때는 publish()만 외부 브로커(Redis 등)로 바꾸면 된다.
+"""
+import asyncio
+import itertools
+import json
+import threading
+from typing import Any, AsyncIterator, Collection, Dict, Optional, Set
+
+from backend.core.config import settings
+
+# 큐가 넘쳐 이벤트가 유실되었음을 알리는 이벤트 이름
+RESYNC_EVENT = "resync"
+
+
+class SubscriberLimitExceeded(Exception):
+    """구독자 수 제한을 넘었을 때 발생"""
+
+
+class Subscription:
+    def __init__(self, hub: "PubSubHub", topic: str, queue_size: int):
+        self.hub = hub
+        self.topic = topic
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0  # 유실된 이벤트 수
+
+    def push(self, message: Dict[str, Any]) -> None:
+        """
+        이벤트 루프 스레드에서만 호출
+        """
+        if self.queue.full():
+            # 느린 소비자: 밀린 이벤트를 버리고 다시 읽으라는 신호만 남김
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait({"event": RESYNC_EVENT, "data": {"topic": self.topic}})
+            return
+        self.queue.put_nowait(message)
+
+    async def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        다음 이벤트 (timeout 동안 없으면 None)
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class PubSubHub:
+    def __init__(self, max_subscribers: int, max_subscribers_per_topic: int, queue_size: int):
+        self.max_subscribers = max_subscribers
+        self.max_subscribers_per_topic = max_subscribers_per_topic
+        self.queue_size = queue_size
+        self._topics: Dict[str, Set[Subscription]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sequence = itertools.count(1)
+        self.published = 0
+
+    def subscribe(self, topic: str) -> Subscription:
+        """
+        이벤트 루프 안에서 호출 (SSE 엔드포인트)
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._count >= self.max_subscribers:
+                raise SubscriberLimitExceeded("Too many subscribers on this worker")
+            subscribers = self._topics.setdefault(topic, set())
+            if len(subscribers) >= self.max_subscribers_per_topic:
+                raise SubscriberLimitExceeded("Too many subscribers for this topic")
+            self._loop = loop
+            subscription = Subscription(self, topic, self.queue_size)
+            subscribers.add(subscription)
+            self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._topics.get(subscription.topic)
+            if not subscribers or subscription not in subscribers:
+                return
+            subscribers.discard(subscription)
+            self._count -= 1
+            if not subscribers:
+                del self._topics[subscription.topic]
+
+    def has_subscribers(self, topic: str) -> bool:
+        return topic in self._topics
+
+    def publish(self, topic: str, event: str, data: Dict[str, Any]) -> None:
+        """
+        토픽 구독자 모두에게 이벤트 전달 (구독자가 없으면 아무 일도 하지 않음)
+        """
+        if not self.has_subscribers(topic) or self._loop is None:
+            return
+        message = {"id": next(self._sequence), "event": event, "data": data}
+        self.published += 1
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._deliver(topic, message)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._deliver, topic, message)
+
+    def _deliver(self, topic: str, message: Dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._topics.get(topic, ()))
+        for subscription in subscribers:
+            subscription.push(message)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "subscribers": self._count,
+                "topics": len(self._topics),
+                "published": self.published,
+            }
+
+
+def format_sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """
+    SSE 프레임 문자열 생성
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def sse_stream(
+    subscription: Subscription, heartbeat: float, close_on: Collection[str] = ()
+) -> AsyncIterator[str]:
+    """
+    구독을 SSE 프레임으로 변환 (heartbeat초 동안 이벤트가 없으면 주석 프레임 전송)
+    close_on에 있는 이벤트는 전달한 뒤 스트림을 끝낸다.
+    연결이 끊기면(제너레이터 취소/종료) 구독을 해제한다.
+    """
+    try:
+        yield f"retry: {int(heartbeat * 1000)}\n\n"
+        yield format_sse("ready", {"topic": subscription.topic})
+        while True:
+            message = await subscription.get(timeout=heartbeat)
+            if message is None:
+                yield ": ping\n\n"
+                continue
+            yield format_sse(message["event"], message["data"], message.get("id"))
+            if message["event"] in close_on:
+                return
+    finally:
+        subscription.close()
+
+
+# 워커 프로세스 전역 허브
+hub = PubSubHub(
+    max_subscribers=settings.SSE_MAX_SUBSCRIBERS,
+    max_subscribers_per_topic=settings.SSE_MAX_SUBSCRIBERS_PER_TOPIC,
+    queue_size=settings.SSE_QUEUE_SIZE,
+)
@@ -0,0 +1,119 @@
+# 관리자 설정(settings 테이블) 기본값과 캐시
+"""
+관리자 화면에서 바꾸는 사이트/신고/알림 설정의 기본값과, 요청 경로에서 읽기 위한 워커 메모리 캐시.
+
+- 값은 settings 테이블에 "섹션.키" 이름으로 JSON 문자열로 저장된다 (예: report.autoHideThreshold = "3").
+- get()은 캐시가 비었거나 TTL이 지났을 때만 settings 테이블 전체를 한 번에 읽는다.
+- 설정을 바꾼 워커는 invalidate()로 즉시 반영하고, 다른 워커에는 TTL 이내에 반영된다.
+"""
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.core.config import settings
+
+# 기본 설정값 정의
+DEFAULT_SETTINGS = {
+    "site": {
+        "siteName": "Mountain",
+        "siteDescription": "커뮤니티 플랫폼",
+        "primaryColor": "#4f46e5",
+        "secondaryColor": "#10b981",
+        "logoUrl": "/logo.png",
+        "faviconUrl": "/favicon.ico",
+        "footerText": "© 2023 Mountain. All rights reserved.",
+        "enableDarkMode": True,
+        "defaultTheme": "system"
+    },
+    "report": {
+        "autoHideThreshold": 3,
+        "defaultSanctionPeriod": 7,
+        "enableAutoSanction": False,
+        "autoSanctionThreshold": 5,  # 창 안에서 승인된 신고가 이 수에 도달하면 자동 제재
+        "autoSanctionWindowDays": 30,  # 자동 제재 카운터 창 길이 (일)
+        "notifyAdminOnReport": True,
+        "sanctionReasonRequired": True
+    },
+    "notification": {
+        "notifyUserOnSanction": True,
+        "notifyUserOnReportResult": True,
+        "notifyAdminOnHighPriorityReport": True,
+        "enableInAppNotifications": True,
+        "enableBrowserNotifications": False
+    }
+}
+
+# 설정 키 접두사 정의
+SETTING_PREFIXES = {
+    "site": "site.",
+    "report": "report.",
+    "notification": "notification."
+}
+
+
+def _default(key_name: str) -> Any:
+    for section, prefix in SETTING_PREFIXES.items():
+        if key_name.startswith(prefix):
+            return DEFAULT_SETTINGS[section].get(key_name[len(prefix):])
+    return None
+
+
+class SiteSettingsCache:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._values: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _load(self, db: Session) -> Dict[str, Any]:
+        with self._lock:
+            generation = self._generation
+        values = {}
+        for key_name, value in db.query(models.Setting.key_name, models.Setting.value).all():
+            try:
+                values[key_name] = json.loads(value)
+            except json.JSONDecodeError:
+                values[key_name] = value
+        with self._lock:
+            # 읽는 동안 설정이 바뀌었다면 이번 결과는 저장하지 않음
+            if generation == self._generation:
+                self._values = values
+                self._expires_at = time.monotonic() + self.ttl_seconds
+        return values
+
+    def get(self, db: Session, key_name: str) -> Any:
+        """
+        설정값 (DB에 없으면 DEFAULT_SETTINGS의 기본값)
+        """
+        with self._lock:
+            values = self._values if self._expires_at > time.monotonic() else None
+        if values is None:
+            values = self._load(db)
+        if key_name in values:
+            return values[key_name]
+        return _default(key_name)
+
+    def get_int(self, db: Session, key_name: str) -> Optional[int]:
+        """
+        정수 설정값 (숫자가 아니면 기본값)
+        """
+        try:
+            return int(self.get(db, key_name))
+        except (TypeError, ValueError):
+            default = _default(key_name)
+            return int(default) if default is not None else None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._values = None
+            self._expires_at = 0.0
+
+
+# 워커 프로세스 전역 캐시
+site_settings = SiteSettingsCache(ttl_seconds=settings.SITE_SETTINGS_CACHE_TTL_SECONDS)
@@ -6,6 +6,7 @@ from fastapi.staticfiles import StaticFiles
 
 from backend.core.config import settings
 from backend.api.api import api_router
+from backend.utils.counter_buffer import reaction_counter_buffer
 
 import os
 import logging
@@ -40,6 +41,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 반응 카운터 쓰기 병합 버퍼 주기적 반영 (종료 시 남은 증감 반영)
+@app.on_event("startup")
+def start_reaction_counter_flush():
+    if settings.REACTION_COUNTER_BUFFERING:
+        reaction_counter_buffer.start()
+
+
+@app.on_event("shutdown")
+def stop_reaction_counter_flush():
+    reaction_counter_buffer.stop()
+
+
 @app.get("/")
 def root():
     return {"message": "Welcome to Mountain Community API"}
@@ -1,6 +1,6 @@
 # 댓글 모델
-from sqlalchemy import Column, Integer, Text, Boolean, DateTime, ForeignKey, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, func
+from sqlalchemy.orm import relationship, backref
 
 from backend.database import Base
 
@@ -13,13 +13,30 @@ class Comment(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
     parent_id = Column(Integer, ForeignKey("comments.id", ondelete="CASCADE"))
+    # 구체화 경로: 조상부터 자신까지의 0으로 채운 id를 "."으로 연결 (예: 0000000012.0000000034)
+    # path 순 정렬이 곧 트리 표시 순서이며, 하위 트리는 (post_id, path) 범위 스캔 한 번으로 조회
+    path = Column(String(255))
+    depth = Column(Integer, nullable=False, default=0, server_default="0")  # 최상위 댓글은 0
+    descendant_count = Column(Integer, nullable=False, default=0, server_default="0")  # 하위 트리 전체 댓글 수 (비정규화)
     is_hidden = Column(Boolean, default=False)
+    reply_count = Column(Integer, nullable=False, default=0, server_default="0")  # 답글 수 (숨김 포함, 비정규화)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")  # 좋아요 수 (비정규화)
+    dislike_count = Column(Integer, nullable=False, default=0, server_default="0")  # 싫어요 수 (비정규화)
+    report_count = Column(Integer, nullable=False, default=0, server_default="0")  # 거부되지 않은 신고 수 (비정규화)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="comments")
     post = relationship("Post", back_populates="comments")
-    parent = relationship("Comment", remote_side=[id], backref="replies")
+    # 하위 댓글 삭제는 DB의 ON DELETE CASCADE에 맡김
+    parent = relationship("Comment", remote_side=[id], backref=backref("replies", passive_deletes=True))
     reactions = relationship("Reaction", back_populates="comment", cascade="all, delete-orphan")
-    reports = relationship("Report", back_populates="comment", cascade="all, delete-orphan")
\ No newline at end of file
+    reports = relationship("Report", back_populates="comment", cascade="all, delete-orphan")
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_comments_user_created", "user_id", "created_at"),
+        Index("ix_comments_post_path", "post_id", "path"),
+        Index("ix_comments_report_count", "report_count", "created_at"),
+    )
\ No newline at end of file
@@ -0,0 +1,30 @@
+# 신고 처리 대기열 모델
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, UniqueConstraint, Index, CheckConstraint
+
+from backend.database import Base
+
+
+class ModerationQueueEntry(Base):
+    """
+    대기 중(pending) 신고가 있는 게시물/댓글마다 한 행 - 신고 추가/처리 시 갱신되며 대기 신고가 없어지면 삭제
+    """
+    __tablename__ = "moderation_queue"
+
+    id = Column(Integer, primary_key=True, index=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"))
+    comment_id = Column(Integer, ForeignKey("comments.id", ondelete="CASCADE"))
+    pending_count = Column(Integer, nullable=False, default=0)  # 대기 중인 신고 수
+    reporter_count = Column(Integer, nullable=False, default=0)  # 대기 중인 신고의 서로 다른 신고자 수
+    priority = Column(Integer, nullable=False, default=0)  # 정렬 점수 (대기 신고마다 신고자 가중치의 합)
+    first_reported_at = Column(DateTime, nullable=False)
+    last_reported_at = Column(DateTime, nullable=False)
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint("post_id", name="unique_queue_post"),
+        UniqueConstraint("comment_id", name="unique_queue_comment"),
+        CheckConstraint("(post_id IS NULL AND comment_id IS NOT NULL) OR (post_id IS NOT NULL AND comment_id IS NULL)",
+                        name="check_queue_target"),
+        # 대기열 keyset 페이지네이션 (점수, 최근 신고 시각, id 내림차순)
+        Index("ix_moderation_queue_priority", "priority", "last_reported_at", "id"),
+    )
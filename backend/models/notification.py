@@ -1,5 +1,5 @@
 # 알림 모델
-from sqlalchemy import Column, Integer, Text, Enum, Boolean, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, Text, Enum, Boolean, DateTime, ForeignKey, func, Index
 from sqlalchemy.orm import relationship
 
 from backend.database import Base
@@ -17,4 +17,10 @@ class Notification(Base):
     created_at = Column(DateTime, default=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="notifications")
\ No newline at end of file
+    user = relationship("User", back_populates="notifications")
+
+    # Constraints
+    __table_args__ = (
+        # 사용자별 읽지 않은 알림 수 / 모두 읽음 처리 / 읽지 않은 알림 최신순
+        Index("ix_notifications_user_read_created", "user_id", "is_read", "created_at"),
+    )
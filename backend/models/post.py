@@ -1,5 +1,5 @@
 # 게시물 모델
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 
 from backend.database import Base
@@ -16,6 +16,9 @@ class Post(Base):
     category_id = Column(Integer, ForeignKey("categories.id", ondelete="SET NULL"))
     view_count = Column(Integer, default=0)
     is_hidden = Column(Boolean, default=False)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")  # 좋아요 수 (비정규화)
+    dislike_count = Column(Integer, nullable=False, default=0, server_default="0")  # 싫어요 수 (비정규화)
+    report_count = Column(Integer, nullable=False, default=0, server_default="0")  # 거부되지 않은 신고 수 (비정규화)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
@@ -27,6 +30,12 @@ class Post(Base):
     comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
     reactions = relationship("Reaction", back_populates="post", cascade="all, delete-orphan")
     reports = relationship("Report", back_populates="post", cascade="all, delete-orphan")
+    revisions = relationship("PostRevision", back_populates="post", cascade="all, delete-orphan")
+
+    # Indexes
+    __table_args__ = (
+        Index("ix_posts_user_created", "user_id", "created_at"),
+    )
 
 
 class PostImage(Base):
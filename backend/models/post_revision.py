@@ -0,0 +1,26 @@
+# 게시물 수정 이력 모델
+from sqlalchemy import Column, Integer, Boolean, LargeBinary, DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy.orm import relationship
+
+from backend.database import Base
+
+
+class PostRevision(Base):
+    __tablename__ = "post_revisions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
+    revision = Column(Integer, nullable=False)  # 1부터 시작하는 리비전 번호
+    is_snapshot = Column(Boolean, nullable=False, default=False)  # True면 전체 본문, False면 직전 리비전과의 diff
+    data = Column(LargeBinary(length=16777215), nullable=False)  # zlib 압축된 JSON (MEDIUMBLOB)
+    editor_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
+    created_at = Column(DateTime, default=func.now())
+
+    # Relationships
+    post = relationship("Post", back_populates="revisions")
+    editor = relationship("User", foreign_keys=[editor_id])
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint("post_id", "revision", name="unique_post_revision"),
+    )
\ No newline at end of file
@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, Enum, DateTime, ForeignKey, UniqueConstraint, func, CheckConstraint
+from sqlalchemy import Column, Integer, SmallInteger, DateTime, ForeignKey, UniqueConstraint, Index, func, CheckConstraint
 from sqlalchemy.orm import relationship
 
 from backend.database import Base
 
+# 반응 종류 <-> 저장 값 (사용자/대상마다 한 행, 좋아요 +1 / 싫어요 -1)
+REACTION_VALUES = {"like": 1, "dislike": -1}
+REACTION_TYPES_BY_VALUE = {value: reaction_type for reaction_type, value in REACTION_VALUES.items()}
+
 
 class Reaction(Base):
     __tablename__ = "reactions"
@@ -11,7 +15,7 @@ class Reaction(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"))
     comment_id = Column(Integer, ForeignKey("comments.id", ondelete="CASCADE"))
-    type = Column(Enum("like", "dislike"), nullable=False)
+    value = Column(SmallInteger, nullable=False)  # 1: like, -1: dislike
     created_at = Column(DateTime, default=func.now())
 
     # Relationships
@@ -21,8 +25,19 @@ class Reaction(Base):
 
     # Constraints
     __table_args__ = (
-        UniqueConstraint("user_id", "post_id", "type", name="unique_post_reaction"),
-        UniqueConstraint("user_id", "comment_id", "type", name="unique_comment_reaction"),
+        UniqueConstraint("user_id", "post_id", name="unique_post_reaction"),
+        UniqueConstraint("user_id", "comment_id", name="unique_comment_reaction"),
         CheckConstraint("(post_id IS NULL AND comment_id IS NOT NULL) OR (post_id IS NOT NULL AND comment_id IS NULL)",
                         name="check_reaction_target"),
-    )
\ No newline at end of file
+        CheckConstraint("value IN (1, -1)", name="check_reaction_value"),
+        Index("ix_reactions_user_value_created", "user_id", "value", "created_at"),
+    )
+
+    # API 응답/활동 로그에서는 기존과 같이 "like"/"dislike" 문자열로 노출
+    @property
+    def type(self):
+        return REACTION_TYPES_BY_VALUE.get(self.value)
+
+    @type.setter
+    def type(self, reaction_type):
+        self.value = REACTION_VALUES[reaction_type]
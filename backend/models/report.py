@@ -1,5 +1,5 @@
 # 신고 모델
-from sqlalchemy import Column, Integer, String, Text, Enum, DateTime, ForeignKey, func, CheckConstraint
+from sqlalchemy import Column, Integer, String, Text, Enum, DateTime, ForeignKey, func, CheckConstraint, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from backend.database import Base
@@ -27,6 +27,11 @@ class Report(Base):
 
     # Constraints
     __table_args__ = (
+        UniqueConstraint("reporter_id", "post_id", name="unique_post_report"),
+        UniqueConstraint("reporter_id", "comment_id", name="unique_comment_report"),
         CheckConstraint("(post_id IS NULL AND comment_id IS NOT NULL) OR (post_id IS NOT NULL AND comment_id IS NULL)",
                         name="check_report_target"),
+        # 신고 목록 keyset 페이지네이션 (상태별 / 전체)
+        Index("ix_reports_status_created_id", "status", "created_at", "id"),
+        Index("ix_reports_created_id", "created_at", "id"),
     )
\ No newline at end of file
@@ -0,0 +1,15 @@
+# 신고자 처리 이력 카운터 모델
+from sqlalchemy import Column, Integer, ForeignKey
+
+from backend.database import Base
+
+
+class ReporterStat(Base):
+    """
+    신고자별 승인(reviewed)/거부(rejected)된 신고 수 - 신고 상태가 바뀔 때 증분 갱신 (대기열 신고자 가중치용)
+    """
+    __tablename__ = "reporter_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    upheld_count = Column(Integer, nullable=False, default=0)  # 승인된 신고 수
+    rejected_count = Column(Integer, nullable=False, default=0)  # 거부된 신고 수
@@ -0,0 +1,15 @@
+# 자동 제재 카운터 모델
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+
+from backend.database import Base
+
+
+class SanctionCounter(Base):
+    """
+    작성자별 승인(reviewed)된 신고 수 - 고정 기간 창(tumbling window) 단위로 신고 처리 시 증분 갱신
+    """
+    __tablename__ = "sanction_counters"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    upheld_count = Column(Integer, nullable=False, default=0)  # 현재 창에서 승인된 신고 수
+    window_start = Column(DateTime, nullable=False)  # 현재 창 시작 시각 (UTC)
@@ -17,6 +17,7 @@ class User(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     status = Column(Enum("active", "inactive", "suspended"), nullable=False, default="active")
     suspended_until = Column(DateTime)
+    unread_notification_count = Column(Integer, nullable=False, default=0, server_default="0")  # 읽지 않은 알림 수 (비정규화)
 
     restrictions = relationship("RestrictionHistory", foreign_keys="RestrictionHistory.user_id", back_populates="user")
     posts = relationship("Post", back_populates="user", cascade="all, delete-orphan")
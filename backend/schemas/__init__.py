@@ -1,13 +1,14 @@
 from backend.schemas.user import User, UserCreate, UserUpdate, UserInDB, PasswordChange, AdminUserDetail, DashboardStats, UserStatusUpdate, UserRoleUpdate, UsernameAvailability
 from backend.schemas.institution import Institution, InstitutionCreate, InstitutionUpdate
 from backend.schemas.category import Category, CategoryCreate, CategoryUpdate
-from backend.schemas.post import Post, PostCreate, PostUpdate, PostWithDetails, PostImage, PostSearchResponse
-from backend.schemas.comment import Comment, CommentCreate, CommentUpdate, CommentWithReplies, CommentWithUser
-from backend.schemas.reaction import Reaction, ReactionCreate
-from backend.schemas.report import Report, ReportCreate, ReportUpdate
+from backend.schemas.post import Post, PostCreate, PostUpdate, PostWithDetails, PostImage, PostSearchResponse, PostRevision, PostRevisionSummary, PostRevisionPage
+from backend.schemas.comment import Comment, CommentCreate, CommentUpdate, CommentWithReplies, CommentWithUser, CommentPage
+from backend.schemas.reaction import Reaction, ReactionCreate, ReactionSet, ReactionState, ReactionLookup, ReactionLookupResult
+from backend.schemas.report import Report, ReportCreate, ReportUpdate, ReportBulkAction, ReportBulkItem, ReportBulkResult, ModerationQueueItem, ModerationQueuePage
 from backend.schemas.notification import Notification, NotificationCreate, NotificationUpdate
 from backend.schemas.notice import Notice, NoticeCreate, NoticeUpdate, NoticeWithUser
 from backend.schemas.token import Token, TokenPayload
 from backend.schemas.setting import Setting, SettingUpdate
 from backend.schemas.restriction import Restriction, RestrictionCreate
-from backend.schemas.userdashboardstats import UserDashboardStats
\ No newline at end of file
+from backend.schemas.userdashboardstats import UserDashboardStats
+from backend.schemas.timeline import TimelineItem, TimelinePage
@@ -28,6 +28,11 @@ class Comment(CommentBase):
     id: int
     user_id: int
     is_hidden: bool
+    reply_count: int = 0
+    depth: int = 0
+    descendant_count: int = 0
+    like_count: int = 0
+    dislike_count: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -38,14 +43,19 @@ class Comment(CommentBase):
 # 사용자 정보가 포함된 댓글
 class CommentWithUser(Comment):
     user: User
-    like_count: int = 0
-    dislike_count: int = 0
     liked_by_me: bool = False
     disliked_by_me: bool = False
     post_title: str = ""  # 게시물 제목 필드 추가
 
-# 답글이 포함된 댓글
+# 답글이 포함된 댓글 (replies는 처음 몇 개의 답글 미리보기)
 class CommentWithReplies(CommentWithUser):
     replies: List['CommentWithUser'] = []
+    next_reply_cursor: Optional[str] = None  # 나머지 답글 조회용 커서
+
+
+# 커서 기반 댓글 목록 응답
+class CommentPage(BaseModel):
+    items: List[CommentWithUser]
+    next_cursor: Optional[str] = None
 
 # backend/schemas/comment.py 수정
\ No newline at end of file
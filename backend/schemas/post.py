@@ -73,4 +73,30 @@ class PostSearchResponse(BaseModel):
     items: List[PostWithDetails]
     total: int
     page: int
-    limit: int
\ No newline at end of file
+    limit: int
+
+# 게시물 수정 이력 (복원된 제목/본문 포함)
+class PostRevision(BaseModel):
+    revision: int
+    is_snapshot: bool
+    editor_id: Optional[int] = None
+    title: str
+    content: str
+    created_at: datetime
+
+
+# 게시물 수정 이력 목록 항목 (본문 제외)
+class PostRevisionSummary(BaseModel):
+    revision: int
+    is_snapshot: bool
+    editor_id: Optional[int] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# 커서 기반 수정 이력 목록 응답
+class PostRevisionPage(BaseModel):
+    items: List[PostRevisionSummary]
+    next_cursor: Optional[str] = None
@@ -1,7 +1,7 @@
 # backend/schemas/reaction.py 수정
 
 from datetime import datetime
-from typing import Optional  # Optional 타입 추가
+from typing import Dict, List, Optional  # Optional 타입 추가
 from pydantic import BaseModel
 
 
@@ -25,4 +25,31 @@ class Reaction(ReactionBase):
     created_at: datetime
 
     class Config:
-        from_attributes = True  # orm_mode 대신 from_attributes 사용
\ No newline at end of file
+        from_attributes = True  # orm_mode 대신 from_attributes 사용
+
+# 반응 설정 요청 (PUT /reactions) - post_id와 comment_id 중 하나만 지정
+class ReactionSet(BaseModel):
+    post_id: Optional[int] = None
+    comment_id: Optional[int] = None
+    type: Optional[str] = None  # "like", "dislike" 또는 None(반응 취소)
+
+
+# 반응 설정 결과 (대상의 최신 반응 수 포함)
+class ReactionState(BaseModel):
+    post_id: Optional[int] = None
+    comment_id: Optional[int] = None
+    type: Optional[str] = None
+    like_count: int
+    dislike_count: int
+
+
+# 내 반응 일괄 조회 요청 (POST /reactions/mine)
+class ReactionLookup(BaseModel):
+    post_ids: List[int] = []
+    comment_ids: List[int] = []
+
+
+# 내 반응 일괄 조회 결과 - 요청한 id마다 "like", "dislike" 또는 None
+class ReactionLookupResult(BaseModel):
+    posts: Dict[int, Optional[str]] = {}
+    comments: Dict[int, Optional[str]] = {}
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # 공통 속성
@@ -11,6 +11,7 @@ class ReportBase(BaseModel):
 
 # API 요청 시 사용되는 데이터 (생성)
 class ReportCreate(ReportBase):
+    reason: str = Field(..., max_length=100)  # reports.reason 컬럼 길이 (String(100))
     post_id: Optional[int] = None
     comment_id: Optional[int] = None
 
@@ -33,4 +34,44 @@ class Report(ReportBase):
     updated_at: datetime
 
     class Config:
-        from_attributes = True  # orm_mode 대신 from_attributes 사용
\ No newline at end of file
+        from_attributes = True  # orm_mode 대신 from_attributes 사용
+
+
+# 신고 일괄 처리 요청 (POST /reports/bulk)
+class ReportBulkAction(BaseModel):
+    report_ids: List[int]
+    action: str  # "approve" 또는 "reject"
+
+
+# 신고 일괄 처리 결과 - 요청한 id마다 하나
+class ReportBulkItem(BaseModel):
+    id: int
+    result: str  # "updated", "unchanged"(이미 같은 상태) 또는 "not_found"
+    status: Optional[str] = None  # 처리 후 신고 상태
+
+
+class ReportBulkResult(BaseModel):
+    items: List[ReportBulkItem]
+    updated: int
+
+
+# 신고 처리 대기열 항목 - 대기 중인 신고가 있는 게시물/댓글마다 하나
+class ModerationQueueItem(BaseModel):
+    id: int
+    post_id: Optional[int] = None
+    comment_id: Optional[int] = None
+    pending_count: int
+    reporter_count: int
+    priority: int
+    first_reported_at: datetime
+    last_reported_at: datetime
+    post: Optional[Dict[str, Any]] = None
+    comment: Optional[Dict[str, Any]] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ModerationQueuePage(BaseModel):
+    items: List[ModerationQueueItem]
+    next_cursor: Optional[str] = None
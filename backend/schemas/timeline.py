@@ -0,0 +1,20 @@
+from typing import Optional, List
+from datetime import datetime
+from pydantic import BaseModel
+
+from backend.schemas.post import PostWithDetails
+from backend.schemas.comment import CommentWithUser
+
+
+# 타임라인 항목 (게시물 작성 / 댓글 작성 / 게시물 좋아요)
+class TimelineItem(BaseModel):
+    type: str  # "post", "comment" 또는 "like"
+    created_at: datetime
+    post: Optional[PostWithDetails] = None
+    comment: Optional[CommentWithUser] = None
+
+
+# 커서 기반 타임라인 응답
+class TimelinePage(BaseModel):
+    items: List[TimelineItem]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,81 @@
+# 게시물 댓글 변경 알림 유틸리티
+"""
+게시물의 댓글/반응이 바뀌면 커밋 이후에 호출한다.
+- 해당 게시물의 댓글 스레드 캐시를 무효화
+- 게시물별 토픽으로 실시간 이벤트 발행 (GET /api/posts/{post_id}/comments/stream 구독자에게 전달)
+
+이벤트 종류
+- comment_created: 새 댓글/답글 (댓글 본문 + 작성자 요약)
+- comment_updated: 댓글 내용 수정 (숨겨진 댓글이면 본문 없이 id/수정 시각만)
+- comment_deleted: 댓글 삭제 (하위 답글 포함)
+- comment_hidden / comment_unhidden: 숨김 상태 변경 (숨김 해제 시 댓글 본문 포함)
+- comment_reactions: 좋아요/싫어요 수 변경
+- post_hidden: 게시물이 숨겨짐 (관리자/중재자가 아닌 구독자의 스트림은 이 이벤트 뒤에 닫힘)
+
+본문/작성자가 필요한 이벤트는 구독자가 있을 때만 만든다 (추가 조회 방지).
+"""
+from typing import Any, Dict, Optional
+
+from backend import models, schemas
+from backend.core.pubsub import hub
+from backend.utils.thread_cache import comment_thread_cache
+
+POST_HIDDEN_EVENT = "post_hidden"
+
+
+def comment_topic(post_id: int) -> str:
+    return f"post:{post_id}:comments"
+
+
+def _comment_payload(comment: models.Comment) -> Dict[str, Any]:
+    payload = schemas.Comment.model_validate(comment).model_dump(mode="json")
+    payload["user"] = {"id": comment.user.id, "username": comment.user.username}
+    return payload
+
+
+def publish_comment_created(comment: models.Comment) -> None:
+    comment_thread_cache.invalidate(comment.post_id)
+    if not hub.has_subscribers(comment_topic(comment.post_id)):
+        return
+    hub.publish(comment_topic(comment.post_id), "comment_created", _comment_payload(comment))
+
+
+def publish_comment_updated(comment: models.Comment) -> None:
+    comment_thread_cache.invalidate(comment.post_id)
+    data = {
+        "id": comment.id,
+        "updated_at": comment.updated_at.isoformat() if comment.updated_at else None,
+    }
+    # 구독자 중에는 익명 사용자도 있으므로 숨겨진 댓글의 본문은 보내지 않음
+    if not comment.is_hidden:
+        data["content"] = comment.content
+    hub.publish(comment_topic(comment.post_id), "comment_updated", data)
+
+
+def publish_comment_deleted(post_id: int, comment_id: int, parent_id: Optional[int] = None) -> None:
+    comment_thread_cache.invalidate(post_id)
+    hub.publish(comment_topic(post_id), "comment_deleted", {"id": comment_id, "parent_id": parent_id})
+
+
+def publish_comment_visibility(comment: models.Comment) -> None:
+    comment_thread_cache.invalidate(comment.post_id)
+    if comment.is_hidden:
+        hub.publish(comment_topic(comment.post_id), "comment_hidden", {"id": comment.id})
+    elif hub.has_subscribers(comment_topic(comment.post_id)):
+        hub.publish(comment_topic(comment.post_id), "comment_unhidden", _comment_payload(comment))
+
+
+def publish_comment_reactions(comment: models.Comment) -> None:
+    comment_thread_cache.invalidate(comment.post_id)
+    if not hub.has_subscribers(comment_topic(comment.post_id)):
+        return
+    hub.publish(comment_topic(comment.post_id), "comment_reactions", {
+        "id": comment.id,
+        "like_count": comment.like_count,
+        "dislike_count": comment.dislike_count,
+    })
+
+
+def publish_post_hidden(post_id: int) -> None:
+    comment_thread_cache.invalidate(post_id)
+    hub.publish(comment_topic(post_id), POST_HIDDEN_EVENT, {"id": post_id})
@@ -0,0 +1,194 @@
+# 반응 카운터 쓰기 병합 버퍼
+"""
+인기 게시물에 좋아요가 몰릴 때 매 요청마다 같은 posts 행의 카운터를 UPDATE 하면
+그 행의 잠금을 두고 모든 요청이 줄을 서게 된다. 반응 행(INSERT IGNORE/DELETE)은 그대로
+트랜잭션에서 쓰고, 카운터 증감만 메모리의 샤드별 누산기에 모았다가 주기적으로 한꺼번에 반영한다.
+
+- 샤드는 대상이 아니라 요청 스레드 기준으로 고른다. 하나의 게시물에 몰리는 동시 요청도
+  서로 다른 잠금으로 흩어지게 하기 위함이며, 조회/반영 시에만 모든 샤드를 합친다.
+- 증감은 반드시 커밋 이후에 add() 한다 (롤백된 반응이 카운터에 반영되지 않도록).
+- flush()는 대상별 합계를 "like_count = like_count + :delta" 형태로 반영하므로 여러 워커가
+  각자 반영해도 결과가 맞다. 반영에 실패하면 증감을 다시 버퍼에 넣는다.
+- 프로세스가 비정상 종료되면 마지막 반영 이후의 증감은 사라질 수 있으며,
+  POST /admin/reconciliation/post-reactions (관리자)로 보정한다.
+"""
+import itertools
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import bindparam
+
+from backend import models
+from backend.core.config import settings
+from backend.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+_COUNTER_MODELS = {
+    "post": models.Post,
+    "comment": models.Comment,
+}
+
+
+class _Shard:
+    __slots__ = ("lock", "deltas")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.deltas: Dict[Tuple[str, int], list] = {}
+
+
+class ReactionCounterBuffer:
+    def __init__(self, shards: int, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._shards = [_Shard() for _ in range(shards)]
+        self._local = threading.local()
+        self._next_shard = itertools.count()
+        self._flush_lock = threading.Lock()
+        # 반영 중인 증감 (커밋 전까지 pending에 포함)
+        # 샤드 -> _inflight 이동과 _inflight 비우기는 _state_lock 아래에서 한 번에 수행하고, pending()도 같은 잠금으로
+        # 읽어 증감이 샤드와 _inflight 어느 쪽에도 없거나 양쪽에 다 있는 순간을 보지 않게 한다 (잠금 순서: _state_lock -> 샤드)
+        self._state_lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, int], list] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushes = 0
+        self.flushed_rows = 0
+
+    def _shard(self) -> _Shard:
+        # 스레드마다 샤드를 돌아가며 배정 (스레드 id는 정렬된 주소라 나머지 연산으로는 고르게 흩어지지 않음)
+        index = getattr(self._local, "shard", None)
+        if index is None:
+            index = self._local.shard = next(self._next_shard) % len(self._shards)
+        return self._shards[index]
+
+    def add(self, target_type: str, target_id: int, likes: int = 0, dislikes: int = 0) -> None:
+        if not likes and not dislikes:
+            return
+        shard = self._shard()
+        with shard.lock:
+            delta = shard.deltas.get((target_type, target_id))
+            if delta is None:
+                shard.deltas[(target_type, target_id)] = [likes, dislikes]
+            else:
+                delta[0] += likes
+                delta[1] += dislikes
+
+    def pending(self, target_type: str, target_id: int) -> Tuple[int, int]:
+        """
+        아직 반영되지 않은 (좋아요, 싫어요) 증감 합계
+        """
+        likes = dislikes = 0
+        key = (target_type, target_id)
+        with self._state_lock:
+            for shard in self._shards:
+                with shard.lock:
+                    delta = shard.deltas.get(key)
+                    if delta is not None:
+                        likes += delta[0]
+                        dislikes += delta[1]
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                likes += inflight[0]
+                dislikes += inflight[1]
+        return likes, dislikes
+
+    def _drain(self) -> Dict[Tuple[str, int], list]:
+        """
+        _state_lock을 잡은 상태에서 호출 - 모든 샤드의 증감을 비우고 대상별로 합쳐 반환
+        """
+        merged: Dict[Tuple[str, int], list] = {}
+        for shard in self._shards:
+            with shard.lock:
+                deltas, shard.deltas = shard.deltas, {}
+            for key, (likes, dislikes) in deltas.items():
+                total = merged.setdefault(key, [0, 0])
+                total[0] += likes
+                total[1] += dislikes
+        return merged
+
+    def flush(self) -> int:
+        """
+        모인 증감을 대상 종류별 UPDATE 한 번(executemany)으로 반영. 반영한 대상 수 반환
+        """
+        with self._flush_lock:
+            with self._state_lock:
+                merged = self._inflight = self._drain()
+            if not merged:
+                return 0
+            db = SessionLocal()
+            try:
+                for target_type, model in _COUNTER_MODELS.items():
+                    rows = [
+                        {"target_id": target_id, "likes": likes, "dislikes": dislikes}
+                        for (kind, target_id), (likes, dislikes) in merged.items()
+                        if kind == target_type and (likes or dislikes)
+                    ]
+                    if not rows:
+                        continue
+                    table = model.__table__
+                    db.execute(
+                        table.update().where(table.c.id == bindparam("target_id")).values(
+                            like_count=table.c.like_count + bindparam("likes"),
+                            dislike_count=table.c.dislike_count + bindparam("dislikes"),
+                        ),
+                        rows
+                    )
+                db.commit()
+                # 반영된 증감은 이제 DB 값에 포함됨
+                with self._state_lock:
+                    self._inflight = {}
+            except Exception:
+                db.rollback()
+                # 반영 실패 시 다음 주기에 다시 시도 (버퍼로 되돌리는 것과 _inflight 비우기를 한 번에)
+                with self._state_lock:
+                    for (target_type, target_id), (likes, dislikes) in merged.items():
+                        self.add(target_type, target_id, likes, dislikes)
+                    self._inflight = {}
+                raise
+            finally:
+                db.close()
+            self.flushes += 1
+            self.flushed_rows += len(merged)
+            return len(merged)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush reaction counters")
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="reaction-counter-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        pending = 0
+        for shard in self._shards:
+            with shard.lock:
+                pending += len(shard.deltas)
+        return {
+            "shards": len(self._shards),
+            "pendingTargets": pending,
+            "flushes": self.flushes,
+            "flushedTargets": self.flushed_rows,
+        }
+
+
+# 워커 프로세스 전역 버퍼
+reaction_counter_buffer = ReactionCounterBuffer(
+    shards=settings.REACTION_COUNTER_SHARDS,
+    flush_interval=settings.REACTION_COUNTER_FLUSH_SECONDS,
+)
@@ -0,0 +1,159 @@
+# 신고 처리 대기열 유지 유틸리티
+"""
+대기 중(pending) 신고가 있는 게시물/댓글마다 moderation_queue 한 행을 유지한다.
+대기열 조회(GET /reports/queue)는 이 테이블을 (priority, last_reported_at, id) 인덱스로 읽기만 하므로
+신고가 쌓여도 reports 전체를 GROUP BY 하지 않는다.
+
+- 신고 추가: enqueue_report() - 대상 행의 수치를 증분 UPDATE (없으면 INSERT IGNORE, 경합 시 UPDATE 재시도)
+- 신고 처리(상태 변경): refresh_queue() - 영향을 받은 대상만 대기 신고로 다시 계산, 대기 신고가 없으면 삭제
+- priority = 대기 중인 신고마다 신고자 가중치의 합
+  신고는 신고자/대상마다 하나라 신고 수와 신고자 수는 항상 같으므로, 신고자의 처리 이력으로 가중치를 준다.
+  가중치 = REPORTER_BASE_WEIGHT + 승인된 과거 신고 수 - 거부된 과거 신고 수 (REPORTER_MIN_WEIGHT ~ REPORTER_MAX_WEIGHT)
+  즉 신뢰할 만한 신고자 여러 명이 신고한 대상이 앞에 오고, 거부가 잦은 신고자의 신고는 적게 반영된다.
+  가중치는 신고가 대기열에 반영될 때(신고 추가/대상 재계산) 시점의 이력으로 계산한다.
+  처리 이력은 신고자별 카운터(reporter_stats)로 유지하며, 신고 상태가 바뀌는 경로(단건/일괄 처리)에서
+  record_reporter_outcomes()로 증분 갱신하고 가중치는 기본 키 조회로 읽는다.
+- 점수가 같으면 최근 신고 순 (last_reported_at)
+"""
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Tuple, Union
+
+from sqlalchemy import bindparam, func
+from sqlalchemy.orm import Session
+
+from backend import models
+
+# 신고자 가중치 (처리 이력이 없는 신고자 = 기본값)
+REPORTER_BASE_WEIGHT = 2
+REPORTER_MIN_WEIGHT = 1
+REPORTER_MAX_WEIGHT = 5
+
+_queue = models.ModerationQueueEntry.__table__
+_stats = models.ReporterStat.__table__
+
+
+def _columns(target_type: str):
+    if target_type == "post":
+        return _queue.c.post_id, models.Report.post_id
+    return _queue.c.comment_id, models.Report.comment_id
+
+
+def reporter_weights(db: Session, reporter_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    신고자별 가중치 - 신고자 카운터(reporter_stats)를 기본 키로 조회
+    """
+    reporter_ids = set(reporter_ids)
+    weights = {reporter_id: REPORTER_BASE_WEIGHT for reporter_id in reporter_ids}
+    if not reporter_ids:
+        return weights
+    rows = db.query(
+        models.ReporterStat.user_id, models.ReporterStat.upheld_count, models.ReporterStat.rejected_count
+    ).filter(models.ReporterStat.user_id.in_(reporter_ids)).all()
+    for reporter_id, upheld, rejected in rows:
+        weight = REPORTER_BASE_WEIGHT + upheld - rejected
+        weights[reporter_id] = min(max(weight, REPORTER_MIN_WEIGHT), REPORTER_MAX_WEIGHT)
+    return weights
+
+
+def record_reporter_outcomes(db: Session, changes: Iterable[Tuple[int, str]], status: str) -> None:
+    """
+    신고 상태 변경을 신고자 카운터에 반영 (커밋은 호출자가 수행)
+    changes: (신고자 id, 이전 상태) 목록, status: 바뀐 상태 - 카운터 행 보장 후 신고자별 증감 (각각 executemany 한 번)
+    """
+    upheld = Counter()
+    rejected = Counter()
+    for reporter_id, previous in changes:
+        upheld[reporter_id] += (status == "reviewed") - (previous == "reviewed")
+        rejected[reporter_id] += (status == "rejected") - (previous == "rejected")
+    reporter_ids = [reporter_id for reporter_id in upheld if upheld[reporter_id] or rejected[reporter_id]]
+    if not reporter_ids:
+        return
+
+    statement = _stats.insert().prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+    db.execute(statement, [
+        {"user_id": reporter_id, "upheld_count": 0, "rejected_count": 0}
+        for reporter_id in reporter_ids
+    ])
+    db.execute(
+        _stats.update().where(_stats.c.user_id == bindparam("reporter_id")).values(
+            upheld_count=_stats.c.upheld_count + bindparam("upheld"),
+            rejected_count=_stats.c.rejected_count + bindparam("rejected"),
+        ),
+        [
+            {"reporter_id": reporter_id, "upheld": upheld[reporter_id], "rejected": rejected[reporter_id]}
+            for reporter_id in reporter_ids
+        ]
+    )
+
+
+def enqueue_report(db: Session, target: Union[models.Post, models.Comment], reporter_id: int) -> None:
+    """
+    새 신고를 대기열에 반영 (커밋은 호출자가 수행)
+    신고는 신고자/대상마다 하나이므로 새 대기 신고는 항상 새로운 신고자
+    """
+    target_type = "post" if isinstance(target, models.Post) else "comment"
+    queue_column, _ = _columns(target_type)
+    weight = reporter_weights(db, [reporter_id])[reporter_id]
+
+    update = _queue.update().where(queue_column == target.id).values(
+        pending_count=_queue.c.pending_count + 1,
+        reporter_count=_queue.c.reporter_count + 1,
+        priority=_queue.c.priority + weight,
+        last_reported_at=func.now(),
+    )
+    if db.execute(update).rowcount:
+        return
+    statement = _queue.insert().prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+    inserted = db.execute(statement.values({
+        queue_column: target.id,
+        _queue.c.pending_count: 1,
+        _queue.c.reporter_count: 1,
+        _queue.c.priority: weight,
+        _queue.c.first_reported_at: func.now(),
+        _queue.c.last_reported_at: func.now(),
+    })).rowcount
+    if not inserted:
+        # 동시에 다른 요청이 행을 만든 경우
+        db.execute(update)
+
+
+def refresh_queue(db: Session, reports: Iterable[models.Report]) -> None:
+    """
+    신고들의 대상에 대한 대기열 행을 대기 중인 신고 기준으로 다시 계산 (상태 변경 후 호출, 커밋은 호출자가 수행)
+    """
+    targets = {"post": set(), "comment": set()}
+    for report in reports:
+        if report.post_id:
+            targets["post"].add(report.post_id)
+        elif report.comment_id:
+            targets["comment"].add(report.comment_id)
+
+    for target_type, target_ids in targets.items():
+        if not target_ids:
+            continue
+        queue_column, report_column = _columns(target_type)
+        rows = db.query(
+            report_column, models.Report.reporter_id, models.Report.created_at
+        ).filter(
+            report_column.in_(target_ids),
+            models.Report.status == "pending"
+        ).all()
+        weights = reporter_weights(db, {reporter_id for _, reporter_id, _ in rows})
+
+        pending = defaultdict(list)
+        for target_id, reporter_id, created_at in rows:
+            pending[target_id].append((reporter_id, created_at))
+
+        db.execute(_queue.delete().where(queue_column.in_(target_ids)))
+        if pending:
+            db.execute(_queue.insert(), [
+                {
+                    queue_column.name: target_id,
+                    "pending_count": len(target_reports),
+                    "reporter_count": len({reporter_id for reporter_id, _ in target_reports}),
+                    "priority": sum(weights[reporter_id] for reporter_id, _ in target_reports),
+                    "first_reported_at": min(created_at for _, created_at in target_reports),
+                    "last_reported_at": max(created_at for _, created_at in target_reports),
+                }
+                for target_id, target_reports in pending.items()
+            ])
@@ -0,0 +1,147 @@
+# 알림 쓰기 유틸리티
+"""
+알림 생성/읽음/삭제와 사용자의 비정규화 읽지 않은 알림 수(users.unread_notification_count) 갱신을 처리한다.
+
+- 알림 행을 만들거나 읽지 않은 알림을 읽음/삭제할 때는 반드시 이 모듈을 거쳐 같은 트랜잭션에서 카운터를 조정한다.
+- 헤더 배지 조회(GET /notifications/unread-count)는 인증 시 읽은 사용자 행의 값만 돌려준다 (COUNT 없음).
+- 카운터 갱신은 users.updated_at(프로필 수정 시각)을 바꾸지 않는다.
+- 커밋은 호출자가 수행한다.
+
+실시간 전달 (GET /api/notifications/stream, GET /api/notifications/poll)
+- 사용자별 토픽으로 이벤트를 발행한다. 구독자가 있는 사용자의 이벤트만 세션(db.info)에 모아 두었다가
+  커밋된 뒤에 발행하고, 롤백되면 버린다 (호출자는 따로 발행할 필요 없음).
+- notification: 새 알림 (type, content, related_id)
+- notifications_read: 읽음 처리 (ids 또는 all = true)
+- notification_deleted: 알림 삭제 (id)
+"""
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import bindparam, event
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.core.pubsub import hub
+
+_users = models.User.__table__
+_notifications = models.Notification.__table__
+
+# 커밋 후 발행할 이벤트를 모아 두는 세션 info 키
+_PENDING_EVENTS_KEY = "notification_events"
+
+
+def notification_topic(user_id: int) -> str:
+    return f"user:{user_id}:notifications"
+
+
+def _queue_event(db: Session, user_id: int, name: str, data: Dict[str, Any]) -> None:
+    if hub.has_subscribers(notification_topic(user_id)):
+        db.info.setdefault(_PENDING_EVENTS_KEY, []).append((user_id, name, data))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    for user_id, name, data in session.info.pop(_PENDING_EVENTS_KEY, ()):
+        hub.publish(notification_topic(user_id), name, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop(_PENDING_EVENTS_KEY, None)
+
+
+def adjust_unread_counts(db: Session, deltas: Dict[int, int]) -> None:
+    """
+    사용자별 읽지 않은 알림 수를 delta만큼 조정 - UPDATE 한 번(executemany)
+    """
+    rows = [{"target_id": user_id, "delta": delta} for user_id, delta in deltas.items() if delta]
+    if not rows:
+        return
+    db.execute(
+        _users.update().where(_users.c.id == bindparam("target_id")).values(
+            unread_notification_count=_users.c.unread_notification_count + bindparam("delta"),
+            updated_at=_users.c.updated_at
+        ),
+        rows
+    )
+
+
+def create_notification(
+    db: Session,
+    user_id: int,
+    type: str,
+    content: str,
+    related_id: Optional[int] = None,
+) -> models.Notification:
+    """
+    알림 한 건 생성 + 받는 사용자의 읽지 않은 알림 수 증가
+    """
+    notification = models.Notification(
+        user_id=user_id,
+        type=type,
+        content=content,
+        related_id=related_id,
+        is_read=False
+    )
+    db.add(notification)
+    adjust_unread_counts(db, {user_id: 1})
+    _queue_event(db, user_id, "notification", {"type": type, "content": content, "related_id": related_id})
+    return notification
+
+
+def create_notifications(db: Session, rows: Iterable[Dict[str, Any]]) -> None:
+    """
+    여러 알림을 다중 행 INSERT 한 번으로 생성 + 사용자별 읽지 않은 알림 수 증가
+    rows: user_id, type, content, related_id 키를 가진 dict
+    """
+    rows: List[Dict[str, Any]] = [{"related_id": None, **row, "is_read": False} for row in rows]
+    if not rows:
+        return
+    db.execute(_notifications.insert(), rows)
+    adjust_unread_counts(db, Counter(row["user_id"] for row in rows))
+    for row in rows:
+        _queue_event(db, row["user_id"], "notification", {
+            "type": row["type"], "content": row["content"], "related_id": row["related_id"]
+        })
+
+
+def mark_notification_read(db: Session, notification: models.Notification) -> bool:
+    """
+    알림을 읽음으로 표시 - 이번에 읽음으로 바뀐 경우에만 카운터 감소 (동시 요청에도 한 번만). 변경 여부 반환
+    """
+    changed = db.query(models.Notification).filter(
+        models.Notification.id == notification.id,
+        models.Notification.is_read == False
+    ).update({models.Notification.is_read: True}, synchronize_session=False)
+    if changed:
+        adjust_unread_counts(db, {notification.user_id: -1})
+        _queue_event(db, notification.user_id, "notifications_read", {"ids": [notification.id]})
+    return bool(changed)
+
+
+def mark_all_notifications_read(db: Session, user_id: int) -> int:
+    """
+    사용자의 읽지 않은 알림을 모두 읽음으로 표시 (UPDATE 한 번) - 읽음 처리된 알림 수 반환
+    """
+    updated = db.query(models.Notification).filter(
+        models.Notification.user_id == user_id,
+        models.Notification.is_read == False
+    ).update({models.Notification.is_read: True}, synchronize_session=False)
+    adjust_unread_counts(db, {user_id: -updated})
+    if updated:
+        _queue_event(db, user_id, "notifications_read", {"all": True})
+    return updated
+
+
+def remove_notification(db: Session, notification: models.Notification) -> None:
+    """
+    알림 삭제 - 읽지 않은 알림이었다면 카운터 감소 (동시에 읽음 처리되어도 한 번만)
+    """
+    query = db.query(models.Notification).filter(models.Notification.id == notification.id)
+    if query.filter(models.Notification.is_read == False).delete(synchronize_session=False):
+        adjust_unread_counts(db, {notification.user_id: -1})
+    else:
+        query.delete(synchronize_session=False)
+    _queue_event(db, notification.user_id, "notification_deleted", {"id": notification.id})
+    # 삭제된 행을 커밋 후 다시 읽지 않도록 세션에서 분리 (응답에는 읽어 둔 값 사용)
+    db.expunge(notification)
@@ -1 +1,75 @@
-# 페이지네이션 유틸리티
\ No newline at end of file
+# 커서 기반(keyset) 페이지네이션 유틸리티
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    정렬 키 값들을 불투명한(opaque) 커서 문자열로 인코딩
+    """
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    """
+    커서 문자열을 정렬 키 값 목록으로 디코딩 (잘못된 커서는 400)
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeEncodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def cursor_datetime(value: Any) -> datetime:
+    """
+    커서에 담긴 ISO 형식 문자열을 datetime으로 변환
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def cursor_int(value: Any) -> int:
+    """
+    커서에 담긴 정수 값 검증 (정수가 아니면 400)
+    """
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return value
+
+
+def cursor_str(value: Any) -> str:
+    """
+    커서에 담긴 문자열 값 검증 (문자열이 아니면 400)
+    """
+    if not isinstance(value, str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return value
+
+
+def keyset_predicate(columns: Sequence[Any], values: Sequence[Any], descending: bool = True):
+    """
+    (c1, c2, ...) < (v1, v2, ...) 형태의 keyset 조건을 인덱스 범위 스캔이 가능한 OR 조건으로 생성
+    descending=False이면 > 방향 조건을 생성
+    """
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        prefix = [columns[j] == values[j] for j in range(i)]
+        edge = column < value if descending else column > value
+        clauses.append(and_(*prefix, edge) if prefix else edge)
+    return or_(*clauses)
@@ -0,0 +1,327 @@
+# 게시물/댓글별 반응 비트맵 인덱스
+"""
+"이 사용자가 이 게시물/댓글에 좋아요했는가"는 게시물 상세와 댓글 목록마다 반복되는 조회다.
+기본 경로는 (user_id, 대상 id) 유니크 인덱스를 타는 사용자 한정 IN 쿼리다 (utils.reactions.read_viewer_reactions).
+REACTION_BITMAP_ENABLED=true면 선택적 캐시로, 대상마다 좋아요/싫어요를 누른 사용자 id 집합을
+압축 비트맵(Roaring 방식)으로 워커 메모리에 두고 한 페이지의 liked_by_me/disliked_by_me를 메모리에서 답한다.
+
+- RoaringBitmap: 사용자 id의 상위 16비트로 묶음(컨테이너)을 나누고, 묶음 안의 하위 16비트를
+  원소가 적으면 정렬된 uint16 배열(원소당 2바이트), 4096개를 넘으면 8KB 비트맵으로 저장한다.
+- 인덱스는 처음 조회될 때 대상별로 한 번의 IN 쿼리로 읽어 들이고(지연 로딩), 대상 수 기준 LRU + TTL로 유지한다.
+- 반응 쓰기는 커밋 후 apply()로 이미 올라와 있는 비트맵만 갱신한다 (utils.reactions.commit_reaction).
+- 로딩은 요청 세션에서 읽는다 (연결을 하나 더 잡지 않음). 반영된 쓰기마다 순번을 매기고 세션의 트랜잭션이
+  시작될 때의 순번을 기록해, 트랜잭션 시작 이후 쓰기가 반영된 대상은 읽은 결과를 저장하지 않는다
+  (REPEATABLE READ 스냅샷에 빠졌을 수 있음). 대상별 마지막 쓰기 순번은 최근 max_targets개만 두고,
+  그보다 오래된 기록이 밀려난 뒤 시작된 트랜잭션이 아니면 저장하지 않는 쪽으로 판단한다.
+- 다른 워커의 쓰기는 전달되지 않으므로 TTL이 워커 간 최대 지연 시간이 된다 (본인 반응도 TTL 동안 늦을 수 있어
+  단일 워커 배포에서만 켜는 것을 권장).
+"""
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.core.config import settings
+from backend.models.reaction import REACTION_TYPES_BY_VALUE
+
+# 세션 트랜잭션이 시작될 때의 쓰기 순번 (Session.info 키)
+_BEGIN_SEQ_KEY = "reaction_bitmap_begin_seq"
+
+# 배열 컨테이너의 최대 원소 수 (이를 넘으면 8KB 비트맵이 더 작음)
+ARRAY_CONTAINER_LIMIT = 4096
+BITMAP_CONTAINER_BYTES = 1 << 13
+
+
+class _BitmapContainer:
+    __slots__ = ("bits", "cardinality")
+
+    def __init__(self, values: Iterable[int] = ()):
+        bits = self.bits = bytearray(BITMAP_CONTAINER_BYTES)
+        for low in values:
+            bits[low >> 3] |= 1 << (low & 7)
+        self.cardinality = sum(byte.bit_count() for byte in bits)
+
+    def __contains__(self, low: int) -> bool:
+        return bool(self.bits[low >> 3] & (1 << (low & 7)))
+
+    def add(self, low: int) -> bool:
+        mask = 1 << (low & 7)
+        if self.bits[low >> 3] & mask:
+            return False
+        self.bits[low >> 3] |= mask
+        self.cardinality += 1
+        return True
+
+    def discard(self, low: int) -> bool:
+        mask = 1 << (low & 7)
+        if not self.bits[low >> 3] & mask:
+            return False
+        self.bits[low >> 3] &= ~mask
+        self.cardinality -= 1
+        return True
+
+    def to_array(self) -> array:
+        return array("H", (
+            (index << 3) | bit
+            for index, byte in enumerate(self.bits) if byte
+            for bit in range(8) if byte & (1 << bit)
+        ))
+
+
+class RoaringBitmap:
+    """
+    음이 아닌 32비트 정수 집합 (사용자 id)
+    """
+    __slots__ = ("_containers", "_size")
+
+    def __init__(self):
+        self._containers: Dict[int, Any] = {}
+        self._size = 0
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int]) -> "RoaringBitmap":
+        bitmap = cls()
+        groups: Dict[int, List[int]] = {}
+        for value in values:
+            groups.setdefault(value >> 16, []).append(value & 0xFFFF)
+        for high, lows in groups.items():
+            lows = sorted(set(lows))
+            if len(lows) > ARRAY_CONTAINER_LIMIT:
+                bitmap._containers[high] = _BitmapContainer(lows)
+            else:
+                bitmap._containers[high] = array("H", lows)
+            bitmap._size += len(lows)
+        return bitmap
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, value: int) -> bool:
+        container = self._containers.get(value >> 16)
+        if container is None:
+            return False
+        low = value & 0xFFFF
+        if isinstance(container, _BitmapContainer):
+            return low in container
+        index = bisect_left(container, low)
+        return index < len(container) and container[index] == low
+
+    def add(self, value: int) -> bool:
+        high, low = value >> 16, value & 0xFFFF
+        container = self._containers.get(high)
+        if container is None:
+            self._containers[high] = array("H", (low,))
+        elif isinstance(container, _BitmapContainer):
+            if not container.add(low):
+                return False
+        else:
+            index = bisect_left(container, low)
+            if index < len(container) and container[index] == low:
+                return False
+            container.insert(index, low)
+            if len(container) > ARRAY_CONTAINER_LIMIT:
+                self._containers[high] = _BitmapContainer(container)
+        self._size += 1
+        return True
+
+    def discard(self, value: int) -> bool:
+        high, low = value >> 16, value & 0xFFFF
+        container = self._containers.get(high)
+        if container is None:
+            return False
+        if isinstance(container, _BitmapContainer):
+            if not container.discard(low):
+                return False
+            if container.cardinality <= ARRAY_CONTAINER_LIMIT:
+                self._containers[high] = container.to_array()
+        else:
+            index = bisect_left(container, low)
+            if index >= len(container) or container[index] != low:
+                return False
+            del container[index]
+            if not container:
+                del self._containers[high]
+        self._size -= 1
+        return True
+
+    def nbytes(self) -> int:
+        """
+        비트맵이 차지하는 대략적인 메모리 (바이트)
+        """
+        total = sys.getsizeof(self._containers)
+        for container in self._containers.values():
+            if isinstance(container, _BitmapContainer):
+                total += sys.getsizeof(container) + sys.getsizeof(container.bits)
+            else:
+                total += sys.getsizeof(container)
+        return total
+
+
+class _TargetReactions:
+    __slots__ = ("expires_at", "likes", "dislikes")
+
+    def __init__(self, expires_at: float, likes: RoaringBitmap, dislikes: RoaringBitmap):
+        self.expires_at = expires_at
+        self.likes = likes
+        self.dislikes = dislikes
+
+
+class ReactionBitmapIndex:
+    def __init__(self, max_targets: int, ttl_seconds: float):
+        self.max_targets = max_targets
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, int], _TargetReactions]" = OrderedDict()
+        # 반영된 쓰기 순번, 최근 쓰기가 있었던 대상별 마지막 순번 (최대 max_targets개)
+        # 밀려난 기록 중 가장 큰 순번은 _write_floor로 남김
+        self.write_seq = 0
+        self._writes: "OrderedDict[Tuple[str, int], int]" = OrderedDict()
+        self._write_floor = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lookup(self, keys: List[Tuple[str, int]]) -> Dict[Tuple[str, int], _TargetReactions]:
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None or entry.expires_at < now:
+                    if entry is not None:
+                        del self._entries[key]
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                found[key] = entry
+        return found
+
+    def _load(self, db: Session, target_type: str, target_ids: List[int]) -> Dict[Tuple[str, int], _TargetReactions]:
+        """
+        대상들의 반응을 요청 세션에서 한 번의 IN 쿼리로 읽어 비트맵을 만들고 저장
+        """
+        column = models.Reaction.post_id if target_type == "post" else models.Reaction.comment_id
+        rows = db.query(column, models.Reaction.user_id, models.Reaction.value).filter(
+            column.in_(target_ids)
+        ).all()
+        # 쿼리로 트랜잭션이 시작되었으므로 시작 시점 순번이 기록되어 있음
+        begin_seq = db.info.get(_BEGIN_SEQ_KEY, -1)
+
+        users: Dict[int, Tuple[List[int], List[int]]] = {target_id: ([], []) for target_id in target_ids}
+        for target_id, user_id, value in rows:
+            likes, dislikes = users[target_id]
+            (likes if REACTION_TYPES_BY_VALUE[value] == "like" else dislikes).append(user_id)
+
+        expires_at = time.monotonic() + self.ttl_seconds
+        loaded = {
+            (target_type, target_id): _TargetReactions(
+                expires_at, RoaringBitmap.from_iterable(likes), RoaringBitmap.from_iterable(dislikes)
+            )
+            for target_id, (likes, dislikes) in users.items()
+        }
+        with self._lock:
+            for key, entry in loaded.items():
+                # 트랜잭션 시작 이후 쓰기가 반영된 대상은 스냅샷에 빠졌을 수 있으므로 저장하지 않음 (이번 응답에만 사용)
+                if self._writes.get(key, self._write_floor) > begin_seq:
+                    continue
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_targets:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return loaded
+
+    def viewer_reactions(
+        self, db: Session, target_type: str, target_ids: Iterable[int], user_id: int
+    ) -> Dict[int, Optional[str]]:
+        """
+        여러 대상에 대한 사용자의 반응 ("like", "dislike" 또는 None)
+        메모리에 없는 대상만 요청 세션에서 읽어 들임
+        """
+        target_ids = list(dict.fromkeys(target_ids))
+        if not target_ids:
+            return {}
+        keys = [(target_type, target_id) for target_id in target_ids]
+        entries = self._lookup(keys)
+        missing = [target_id for target_id in target_ids if (target_type, target_id) not in entries]
+        if missing:
+            entries.update(self._load(db, target_type, missing))
+
+        result = {}
+        for key in keys:
+            entry = entries[key]
+            if user_id in entry.likes:
+                result[key[1]] = "like"
+            elif user_id in entry.dislikes:
+                result[key[1]] = "dislike"
+            else:
+                result[key[1]] = None
+        return result
+
+    def apply(self, target_type: str, target_id: int, user_id: int, likes: int = 0, dislikes: int = 0) -> None:
+        """
+        커밋된 반응 변경(증감)을 메모리에 있는 비트맵에 반영
+        """
+        if not likes and not dislikes:
+            return
+        key = (target_type, target_id)
+        with self._lock:
+            self.write_seq += 1
+            self._writes[key] = self.write_seq
+            self._writes.move_to_end(key)
+            while len(self._writes) > self.max_targets:
+                _, seq = self._writes.popitem(last=False)
+                self._write_floor = max(self._write_floor, seq)
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            for bitmap, delta in ((entry.likes, likes), (entry.dislikes, dislikes)):
+                if delta > 0:
+                    bitmap.add(user_id)
+                elif delta < 0:
+                    bitmap.discard(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            # 진행 중인 로딩 결과도 버려지도록 이후 시작된 트랜잭션의 로딩만 저장
+            self.write_seq += 1
+            self._writes.clear()
+            self._write_floor = self.write_seq
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            reactions = sum(len(entry.likes) + len(entry.dislikes) for entry in self._entries.values())
+            nbytes = sum(entry.likes.nbytes() + entry.dislikes.nbytes() for entry in self._entries.values())
+            return {
+                "targets": len(self._entries),
+                "reactions": reactions,
+                "bytes": nbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "maxTargets": self.max_targets,
+                "ttlSeconds": self.ttl_seconds,
+            }
+
+
+# 워커 프로세스 전역 인덱스
+reaction_bitmap_index = ReactionBitmapIndex(
+    max_targets=settings.REACTION_BITMAP_MAX_TARGETS,
+    ttl_seconds=settings.REACTION_BITMAP_TTL_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_begin")
+def _record_begin_seq(session: Session, transaction, connection) -> None:
+    session.info[_BEGIN_SEQ_KEY] = reaction_bitmap_index.write_seq
@@ -0,0 +1,179 @@
+# 반응(좋아요/싫어요) 쓰기 유틸리티
+"""
+반응 행 변경과 대상(게시물/댓글)의 비정규화 카운터 갱신을 처리한다.
+
+반응은 사용자/대상마다 한 행이며 value(좋아요 +1, 싫어요 -1)로 구분한다.
+유니크 키 (user_id, post_id) / (user_id, comment_id) 를 이용해 존재 여부를 미리 읽지 않고,
+상태 전이마다 그 한 행에 대한 조건부 쓰기 한 번으로 처리한다.
+- 전환: UPDATE ... SET value = :v WHERE value = -:v -> 바뀐 행 수(0/1)
+- 추가: INSERT IGNORE -> 추가된 행 수(0/1) (동시 중복 요청은 유니크 키에서 걸러짐)
+- 취소: DELETE ... WHERE value = :v -> 삭제된 행 수(0/1)
+영향 받은 행 수가 곧 카운터 증감이므로 더블 클릭 같은 동시 요청에도 IntegrityError나 카운터 이중 반영이 생기지 않는다.
+(MySQL에는 RETURNING이 없고 CLIENT_FOUND_ROWS 때문에 ON DUPLICATE KEY UPDATE의 행 수로는
+ 추가/전환/변화 없음을 구분할 수 없어, 한 문장짜리 upsert 대신 조건부 쓰기를 쓴다.)
+
+카운터 증감은 commit_reaction()에서 반영한다. 게시물 카운터는 인기 게시물의 행 잠금 경합을 피하기 위해
+커밋 이후 쓰기 병합 버퍼(utils.counter_buffer)에 모았다가 주기적으로 반영한다
+(REACTION_COUNTER_BUFFERING=false면 댓글처럼 같은 트랜잭션에서 바로 반영).
+"""
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.core.config import settings
+from backend.models.reaction import REACTION_VALUES, REACTION_TYPES_BY_VALUE
+from backend.utils.counter_buffer import reaction_counter_buffer
+from backend.utils.reaction_bitmaps import reaction_bitmap_index
+
+REACTION_TYPES = tuple(REACTION_VALUES)
+
+_reactions = models.Reaction.__table__
+
+
+def _target(target_type: str):
+    if target_type == "post":
+        return models.Post, _reactions.c.post_id
+    if target_type == "comment":
+        return models.Comment, _reactions.c.comment_id
+    raise ValueError(f"Unknown reaction target: {target_type}")
+
+
+def insert_reaction(db: Session, user_id: int, target_type: str, target_id: int, reaction_type: str) -> int:
+    """
+    반응 추가 (대상에 이미 반응이 있으면 무시). 추가된 행 수 반환
+    """
+    _, column = _target(target_type)
+    statement = _reactions.insert().prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+    return db.execute(statement.values({
+        _reactions.c.user_id: user_id,
+        column: target_id,
+        _reactions.c.value: REACTION_VALUES[reaction_type],
+    })).rowcount
+
+
+def switch_reaction(db: Session, user_id: int, target_type: str, target_id: int, reaction_type: str) -> int:
+    """
+    반대 반응을 reaction_type으로 전환. 전환된 행 수 반환
+    """
+    _, column = _target(target_type)
+    value = REACTION_VALUES[reaction_type]
+    return db.execute(_reactions.update().where(
+        _reactions.c.user_id == user_id,
+        column == target_id,
+        _reactions.c.value == -value
+    ).values(value=value)).rowcount
+
+
+def delete_reaction(db: Session, user_id: int, target_type: str, target_id: int, reaction_type: str) -> int:
+    """
+    반응 삭제. 삭제된 행 수 반환
+    """
+    _, column = _target(target_type)
+    return db.execute(_reactions.delete().where(
+        _reactions.c.user_id == user_id,
+        column == target_id,
+        _reactions.c.value == REACTION_VALUES[reaction_type]
+    )).rowcount
+
+
+def read_viewer_reactions(
+    db: Session, target_type: str, target_ids: Iterable[int], user_id: int
+) -> Dict[int, Optional[str]]:
+    """
+    여러 대상에 대한 사용자의 반응 ("like", "dislike" 또는 None)
+    (user_id, 대상 id) 유니크 인덱스를 타는 IN 쿼리 한 번 (REACTION_BITMAP_ENABLED면 비트맵 캐시에서 조회)
+    """
+    target_ids = list(dict.fromkeys(target_ids))
+    if not target_ids:
+        return {}
+    if settings.REACTION_BITMAP_ENABLED:
+        return reaction_bitmap_index.viewer_reactions(db, target_type, target_ids, user_id)
+    _, column = _target(target_type)
+    reactions = dict.fromkeys(target_ids)
+    rows = db.execute(
+        _reactions.select().with_only_columns(column, _reactions.c.value).where(
+            _reactions.c.user_id == user_id,
+            column.in_(target_ids)
+        )
+    ).all()
+    reactions.update((target_id, REACTION_TYPES_BY_VALUE[value]) for target_id, value in rows)
+    return reactions
+
+
+def bump_reaction_counts(db: Session, target_type: str, target_id: int, likes: int = 0, dislikes: int = 0) -> None:
+    """
+    대상의 비정규화된 좋아요/싫어요 수를 원자적으로 증감
+    """
+    if not likes and not dislikes:
+        return
+    model, _ = _target(target_type)
+    db.query(model).filter(model.id == target_id).update(
+        {
+            model.like_count: model.like_count + likes,
+            model.dislike_count: model.dislike_count + dislikes,
+        },
+        synchronize_session=False
+    )
+
+
+def _is_buffered(target_type: str) -> bool:
+    return target_type == "post" and settings.REACTION_COUNTER_BUFFERING
+
+
+def read_reaction_counts(db: Session, target_type: str, target_id: int) -> Tuple[int, int]:
+    """
+    대상의 (좋아요 수, 싫어요 수) - 카운터 컬럼을 기본키로 읽고 아직 반영되지 않은 버퍼 증감을 더함 (COUNT 집계 없음)
+    """
+    model, _ = _target(target_type)
+    like_count, dislike_count = db.query(model.like_count, model.dislike_count).filter(model.id == target_id).one()
+    pending_likes, pending_dislikes = reaction_counter_buffer.pending(target_type, target_id)
+    return like_count + pending_likes, dislike_count + pending_dislikes
+
+
+def set_reaction(
+    db: Session, user_id: int, target_type: str, target_id: int, reaction_type: Optional[str]
+) -> Tuple[int, int]:
+    """
+    사용자의 반응 행을 reaction_type("like", "dislike" 또는 None)으로 맞추고
+    (좋아요 증감, 싫어요 증감)을 반환 - 카운터 반영은 commit_reaction()에서
+    """
+    deltas = {"like": 0, "dislike": 0}
+    if reaction_type is None:
+        for other in REACTION_TYPES:
+            if delete_reaction(db, user_id, target_type, target_id, other):
+                deltas[other] -= 1
+                break
+        return deltas["like"], deltas["dislike"]
+
+    opposite = "dislike" if reaction_type == "like" else "like"
+    # 반대 반응 -> 전환, 반응 없음 -> 추가, 같은 반응 -> 변화 없음
+    # 추가가 무시됐는데 그 사이 다른 요청이 반대 반응을 넣었을 수 있으므로 전환을 한 번 더 시도
+    switched = switch_reaction(db, user_id, target_type, target_id, reaction_type)
+    if not switched:
+        if insert_reaction(db, user_id, target_type, target_id, reaction_type):
+            deltas[reaction_type] += 1
+        else:
+            switched = switch_reaction(db, user_id, target_type, target_id, reaction_type)
+    if switched:
+        deltas[reaction_type] += 1
+        deltas[opposite] -= 1
+    return deltas["like"], deltas["dislike"]
+
+
+def commit_reaction(
+    db: Session, target_type: str, target_id: int, likes: int = 0, dislikes: int = 0, user_id: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    반응 쓰기 트랜잭션을 카운터 증감과 함께 커밋하고 대상의 최신 (좋아요 수, 싫어요 수)를 반환
+    user_id를 넘기면 커밋 후 반응 비트맵 인덱스에도 반영 (REACTION_BITMAP_ENABLED일 때)
+    """
+    buffered = _is_buffered(target_type)
+    if not buffered:
+        bump_reaction_counts(db, target_type, target_id, likes=likes, dislikes=dislikes)
+    db.commit()
+    if buffered:
+        reaction_counter_buffer.add(target_type, target_id, likes=likes, dislikes=dislikes)
+    if user_id is not None and settings.REACTION_BITMAP_ENABLED:
+        reaction_bitmap_index.apply(target_type, target_id, user_id, likes=likes, dislikes=dislikes)
+    return read_reaction_counts(db, target_type, target_id)
@@ -0,0 +1,84 @@
+# 비정규화 카운터 정합성 검사 유틸리티
+from typing import List
+
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.models.reaction import REACTION_VALUES
+
+
+def _reaction_target(target_type: str):
+    if target_type == "post":
+        return models.Post, models.Reaction.post_id
+    return models.Comment, models.Reaction.comment_id
+
+
+def _reaction_totals(db: Session, target_type: str):
+    """
+    reactions 테이블 기준 대상별 실제 좋아요/싫어요 수 (서브쿼리)
+    """
+    _, column = _reaction_target(target_type)
+    return db.query(
+        column.label("target_id"),
+        func.sum(case((models.Reaction.value == REACTION_VALUES["like"], 1), else_=0)).label("likes"),
+        func.sum(case((models.Reaction.value == REACTION_VALUES["dislike"], 1), else_=0)).label("dislikes"),
+    ).filter(
+        column.isnot(None)
+    ).group_by(column).subquery()
+
+
+def find_reaction_drift(db: Session, target_type: str, limit: int = 100) -> List[dict]:
+    """
+    게시물/댓글의 like_count/dislike_count 가 reactions 집계와 다른 대상 목록
+    """
+    model, _ = _reaction_target(target_type)
+    totals = _reaction_totals(db, target_type)
+    likes = func.coalesce(totals.c.likes, 0)
+    dislikes = func.coalesce(totals.c.dislikes, 0)
+    rows = db.query(
+        model.id,
+        model.like_count,
+        model.dislike_count,
+        likes,
+        dislikes,
+    ).outerjoin(
+        totals, totals.c.target_id == model.id
+    ).filter(
+        or_(model.like_count != likes, model.dislike_count != dislikes)
+    ).order_by(model.id).limit(limit).all()
+
+    return [
+        {
+            f"{target_type}_id": target_id,
+            "like_count": like_count,
+            "dislike_count": dislike_count,
+            "actual_like_count": int(actual_likes),
+            "actual_dislike_count": int(actual_dislikes),
+        }
+        for target_id, like_count, dislike_count, actual_likes, actual_dislikes in rows
+    ]
+
+
+def repair_reaction_counts(db: Session, target_type: str, target_ids: List[int]) -> int:
+    """
+    지정한 게시물/댓글의 카운터를 reactions 기준으로 다시 계산 (커밋은 호출자가 수행)
+    """
+    if not target_ids:
+        return 0
+    model, column = _reaction_target(target_type)
+
+    def actual(reaction_type: str):
+        return select(func.count(models.Reaction.id)).where(
+            column == model.id,
+            models.Reaction.value == REACTION_VALUES[reaction_type]
+        ).scalar_subquery()
+
+    return db.query(model).filter(model.id.in_(target_ids)).update(
+        {
+            model.like_count: actual("like"),
+            model.dislike_count: actual("dislike"),
+        },
+        synchronize_session=False
+    )
+
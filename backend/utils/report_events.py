@@ -0,0 +1,61 @@
+# 신고 실시간 알림 유틸리티
+"""
+신고가 접수되거나 처리되면 커밋 이후에 호출한다.
+중재자 토픽으로 실시간 이벤트 발행 (GET /api/reports/stream 구독자에게 전달)
+
+이벤트 종류
+- report_created: 새 신고 (신고 id, 대상, 사유, 현재 신고 수 등 요약만 전달)
+  이번 신고로 자동 숨김 임계값에 도달했으면 high_priority = true
+  (utils.reports.file_report가 대상 행을 잠그고 신고 수 UPDATE가 실제로 숨김으로 바꿨는지 판단한 값)
+- reports_reviewed: 신고 상태 변경 (신고 id 목록 + 바뀐 상태)
+
+관리자 설정 report.notifyAdminOnReport / notification.notifyAdminOnHighPriorityReport로
+일반/높은 우선순위 신고 이벤트를 각각 끌 수 있다.
+구독자가 없으면 설정 조회나 추가 조회 없이 바로 반환한다.
+"""
+from typing import Iterable, Union
+
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.core.pubsub import hub
+from backend.core.site_settings import site_settings
+
+MODERATION_TOPIC = "moderation:reports"
+
+NOTIFY_ON_REPORT_KEY = "report.notifyAdminOnReport"
+NOTIFY_ON_HIGH_PRIORITY_KEY = "notification.notifyAdminOnHighPriorityReport"
+
+
+def publish_report_created(
+    db: Session,
+    report: models.Report,
+    target: Union[models.Post, models.Comment],
+    high_priority: bool = False,
+) -> None:
+    if not hub.has_subscribers(MODERATION_TOPIC):
+        return
+    key = NOTIFY_ON_HIGH_PRIORITY_KEY if high_priority else NOTIFY_ON_REPORT_KEY
+    if not site_settings.get(db, key):
+        return
+
+    is_post = isinstance(target, models.Post)
+    hub.publish(MODERATION_TOPIC, "report_created", {
+        "id": report.id,
+        "target_type": "post" if is_post else "comment",
+        "target_id": target.id,
+        "post_id": target.id if is_post else target.post_id,
+        "reporter_id": report.reporter_id,
+        "reason": report.reason,
+        "report_count": target.report_count,
+        "is_hidden": target.is_hidden,
+        "high_priority": high_priority,
+        "created_at": report.created_at.isoformat() if report.created_at else None,
+    })
+
+
+def publish_reports_reviewed(report_ids: Iterable[int], status: str) -> None:
+    report_ids = list(report_ids)
+    if not report_ids:
+        return
+    hub.publish(MODERATION_TOPIC, "reports_reviewed", {"ids": report_ids, "status": status})
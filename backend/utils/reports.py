@@ -0,0 +1,155 @@
+# 신고 쓰기 유틸리티
+"""
+신고 추가/상태 변경과 대상(게시물/댓글)의 비정규화 신고 수(report_count) 갱신을 처리한다.
+
+- 신고는 신고자/대상마다 하나 (유니크 키 (reporter_id, post_id) / (reporter_id, comment_id))
+- report_count는 거부(rejected)되지 않은 신고 수이며, 신고 추가와 같은 트랜잭션에서 증가하고
+  거부될 때 감소한다 (거부가 취소되면 다시 증가).
+- 자동 숨김은 신고 수 증가 UPDATE 한 문장에서 함께 판단한다.
+  SET 절에서 is_hidden을 report_count보다 먼저 두어 MySQL(왼쪽부터 평가)과 표준 SQL 모두
+  "증가 전 값 + 1 >= 임계값"으로 계산되며, 동시 신고에도 행 잠금 아래에서 정확하다.
+  이번 신고로 숨겨졌는지는 UPDATE 전에 대상 행을 잠그고(SELECT ... FOR UPDATE) 읽은 값으로 판단한다.
+- 임계값은 관리자 설정 캐시(core.site_settings)의 report.autoHideThreshold (0 이하면 자동 숨김 안 함).
+- 대기 중인 신고가 바뀌면 처리 대기열(utils.moderation_queue)도 같은 트랜잭션에서 갱신한다.
+  승인/거부 여부가 바뀌면 신고자 카운터(대기열 가중치용)도 같은 트랜잭션에서 갱신한다.
+- 승인(reviewed) 여부가 바뀌면 작성자 자동 제재 카운터(utils.sanctions)도 같은 트랜잭션에서 갱신한다.
+"""
+from collections import Counter
+from typing import Iterable, Optional, Tuple, Union
+
+from sqlalchemy import bindparam, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.core.site_settings import site_settings
+from backend.utils.moderation_queue import enqueue_report, refresh_queue, record_reporter_outcomes
+from backend.utils.sanctions import record_upheld_reports
+
+AUTO_HIDE_THRESHOLD_KEY = "report.autoHideThreshold"
+
+_reports = models.Report.__table__
+
+
+def _is_duplicate_key(error: IntegrityError) -> bool:
+    """
+    유니크 키 위반인지 (MySQL 1062 Duplicate entry / SQLite UNIQUE constraint failed)
+    """
+    args = getattr(error.orig, "args", ())
+    if args and args[0] == 1062:
+        return True
+    return "UNIQUE constraint failed" in str(error.orig)
+
+
+def _report_target(report: models.Report):
+    if report.post_id:
+        return models.Post, report.post_id
+    return models.Comment, report.comment_id
+
+
+def file_report(
+    db: Session,
+    reporter_id: int,
+    target: Union[models.Post, models.Comment],
+    reason: str,
+    description: Optional[str] = None,
+) -> Tuple[Optional[models.Report], bool]:
+    """
+    신고를 추가하고 대상의 신고 수를 증가시켜 커밋 (임계값에 도달하면 같은 UPDATE에서 숨김)
+    (신고, 이번 신고로 숨겨졌는지) 반환 - 이미 같은 대상을 신고했으면 (None, False)
+    """
+    threshold = site_settings.get_int(db, AUTO_HIDE_THRESHOLD_KEY)
+    auto_hide = threshold is not None and threshold > 0
+
+    # 유니크 키 (reporter_id, 대상) 위반이면 이미 신고함 (미리 조회하지 않음, 동시 요청에도 한 건만 추가)
+    # INSERT IGNORE는 외래 키 위반/값 잘림까지 경고로 바꾸므로 쓰지 않고, 중복 키 오류만 골라서 처리
+    target_column = _reports.c.post_id if isinstance(target, models.Post) else _reports.c.comment_id
+    try:
+        with db.begin_nested():
+            result = db.execute(_reports.insert().values({
+                _reports.c.reporter_id: reporter_id,
+                target_column: target.id,
+                _reports.c.reason: reason,
+                _reports.c.description: description,
+                _reports.c.status: "pending",
+            }))
+    except IntegrityError as e:
+        if not _is_duplicate_key(e):
+            raise
+        db.rollback()
+        return None, False
+    report_id = result.inserted_primary_key[0]
+
+    # 처리 대기열 반영
+    enqueue_report(db, target, reporter_id)
+
+    table = target.__table__
+    # 대상 행을 먼저 잠그고 현재 값을 읽음 - 이후 UPDATE가 바꾸는 값과 같은 행 상태이므로
+    # 숨김 여부(이벤트 발행, 스레드 캐시 무효화용)를 이번 UPDATE가 실제로 바꾼 결과로 판단할 수 있음
+    was_hidden, report_count = db.execute(
+        table.select().with_only_columns(table.c.is_hidden, table.c.report_count)
+        .where(table.c.id == target.id).with_for_update()
+    ).one()
+    values = []
+    if auto_hide:
+        values.append((table.c.is_hidden, case((table.c.report_count + 1 >= threshold, True), else_=table.c.is_hidden)))
+    values.append((table.c.report_count, table.c.report_count + 1))
+    db.execute(table.update().where(table.c.id == target.id).ordered_values(*values))
+
+    hidden = auto_hide and not was_hidden and report_count + 1 >= threshold
+
+    db.commit()
+    return db.get(models.Report, report_id), hidden
+
+
+def change_report_status(db: Session, report: models.Report, status: str, reviewer_id: Optional[int]) -> bool:
+    """
+    신고 상태를 바꾸고 거부 여부가 바뀌면 대상의 신고 수를 조정 (커밋은 호출자가 수행)
+    동시에 같은 신고를 처리해도 신고 수가 한 번만 바뀌도록 이전 상태를 조건으로 갱신. 변경 여부 반환
+    """
+    previous = report.status
+    changed = db.query(models.Report).filter(
+        models.Report.id == report.id,
+        models.Report.status == previous
+    ).update({models.Report.status: status, models.Report.reviewed_by: reviewer_id})
+    if not changed:
+        return False
+
+    was_counted = previous != "rejected"
+    counted = status != "rejected"
+    if was_counted != counted:
+        model, target_id = _report_target(report)
+        db.query(model).filter(model.id == target_id).update(
+            {model.report_count: model.report_count + (1 if counted else -1)},
+            synchronize_session=False
+        )
+    if previous != status and "pending" in (previous, status):
+        refresh_queue(db, [report])
+    record_reporter_outcomes(db, [(report.reporter_id, previous)], status)
+    was_upheld = previous == "reviewed"
+    upheld = status == "reviewed"
+    if was_upheld != upheld:
+        record_upheld_reports(db, [report], 1 if upheld else -1)
+    return True
+
+
+def adjust_report_counts(db: Session, reports: Iterable[models.Report], delta: int) -> None:
+    """
+    여러 신고의 대상별 신고 수를 delta만큼 조정 - 대상 종류마다 UPDATE 한 번(executemany) (커밋은 호출자가 수행)
+    """
+    counts = Counter(_report_target(report) for report in reports)
+    for model in (models.Post, models.Comment):
+        rows = [
+            {"target_id": target_id, "delta": delta * count}
+            for (target_model, target_id), count in counts.items()
+            if target_model is model
+        ]
+        if not rows:
+            continue
+        table = model.__table__
+        db.execute(
+            table.update().where(table.c.id == bindparam("target_id")).values(
+                report_count=table.c.report_count + bindparam("delta")
+            ),
+            rows
+        )
@@ -0,0 +1,174 @@
+# 게시물 수정 이력 저장 유틸리티
+"""
+게시물 리비전은 주기적인 전체 스냅샷과, 그 사이의 압축된 줄 단위 diff로 저장한다.
+
+- 리비전 1, 1 + SNAPSHOT_INTERVAL, 1 + 2 * SNAPSHOT_INTERVAL ... 은 전체 스냅샷
+- 그 외 리비전은 직전 리비전 대비 diff
+
+따라서 임의의 리비전은 가장 가까운 이전 스냅샷에서 최대 SNAPSHOT_INTERVAL - 1번의
+diff 적용으로 복원된다.
+"""
+import difflib
+import json
+import zlib
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend import models
+
+# 스냅샷 간격 (이 값 - 1 이 복원 시 최대 diff 적용 횟수)
+SNAPSHOT_INTERVAL = 10
+
+
+def diff_lines(old: str, new: str) -> List[list]:
+    """
+    old -> new 변환을 줄 단위 연산 목록으로 생성
+    ["=", n]: n줄 유지 / ["-", n]: n줄 삭제 / ["+", [줄, ...]]: 줄 삽입
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["=", i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(["-", i2 - i1])
+        if j2 > j1:
+            ops.append(["+", new_lines[j1:j2]])
+    return ops
+
+
+def apply_diff(old: str, ops: List[list]) -> str:
+    """
+    diff_lines로 만든 연산 목록을 old에 적용
+    """
+    old_lines = old.splitlines(keepends=True)
+    result = []
+    position = 0
+    for op, arg in ops:
+        if op == "=":
+            result.extend(old_lines[position:position + arg])
+            position += arg
+        elif op == "-":
+            position += arg
+        else:
+            result.extend(arg)
+    return "".join(result)
+
+
+def pack(payload: dict) -> bytes:
+    return zlib.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 9)
+
+
+def unpack(data: bytes) -> dict:
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def is_snapshot_revision(revision: int) -> bool:
+    return (revision - 1) % SNAPSHOT_INTERVAL == 0
+
+
+def encode_revision(
+    revision: int, previous: Optional[Tuple[str, str]], current: Tuple[str, str]
+) -> Tuple[bool, bytes]:
+    """
+    (title, content) 리비전을 저장 형식으로 인코딩
+    반환: (스냅샷 여부, 압축 데이터)
+    """
+    title, content = current
+    if previous is None or is_snapshot_revision(revision):
+        return True, pack({"title": title, "content": content})
+    previous_title, previous_content = previous
+    return False, pack({
+        "title": title if title != previous_title else None,
+        "ops": diff_lines(previous_content, content),
+    })
+
+
+def replay(chain: Iterable[Tuple[bool, bytes]]) -> Iterator[Tuple[str, str]]:
+    """
+    스냅샷으로 시작하는 (스냅샷 여부, 데이터) 목록을 순서대로 복원하며 (title, content)를 반환
+    """
+    title, content = None, None
+    for is_snapshot, data in chain:
+        payload = unpack(data)
+        if is_snapshot:
+            title, content = payload["title"], payload["content"]
+        else:
+            if content is None:
+                raise ValueError("Revision chain must start with a snapshot")
+            if payload["title"] is not None:
+                title = payload["title"]
+            content = apply_diff(content, payload["ops"])
+        yield title, content
+
+
+def record_post_revision(
+    db: Session,
+    post: models.Post,
+    editor_id: Optional[int],
+    previous: Optional[Tuple[str, str]] = None,
+) -> Optional[models.PostRevision]:
+    """
+    게시물의 현재 제목/본문을 새 리비전으로 추가 (커밋은 호출자가 수행)
+    previous: 수정 직전의 (title, content). 생성 시에는 None
+
+    수정 시 호출자는 게시물 행을 잠금 읽기(SELECT ... FOR UPDATE)로 가져와야 한다.
+    같은 게시물의 동시 수정이 직렬화되어 previous가 최신 리비전과 일치하고 리비전 번호가 겹치지 않는다.
+    """
+    current = (post.title, post.content)
+    if previous is not None and previous == current:
+        return None
+
+    # 트랜잭션 스냅샷이 아닌 최신 리비전 번호를 읽도록 잠금 읽기 사용
+    latest = db.query(models.PostRevision.revision).filter(
+        models.PostRevision.post_id == post.id
+    ).order_by(models.PostRevision.revision.desc()).limit(1).with_for_update().scalar() or 0
+
+    # 이력 기능 도입 이전에 작성된 게시물은 수정 직전 상태를 첫 스냅샷으로 남김
+    if latest == 0 and previous is not None:
+        is_snapshot, data = encode_revision(1, None, previous)
+        db.add(models.PostRevision(
+            post_id=post.id,
+            revision=1,
+            is_snapshot=is_snapshot,
+            data=data,
+            editor_id=post.user_id
+        ))
+        latest = 1
+
+    revision = latest + 1
+    is_snapshot, data = encode_revision(revision, previous, current)
+    post_revision = models.PostRevision(
+        post_id=post.id,
+        revision=revision,
+        is_snapshot=is_snapshot,
+        data=data,
+        editor_id=editor_id
+    )
+    db.add(post_revision)
+    return post_revision
+
+
+def load_post_revision(db: Session, post_id: int, revision: int) -> Optional[Tuple[models.PostRevision, str, str]]:
+    """
+    특정 리비전을 가장 가까운 이전 스냅샷부터 복원 (최대 SNAPSHOT_INTERVAL - 1번의 diff 적용)
+    """
+    snapshot = revision - (revision - 1) % SNAPSHOT_INTERVAL
+    rows = db.query(models.PostRevision).filter(
+        models.PostRevision.post_id == post_id,
+        models.PostRevision.revision >= snapshot,
+        models.PostRevision.revision <= revision
+    ).order_by(models.PostRevision.revision).all()
+
+    if not rows or rows[-1].revision != revision:
+        return None
+
+    title, content = None, None
+    for title, content in replay((row.is_snapshot, row.data) for row in rows):
+        pass
+    return rows[-1], title, content
+
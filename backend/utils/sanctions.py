@@ -0,0 +1,165 @@
+# 자동 제재 유틸리티
+"""
+신고가 승인(reviewed)되거나 승인이 취소될 때 작성자별 카운터(sanction_counters)를 증분 갱신하고,
+관리자 설정 report.enableAutoSanction이 켜져 있으면 임계값에 도달한 작성자를 자동으로 정지한다.
+
+- 카운터는 고정 길이 창(tumbling window, report.autoSanctionWindowDays일) 단위로 센다.
+  창이 지난 행은 다음 갱신 때 같은 UPDATE 안에서 0부터 다시 시작한다 (reports 테이블은 다시 세지 않음).
+- 카운터는 신고 건수가 아니라 승인된 신고가 있는 서로 다른 대상(게시물/댓글) 수를 센다.
+  한 대상에 신고가 여러 건 승인되어도 처음 승인될 때 한 번만 더하고, 승인된 신고가 하나도 남지 않을 때 뺀다.
+  (상태 UPDATE 이후에 호출되어야 하며, 대상별 승인 신고 수를 GROUP BY 한 번으로 확인)
+- 갱신/판단 비용은 처리된 신고의 대상/작성자 수에만 비례한다 (단건 처리면 승인 신고 수 확인, 작성자 조회,
+  카운터 INSERT IGNORE + UPDATE, 임계값 확인 각 한 번).
+- 임계값(report.autoSanctionThreshold)에 도달하면 정지(기간 report.defaultSanctionPeriod일, 0 이하면 무기한),
+  제재 이력(created_by NULL = 자동), 알림(notification.notifyUserOnSanction)을 남기고 카운터를 새 창으로 초기화.
+- 관리자/중재자와 이미 정지된 사용자는 자동 제재하지 않는다.
+- 승인 취소가 창이 바뀐 뒤에 오면 새 창에서 빼며, 카운터는 0 아래로 내려가지 않는다.
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable
+
+from sqlalchemy import bindparam, case, func
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.core.site_settings import site_settings
+from backend.utils.notifications import create_notifications
+
+ENABLED_KEY = "report.enableAutoSanction"
+THRESHOLD_KEY = "report.autoSanctionThreshold"
+WINDOW_DAYS_KEY = "report.autoSanctionWindowDays"
+PERIOD_DAYS_KEY = "report.defaultSanctionPeriod"
+NOTIFY_USER_KEY = "notification.notifyUserOnSanction"
+
+_counters = models.SanctionCounter.__table__
+
+
+def _report_authors(db: Session, reports: Iterable[models.Report], delta: int) -> Counter:
+    """
+    승인 여부가 바뀐 대상(게시물/댓글) 작성자별 대상 수 - 대상 종류마다 GROUP BY 쿼리와 IN 쿼리 한 번씩
+    delta > 0: 이번 신고들 외에 승인된 신고가 없던 대상 (새로 승인된 대상)
+    delta < 0: 승인된 신고가 더 이상 남지 않은 대상
+    """
+    targets = {models.Post: Counter(), models.Comment: Counter()}
+    for report in reports:
+        if report.post_id:
+            targets[models.Post][report.post_id] += 1
+        elif report.comment_id:
+            targets[models.Comment][report.comment_id] += 1
+
+    authors = Counter()
+    for model, counts in targets.items():
+        if not counts:
+            continue
+        report_column = models.Report.post_id if model is models.Post else models.Report.comment_id
+        upheld = dict(db.query(report_column, func.count(models.Report.id)).filter(
+            report_column.in_(counts),
+            models.Report.status == "reviewed"
+        ).group_by(report_column).all())
+        if delta > 0:
+            changed = [target_id for target_id, count in counts.items() if upheld.get(target_id, 0) <= count]
+        else:
+            changed = [target_id for target_id in counts if not upheld.get(target_id)]
+        if not changed:
+            continue
+        for _, user_id in db.query(model.id, model.user_id).filter(model.id.in_(changed)).all():
+            authors[user_id] += 1
+    return authors
+
+
+def record_upheld_reports(db: Session, reports: Iterable[models.Report], delta: int) -> None:
+    """
+    승인된(delta=1) / 승인이 취소된(delta=-1) 신고를 작성자 카운터에 반영하고 자동 제재 판단 (커밋은 호출자가 수행)
+    신고 상태를 바꾼 UPDATE 이후에 호출
+    """
+    authors = _report_authors(db, reports, delta)
+    if not authors:
+        return
+
+    now = datetime.utcnow()
+    window_days = site_settings.get_int(db, WINDOW_DAYS_KEY) or 0
+    cutoff = now - timedelta(days=max(window_days, 1))
+
+    # 카운터 행 보장 후 작성자별 증감 (각각 executemany 한 번)
+    statement = _counters.insert().prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+    db.execute(statement, [
+        {"user_id": user_id, "upheld_count": 0, "window_start": now}
+        for user_id in authors
+    ])
+    # 창이 지났으면 0부터 다시 셈 - SET 절은 upheld_count를 window_start보다 먼저 두어
+    # MySQL(왼쪽부터 평가)에서도 갱신 전 window_start로 판단
+    expired = _counters.c.window_start < bindparam("cutoff")
+    base = case((expired, 0), else_=_counters.c.upheld_count)
+    db.execute(
+        _counters.update().where(_counters.c.user_id == bindparam("author_id")).ordered_values(
+            (_counters.c.upheld_count, case((base + bindparam("delta") < 0, 0), else_=base + bindparam("delta"))),
+            (_counters.c.window_start, case((expired, bindparam("now")), else_=_counters.c.window_start)),
+        ),
+        [
+            {"author_id": user_id, "delta": delta * count, "cutoff": cutoff, "now": now}
+            for user_id, count in authors.items()
+        ]
+    )
+
+    if delta > 0 and site_settings.get(db, ENABLED_KEY):
+        _apply_auto_sanctions(db, authors, now)
+
+
+def _apply_auto_sanctions(db: Session, authors: Dict[int, int], now: datetime) -> None:
+    threshold = site_settings.get_int(db, THRESHOLD_KEY)
+    if threshold is None or threshold <= 0:
+        return
+
+    rows = db.query(models.SanctionCounter.user_id, models.SanctionCounter.upheld_count).filter(
+        models.SanctionCounter.user_id.in_(authors),
+        models.SanctionCounter.upheld_count >= threshold
+    ).all()
+    if not rows:
+        return
+    reached = dict(rows)
+
+    # 임계값에 도달한 작성자는 제재 여부와 관계없이 새 창에서 다시 셈
+    db.query(models.SanctionCounter).filter(
+        models.SanctionCounter.user_id.in_(reached)
+    ).update({models.SanctionCounter.upheld_count: 0, models.SanctionCounter.window_start: now},
+             synchronize_session=False)
+
+    user_ids = [user_id for (user_id,) in db.query(models.User.id).filter(
+        models.User.id.in_(reached),
+        models.User.status != "suspended",
+        models.User.role.notin_(["admin", "moderator"])
+    ).all()]
+    if not user_ids:
+        return
+
+    period = site_settings.get_int(db, PERIOD_DAYS_KEY) or 0
+    duration = period if period > 0 else None
+    suspended_until = now + timedelta(days=period) if duration else None
+
+    db.query(models.User).filter(models.User.id.in_(user_ids)).update(
+        {models.User.status: "suspended", models.User.suspended_until: suspended_until},
+        synchronize_session=False
+    )
+    db.execute(models.RestrictionHistory.__table__.insert(), [
+        {
+            "user_id": user_id,
+            "type": "suspend",
+            "reason": f"Automatic sanction: {reached[user_id]} items with upheld reports",
+            "duration": duration,
+            "suspended_until": suspended_until,
+            "created_by": None,
+        }
+        for user_id in user_ids
+    ])
+    if site_settings.get(db, NOTIFY_USER_KEY):
+        period_text = f"for {duration} days" if duration else "indefinitely"
+        create_notifications(db, [
+            {
+                "user_id": user_id,
+                "type": "admin_message",
+                "content": f"Your account has been suspended {period_text} due to repeated reports.",
+                "related_id": None,
+            }
+            for user_id in user_ids
+        ])
@@ -0,0 +1,126 @@
+# 댓글 스레드 캐시
+"""
+게시물 댓글 트리 중 사용자와 무관한 부분(구조, 내용, 작성자, 반응 수)을 워커 프로세스 메모리에 캐시한다.
+조회가 몰리는 인기 게시물의 트리를 매번 다시 조립하지 않기 위함이며, liked_by_me 등
+사용자별 상태는 요청마다 한 번의 조회로 덧씌운다.
+
+- 키: (post_id, skip, limit, include_hidden, reply_limit), LRU + TTL
+- 게시물의 댓글/반응이 바뀌면 invalidate(post_id)로 해당 게시물 항목 전체를 버린다.
+- 조회 중에 무효화가 일어나면 조회 결과를 저장하지 않는다 (무효화 순번 비교).
+  게시물별 마지막 무효화 순번은 최근 max_entries개 게시물만 LRU로 두고, 밀려난 순번 중 가장 큰 값보다
+  먼저 시작된 조회는 무효화 여부를 알 수 없으므로 저장하지 않는다 (추적 상태가 게시물 수만큼 커지지 않음).
+- 다른 워커의 무효화는 전달되지 않으므로 TTL이 워커 간 최대 지연 시간이 된다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from backend.core.config import settings
+
+
+class CommentThreadCache:
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._keys_by_post: Dict[int, set] = {}
+        # 무효화 순번, 게시물별 마지막 무효화 순번 (최대 max_entries개), 밀려난 순번 중 가장 큰 값
+        self._sequence = 0
+        self._invalidated: "OrderedDict[int, int]" = OrderedDict()
+        self._floor = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def generation(self, post_id: int) -> int:
+        """
+        조회 시작 전에 받아 두었다가 set()에 넘김
+        """
+        with self._lock:
+            return self._sequence
+
+    def get(self, post_id: int, key: Hashable) -> Optional[Any]:
+        full_key = (post_id, key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    self._remove(full_key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(full_key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, post_id: int, key: Hashable, value: Any, generation: int) -> None:
+        full_key = (post_id, key)
+        with self._lock:
+            # 조회하는 동안 무효화되었다면 오래된 결과이므로 저장하지 않음
+            if self._invalidated.get(post_id, self._floor) > generation:
+                return
+            self._entries[full_key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(full_key)
+            self._keys_by_post.setdefault(post_id, set()).add(full_key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, post_id: int) -> None:
+        with self._lock:
+            self._sequence += 1
+            self._invalidated[post_id] = self._sequence
+            self._invalidated.move_to_end(post_id)
+            while len(self._invalidated) > self.max_entries:
+                _, sequence = self._invalidated.popitem(last=False)
+                self._floor = max(self._floor, sequence)
+            for full_key in self._keys_by_post.pop(post_id, set()):
+                self._entries.pop(full_key, None)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sequence += 1
+            self._invalidated.clear()
+            self._floor = self._sequence
+            self._entries.clear()
+            self._keys_by_post.clear()
+            self.invalidations += 1
+
+    def _remove(self, full_key: Tuple) -> None:
+        self._entries.pop(full_key, None)
+        keys = self._keys_by_post.get(full_key[0])
+        if keys is not None:
+            keys.discard(full_key)
+            if not keys:
+                del self._keys_by_post[full_key[0]]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "posts": len(self._keys_by_post),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "maxEntries": self.max_entries,
+                "ttlSeconds": self.ttl_seconds,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.invalidations = self.evictions = 0
+
+
+# 워커 프로세스 전역 캐시
+comment_thread_cache = CommentThreadCache(
+    max_entries=settings.COMMENT_THREAD_CACHE_SIZE,
+    ttl_seconds=settings.COMMENT_THREAD_CACHE_TTL_SECONDS,
+)
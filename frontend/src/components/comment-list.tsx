@@ -1,5 +1,7 @@
 "use client"
 
+import { useState } from "react"
+import { Button } from "@/components/ui/button"
 import CommentItem from "./comment-item"
 import type { CommentWithReplies, CommentWithUser } from "@/lib/types/comment"
 import type { ID } from "@/lib/types/common"
@@ -11,6 +13,7 @@ interface CommentListProps {
   onLike: (commentId: ID) => Promise<void>
   onDislike: (commentId: ID) => Promise<void>
   onReply: (commentId: ID, content: string) => Promise<void>
+  onLoadMoreReplies: (commentId: ID) => Promise<void>
   onEdit: (commentId: ID, content: string) => Promise<void>
   onDelete: (commentId: ID) => Promise<void>
   onReport: (commentId: ID) => void
@@ -23,6 +26,7 @@ export default function CommentList({
   onLike,
   onDislike,
   onReply,
+  onLoadMoreReplies,
   onEdit,
   onDelete,
   onReport
@@ -30,6 +34,18 @@ export default function CommentList({
   // 댓글 작성자인지 확인하는 함수 - CommentWithUser 타입으로 변경
   const isCommentAuthor = (comment: CommentWithUser) => currentUserId === comment.user_id
 
+  // 답글을 더 불러오는 중인 댓글 ID
+  const [loadingRepliesFor, setLoadingRepliesFor] = useState<ID | null>(null)
+
+  const handleLoadMoreReplies = async (commentId: ID) => {
+    setLoadingRepliesFor(commentId)
+    try {
+      await onLoadMoreReplies(commentId)
+    } finally {
+      setLoadingRepliesFor(null)
+    }
+  }
+
   // 최상위 댓글만 필터링 (parent_id가 null인 댓글)
   const topLevelComments = comments.filter((comment) => comment.parent_id === null)
 
@@ -77,6 +93,23 @@ export default function CommentList({
               ))}
             </div>
           )}
+
+          {/* 미리보기 이후 남은 답글 더 보기 */}
+          {comment.next_reply_cursor && (
+            <div className="ml-8">
+              <Button
+                variant="ghost"
+                size="sm"
+                className="text-muted-foreground"
+                disabled={loadingRepliesFor === comment.id}
+                onClick={() => handleLoadMoreReplies(comment.id)}
+              >
+                {loadingRepliesFor === comment.id
+                  ? "불러오는 중..."
+                  : `답글 더 보기 (${Math.max(comment.reply_count - comment.replies.length, 0)}개)`}
+              </Button>
+            </div>
+          )}
         </div>
       ))}
     </div>
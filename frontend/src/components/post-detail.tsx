@@ -529,6 +529,7 @@ export default function PostDetail({ postId }: PostDetailProps) {
           if (comment.id === commentId) {
             return {
               ...comment,
+              reply_count: comment.reply_count + 1,
               replies: [...(comment.replies || []), newReply],
             }
           }
@@ -544,6 +545,39 @@ export default function PostDetail({ postId }: PostDetailProps) {
     }
   }
 
+  // 미리보기 이후의 답글 더 불러오기 (next_reply_cursor 기반)
+  const handleLoadMoreReplies = async (commentId: ID) => {
+    const comment = comments.find((c) => c.id === commentId)
+    if (!comment?.next_reply_cursor) return
+
+    try {
+      const response = await commentService.getCommentReplies(commentId, {
+        cursor: comment.next_reply_cursor,
+      })
+
+      if (!response.success || !response.data) {
+        throw new Error(response.error?.message || "답글을 불러오는데 실패했습니다.")
+      }
+
+      const page = response.data
+      setComments((prev) => {
+        return prev.map((c) => {
+          if (c.id !== commentId) return c
+          // 방금 작성해 목록에 이미 추가된 답글은 중복으로 넣지 않음
+          const loadedIds = new Set(c.replies.map((reply) => reply.id))
+          return {
+            ...c,
+            replies: [...c.replies, ...page.items.filter((reply) => !loadedIds.has(reply.id))],
+            next_reply_cursor: page.next_cursor,
+          }
+        })
+      })
+    } catch (error) {
+      console.error("Failed to load replies:", error)
+      toast.error(error instanceof Error ? error.message : "답글을 불러오는데 실패했습니다.")
+    }
+  }
+
   // 댓글 삭제
   const handleDeleteComment = async (commentId: ID) => {
     try {
@@ -802,6 +836,7 @@ export default function PostDetail({ postId }: PostDetailProps) {
               onLike={handleCommentLike}
               onDislike={handleCommentDislike}
               onReply={handleSubmitReply}
+              onLoadMoreReplies={handleLoadMoreReplies}
               onEdit={handleSubmitEditComment}
               onDelete={handleDeleteComment}
               onReport={handleReportComment}
@@ -255,6 +255,7 @@ export class AdminService {
                 post_id: 0,
                 parent_id: null,
                 is_hidden: false,
+                reply_count: 0,
                 created_at: report.created_at,
                 updated_at: report.updated_at
               };
@@ -285,6 +286,7 @@ export class AdminService {
                 post_id: 0,
                 parent_id: null,
                 is_hidden: false,
+                reply_count: 0,
                 created_at: report.created_at,
                 updated_at: report.updated_at
               };
@@ -315,6 +317,7 @@ export class AdminService {
                 post_id: 0,
                 parent_id: null,
                 is_hidden: false,
+                reply_count: 0,
                 created_at: report.created_at,
                 updated_at: report.updated_at
               };
@@ -6,6 +6,7 @@ import type {
   Comment, 
   CommentWithUser, 
   CommentWithReplies,
+  CommentPage,
   CommentCreate, 
   CommentUpdate, 
   CommentFilter,
@@ -90,16 +91,16 @@ export class CommentService {
   // }
 
   /**
-   * 특정 댓글의 답글 목록 조회
+   * 특정 댓글의 답글 목록 조회 (작성순, 커서 기반)
    * @param commentId 댓글 ID
-   * @param params 페이지네이션 파라미터
-   * @returns 답글 목록
+   * @param params cursor: 이전 응답의 next_cursor 또는 댓글의 next_reply_cursor, limit: 페이지 크기
+   * @returns 답글 목록과 다음 페이지 커서
    */
   async getCommentReplies(
     commentId: ID,
-    params?: CommentFilter
-  ): Promise<ApiResult<CommentWithUser[]>> {
-    return await api.get<CommentWithUser[]>(`/comments/${commentId}/replies`, params);
+    params?: { cursor?: string; limit?: number }
+  ): Promise<ApiResult<CommentPage>> {
+    return await api.get<CommentPage>(`/comments/${commentId}/replies`, params);
   }
 
   /**
@@ -136,15 +137,15 @@ export class CommentService {
     limit: number = 20
   ): Promise<ApiResult<{ items: CommentWithUser[], total: number }>> {
     const skip = (page - 1) * limit;
-    const result = await api.get<CommentWithUser[]>(`/comments/user/${userId}`, { skip, limit });
+    const result = await api.get<{ items: CommentWithUser[], next_cursor: string | null }>(`/comments/user/${userId}`, { skip, limit });
     
     if (result.success && result.data) {
-      // 백엔드에서 받은 배열 데이터를 프론트엔드에서 기대하는 형식으로 변환
+      // 백엔드에서 받은 페이지 데이터를 프론트엔드에서 기대하는 형식으로 변환
       return {
         success: true,
         data: {
-          items: result.data,
-          total: result.data.length // 백엔드에서 total count를 제공하지 않으므로 임시로 설정
+          items: result.data.items,
+          total: result.data.items.length // 백엔드에서 total count를 제공하지 않으므로 임시로 설정
         }
       };
     }
@@ -29,10 +29,10 @@ export class NotificationService {
 
   /**
    * 모든 알림 읽음 표시
-   * @returns 업데이트된 알림 목록
+   * @returns 읽음 처리된 알림 수
    */
-  async markAllAsRead(): Promise<ApiResult<Notification[]>> {
-    return await api.put<Notification[]>("/notifications/read-all");
+  async markAllAsRead(): Promise<ApiResult<{ updated: number }>> {
+    return await api.put<{ updated: number }>("/notifications/read-all");
   }
 
   /**
@@ -13,6 +13,7 @@ export interface Comment {
   post_id: ID;
   parent_id: ID | null;
   is_hidden: boolean;
+  reply_count: number;
   created_at: string;
   updated_at: string;
 }
@@ -51,6 +52,15 @@ export interface CommentWithUser extends Comment {
  */
 export interface CommentWithReplies extends CommentWithUser {
   replies: CommentWithUser[];
+  next_reply_cursor?: string | null;  // 미리보기 이후 답글 조회용 커서
+}
+
+/**
+ * 커서 기반 댓글 목록 응답 (백엔드 CommentPage 스키마와 일치)
+ */
+export interface CommentPage {
+  items: CommentWithUser[];
+  next_cursor: string | null;
 }
 
 /**
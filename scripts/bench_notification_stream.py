@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+알림 스트림 유휴 연결 부하 테스트
+워커 하나(uvicorn 프로세스)에 사용자마다 알림 스트림(SSE) 또는 롱 폴링 연결을 하나씩 열어 둔 채로
+서버 프로세스의 메모리(RSS) 증가량과 연결당 메모리를 측정합니다.
+
+설정된 데이터베이스(SQLALCHEMY_DATABASE_URI)에 벤치마크용 사용자를 만들고 끝나면 삭제합니다.
+연결 수만큼 파일 디스크립터가 필요하므로 먼저 ulimit -n을 충분히 올려 주세요 (Linux의 /proc 필요).
+사용법: python scripts/bench_notification_stream.py [--connections 5000] [--hold 30] [--mode stream|poll]
+"""
+
+import argparse
+import asyncio
+import os
+import secrets
+import subprocess
+import sys
+import time
+import uuid
+
+# 서버 프로세스와 같은 키로 토큰을 만들도록 설정을 읽기 전에 지정
+os.environ.setdefault("SECRET_KEY", secrets.token_urlsafe(32))
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 현재 스크립트 경로를 기준으로 프로젝트 루트 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+sys.path.append(project_root)
+
+from backend import models
+from backend.core import security
+from backend.core.config import settings
+
+
+def create_fixtures(Session, count: int):
+    """벤치마크용 사용자를 생성합니다."""
+    tag = uuid.uuid4().hex[:8]
+    db = Session()
+    try:
+        db.execute(models.User.__table__.insert(), [
+            {
+                "username": f"bench_{tag}_{i}",
+                "email": f"bench_{tag}_{i}@example.com",
+                "password_hash": "x",
+                "role": "user",
+                "status": "active",
+            }
+            for i in range(count)
+        ])
+        user_ids = [user_id for (user_id,) in db.query(models.User.id).filter(
+            models.User.username.like(f"bench_{tag}_%")
+        ).all()]
+        db.commit()
+        return tag, user_ids
+    finally:
+        db.close()
+
+
+def delete_fixtures(Session, tag: str):
+    db = Session()
+    try:
+        db.query(models.User).filter(models.User.username.like(f"bench_{tag}_%")).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def rss_bytes(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def start_server(port: int, connections: int) -> subprocess.Popen:
+    env = dict(os.environ)
+    env["SSE_MAX_SUBSCRIBERS"] = str(connections + 100)
+    env["PYTHONPATH"] = project_root
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=project_root, env=env
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs", timeout=1)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("server did not start")
+
+
+async def hold_stream(client: httpx.AsyncClient, url: str, token: str, ready: asyncio.Queue, stop: asyncio.Event):
+    """스트림을 열고 첫 unread_count 이벤트를 받으면 준비 완료로 알린 뒤 stop까지 유지"""
+    reported = False
+    try:
+        async with client.stream("GET", url, headers={"Authorization": f"Bearer {token}"}) as response:
+            if response.status_code == 200:
+                async for line in response.aiter_lines():
+                    if line.startswith("event: unread_count"):
+                        break
+                else:
+                    raise httpx.ReadError("stream closed")
+                reported = True
+                await ready.put(True)
+                await stop.wait()
+    except httpx.HTTPError:
+        pass
+    finally:
+        if not reported:
+            await ready.put(False)
+
+
+async def hold_poll(client: httpx.AsyncClient, url: str, token: str, ready: asyncio.Queue, stop: asyncio.Event):
+    """롱 폴링을 반복 (읽지 않은 알림 수 0을 알고 있다고 보내므로 timeout까지 대기)"""
+    await ready.put(True)
+    while not stop.is_set():
+        try:
+            await client.get(url, headers={"Authorization": f"Bearer {token}"})
+        except httpx.HTTPError:
+            await asyncio.sleep(1)
+
+
+async def run(port: int, server_pid: int, user_ids, mode: str, hold: float, batch: int):
+    base = f"http://127.0.0.1:{port}{settings.API_V1_STR}/notifications"
+    url = f"{base}/stream" if mode == "stream" else f"{base}/poll?count=0&timeout=60"
+    limits = httpx.Limits(max_connections=len(user_ids), max_keepalive_connections=len(user_ids))
+    timeout = httpx.Timeout(10.0, read=None)
+
+    baseline = rss_bytes(server_pid)
+    ready: asyncio.Queue = asyncio.Queue()
+    stop = asyncio.Event()
+    holder = hold_stream if mode == "stream" else hold_poll
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        started = time.perf_counter()
+        tasks = []
+        opened = failed = 0
+        # 한꺼번에 연결하면 accept 큐가 넘치므로 batch 단위로 연결
+        for offset in range(0, len(user_ids), batch):
+            for user_id in user_ids[offset:offset + batch]:
+                token = security.create_access_token(user_id)
+                tasks.append(asyncio.ensure_future(holder(client, url, token, ready, stop)))
+            for _ in range(len(user_ids[offset:offset + batch])):
+                if await ready.get():
+                    opened += 1
+                else:
+                    failed += 1
+        connect_time = time.perf_counter() - started
+
+        await asyncio.sleep(hold)
+        held = rss_bytes(server_pid)
+        stop.set()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    growth = held - baseline
+    per_connection = growth / opened if opened else 0
+    print(f"[{mode}] 연결 {opened:,}개 (실패 {failed:,}), 연결 {connect_time:.1f}s, {hold:.0f}s 유지")
+    print(f"  서버 RSS {baseline / 2**20:,.1f} MiB -> {held / 2**20:,.1f} MiB "
+          f"(+{growth / 2**20:,.1f} MiB, 연결당 {per_connection / 1024:,.1f} KiB)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=5000)
+    parser.add_argument("--hold", type=float, default=30)
+    parser.add_argument("--mode", choices=("stream", "poll"), default="stream")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--batch", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    tag, user_ids = create_fixtures(Session, args.connections)
+    server = start_server(args.port, args.connections)
+    try:
+        asyncio.run(run(args.port, server.pid, user_ids, args.mode, args.hold, args.batch))
+    finally:
+        server.terminate()
+        server.wait()
+        delete_fixtures(Session, tag)
+
+
+if __name__ == "__main__":
+    main()
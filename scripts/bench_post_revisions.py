@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+게시물 수정 이력 저장 방식 벤치마크
+- 저장 공간: 매 리비전 전체 사본 vs 스냅샷 + 압축 diff
+- 복원 지연: 임의 리비전 복원에 걸리는 시간 (최악: 스냅샷 직전 리비전)
+
+사용법: python scripts/bench_post_revisions.py [--revisions 200] [--lines 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# 현재 스크립트 경로를 기준으로 프로젝트 루트 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+sys.path.append(project_root)
+
+from backend.utils.revisions import SNAPSHOT_INTERVAL, encode_revision, replay
+
+
+def make_document(lines: int) -> str:
+    """공공데이터 게시물과 비슷한 긴 본문을 생성합니다."""
+    rows = []
+    for i in range(lines):
+        rows.append(f"{i:05d},기관{random.randint(1, 300)},항목{random.randint(1, 50)},{random.random():.6f}\n")
+    return "".join(rows)
+
+
+def edit_document(content: str) -> str:
+    """몇 줄을 수정/추가/삭제하는 편집을 흉내냅니다."""
+    lines = content.splitlines(keepends=True)
+    for _ in range(random.randint(1, 5)):
+        action = random.random()
+        index = random.randrange(len(lines))
+        if action < 0.6:
+            lines[index] = f"수정됨,{random.random():.6f}\n"
+        elif action < 0.8:
+            lines.insert(index, f"추가됨,{random.random():.6f}\n")
+        elif len(lines) > 1:
+            del lines[index]
+    return "".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--revisions", type=int, default=200)
+    parser.add_argument("--lines", type=int, default=2000)
+    args = parser.parse_args()
+
+    random.seed(42)
+    title = "공공데이터 현황"
+    versions = [make_document(args.lines)]
+    for _ in range(args.revisions - 1):
+        versions.append(edit_document(versions[-1]))
+
+    # 저장
+    chain = []
+    previous = None
+    for number, content in enumerate(versions, start=1):
+        chain.append(encode_revision(number, previous, (title, content)))
+        previous = (title, content)
+
+    full_bytes = sum(len((title + content).encode("utf-8")) for content in versions)
+    stored_bytes = sum(len(data) for _, data in chain)
+    snapshot_bytes = sum(len(data) for is_snapshot, data in chain if is_snapshot)
+
+    print(f"리비전 수: {len(versions)}, 본문 크기: {len(versions[0].encode('utf-8')) / 1024:.1f} KiB, 스냅샷 간격: {SNAPSHOT_INTERVAL}")
+    print(f"전체 사본 저장: {full_bytes / 1024:.1f} KiB")
+    print(f"스냅샷 + diff 저장: {stored_bytes / 1024:.1f} KiB (스냅샷 {snapshot_bytes / 1024:.1f} KiB)")
+    print(f"저장 비율: {stored_bytes / full_bytes * 100:.2f}%")
+
+    # 복원 (가장 가까운 이전 스냅샷부터 적용)
+    timings = []
+    for number in range(1, len(versions) + 1):
+        snapshot = number - (number - 1) % SNAPSHOT_INTERVAL
+        started = time.perf_counter()
+        for restored in replay(chain[snapshot - 1:number]):
+            pass
+        timings.append(time.perf_counter() - started)
+        assert restored == (title, versions[number - 1]), f"revision {number} mismatch"
+
+    timings.sort()
+    print(f"복원 지연: 평균 {sum(timings) / len(timings) * 1000:.2f} ms, "
+          f"p50 {timings[len(timings) // 2] * 1000:.2f} ms, "
+          f"p99 {timings[int(len(timings) * 0.99) - 1] * 1000:.2f} ms, "
+          f"최대 {timings[-1] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
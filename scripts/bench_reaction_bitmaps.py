@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+반응 비트맵 인덱스 메모리/조회 벤치마크
+반응 100만 건을 대상(게시물)별 사용자 id 집합으로 메모리에 올릴 때
+- roaring: backend.utils.reaction_bitmaps.RoaringBitmap
+- set: 파이썬 set[int]
+의 메모리 사용량(tracemalloc)과 한 페이지(대상 20개) liked_by_me 조회 시간을 비교합니다.
+
+DB 없이 임의로 만든 반응 분포를 사용합니다 (인기 게시물에 반응이 몰리는 멱법칙 분포).
+사용법: python scripts/bench_reaction_bitmaps.py [--reactions 1000000] [--targets 2000] [--users 500000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# 현재 스크립트 경로를 기준으로 프로젝트 루트 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+sys.path.append(project_root)
+
+from backend.utils.reaction_bitmaps import RoaringBitmap
+
+
+def generate(reactions: int, targets: int, users: int, seed: int):
+    """
+    대상별 반응 사용자 id 목록 생성 (대상 인기도는 1/rank 비례)
+    """
+    rng = random.Random(seed)
+    weights = [1 / rank for rank in range(1, targets + 1)]
+    total = sum(weights)
+    by_target = []
+    remaining = reactions
+    for index, weight in enumerate(weights):
+        count = remaining if index == targets - 1 else min(users, round(reactions * weight / total))
+        count = min(count, users, remaining)
+        by_target.append(rng.sample(range(1, users + 1), count))
+        remaining -= count
+    return by_target
+
+
+def measure(build, by_target):
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = [build(user_ids) for user_ids in by_target]
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return index, current, elapsed
+
+
+def lookup(index, pages: int, users: int, seed: int) -> float:
+    rng = random.Random(seed)
+    page_size = 20
+    started = time.perf_counter()
+    for _ in range(pages):
+        viewer = rng.randint(1, users)
+        first = rng.randrange(0, len(index) - page_size)
+        [viewer in index[target] for target in range(first, first + page_size)]
+    return (time.perf_counter() - started) / pages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reactions", type=int, default=1_000_000)
+    parser.add_argument("--targets", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=500_000)
+    parser.add_argument("--pages", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    by_target = generate(args.reactions, args.targets, args.users, args.seed)
+    total = sum(len(user_ids) for user_ids in by_target)
+    print(f"반응 {total:,}건 / 대상 {args.targets:,}개 / 사용자 {args.users:,}명 "
+          f"(최다 {len(by_target[0]):,}건, 최소 {len(by_target[-1]):,}건)")
+
+    for name, build in (("set", set), ("roaring", RoaringBitmap.from_iterable)):
+        index, nbytes, elapsed = measure(build, by_target)
+        per_million = nbytes * 1_000_000 / total
+        page = lookup(index, args.pages, args.users, args.seed)
+        print(f"[{name}] 메모리 {nbytes / 2**20:,.1f} MiB (반응 100만 건당 {per_million / 2**20:,.1f} MiB, "
+              f"건당 {nbytes / total:.1f} B), 구축 {elapsed:.2f}s, 페이지(20개) 조회 {page * 1e6:.1f} us")
+        del index
+
+
+if __name__ == "__main__":
+    main()
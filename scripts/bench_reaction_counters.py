@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+반응 카운터 경합 벤치마크
+게시물 하나에 좋아요 1,000건이 동시에 몰릴 때의 처리량/지연 비교
+- direct: 반응 행 쓰기와 같은 트랜잭션에서 posts.like_count 갱신 (행 잠금 경합)
+- buffered: 커밋 후 샤드별 메모리 누산기에 모았다가 주기적으로 한꺼번에 반영
+
+설정된 데이터베이스(SQLALCHEMY_DATABASE_URI)에 벤치마크용 사용자/게시물을 만들고 끝나면 삭제합니다.
+사용법: python scripts/bench_reaction_counters.py [--likers 1000] [--concurrency 100]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+# 현재 스크립트 경로를 기준으로 프로젝트 루트 경로 설정
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+sys.path.append(project_root)
+
+from backend import models
+from backend.core.config import settings
+from backend.models.reaction import REACTION_VALUES
+from backend.utils.counter_buffer import reaction_counter_buffer
+from backend.utils.reactions import set_reaction, commit_reaction
+
+
+def create_fixtures(Session, likers: int):
+    """벤치마크용 사용자와 게시물을 생성합니다."""
+    tag = uuid.uuid4().hex[:8]
+    db = Session()
+    try:
+        db.execute(models.User.__table__.insert(), [
+            {
+                "username": f"bench_{tag}_{i}",
+                "email": f"bench_{tag}_{i}@example.com",
+                "password_hash": "x",
+                "role": "user",
+                "status": "active",
+            }
+            for i in range(likers)
+        ])
+        user_ids = [user_id for (user_id,) in db.query(models.User.id).filter(
+            models.User.username.like(f"bench_{tag}_%")
+        ).all()]
+        db.commit()
+        return tag, user_ids
+    finally:
+        db.close()
+
+
+def create_post(Session, author_id: int) -> int:
+    db = Session()
+    try:
+        post = models.Post(title="반응 카운터 벤치마크", content="-", user_id=author_id)
+        db.add(post)
+        db.commit()
+        return post.id
+    finally:
+        db.close()
+
+
+def like(Session, user_id: int, post_id: int, start: threading.Event):
+    start.wait()
+    started = time.perf_counter()
+    db = Session()
+    try:
+        likes, dislikes = set_reaction(db, user_id, "post", post_id, "like")
+        commit_reaction(db, "post", post_id, likes=likes, dislikes=dislikes)
+    finally:
+        db.close()
+    return time.perf_counter() - started
+
+
+def run(Session, mode: str, user_ids, concurrency: int):
+    settings.REACTION_COUNTER_BUFFERING = mode == "buffered"
+    post_id = create_post(Session, user_ids[0])
+    if mode == "buffered":
+        reaction_counter_buffer.start()
+
+    start = threading.Event()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(like, Session, user_id, post_id, start) for user_id in user_ids]
+        began = time.perf_counter()
+        start.set()
+        timings = []
+        errors = 0
+        for future in futures:
+            try:
+                timings.append(future.result())
+            except Exception as e:
+                errors += 1
+                print(f"  오류: {e.__class__.__name__}: {str(e)[:120]}")
+        elapsed = time.perf_counter() - began
+
+    if mode == "buffered":
+        reaction_counter_buffer.stop()
+
+    db = Session()
+    try:
+        counter = db.query(models.Post.like_count).filter(models.Post.id == post_id).scalar()
+        actual = db.query(func.count(models.Reaction.id)).filter(
+            models.Reaction.post_id == post_id,
+            models.Reaction.value == REACTION_VALUES["like"]
+        ).scalar()
+    finally:
+        db.close()
+
+    timings.sort()
+    print(f"[{mode}] {len(user_ids)}건 / 동시 {concurrency}: {elapsed:.2f}s, {len(timings) / elapsed:.0f} req/s, "
+          f"p50 {timings[len(timings) // 2] * 1000:.1f} ms, p99 {timings[int(len(timings) * 0.99) - 1] * 1000:.1f} ms, "
+          f"오류 {errors}건, like_count {counter} / 실제 {actual}")
+    return post_id
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--likers", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--modes", default="direct,buffered")
+    args = parser.parse_args()
+
+    engine = create_engine(
+        settings.SQLALCHEMY_DATABASE_URI,
+        pool_size=args.concurrency,
+        max_overflow=0,
+        pool_pre_ping=True,
+    )
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    tag, user_ids = create_fixtures(Session, args.likers)
+    post_ids = []
+    try:
+        for mode in args.modes.split(","):
+            post_ids.append(run(Session, mode, user_ids, args.concurrency))
+    finally:
+        # 벤치마크 데이터 정리 (반응은 ON DELETE CASCADE)
+        db = Session()
+        try:
+            db.query(models.Post).filter(models.Post.id.in_(post_ids)).delete(synchronize_session=False)
+            db.query(models.User).filter(models.User.username.like(f"bench_{tag}_%")).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
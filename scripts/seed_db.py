@@ -271,8 +271,7 @@ def create_sample_reactions(db: Session, users, posts, comments):
         # 이미 존재하는 반응인지 확인
         existing_reaction = db.query(Reaction).filter(
             Reaction.user_id == reaction_data["user_id"],
-            Reaction.post_id == reaction_data["post_id"],
-            Reaction.type == reaction_data["type"]
+            Reaction.post_id == reaction_data["post_id"]
         ).first()
         
         if not existing_reaction:
@@ -285,8 +284,7 @@ def create_sample_reactions(db: Session, users, posts, comments):
         # 이미 존재하는 반응인지 확인
         existing_reaction = db.query(Reaction).filter(
             Reaction.user_id == reaction_data["user_id"],
-            Reaction.comment_id == reaction_data["comment_id"],
-            Reaction.type == reaction_data["type"]
+            Reaction.comment_id == reaction_data["comment_id"]
         ).first()
         
         if not existing_reaction: